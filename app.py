@@ -14,6 +14,7 @@ Sgtk Application for handling Quicktime generation and review submission
 
 import sgtk
 import sgtk.templatekey
+import concurrent.futures
 import os
 
 
@@ -32,6 +33,30 @@ class MultiReviewSubmissionApp(sgtk.platform.Application):
 
         app = self.import_module("tk_multi_reviewsubmission")
 
+        app.configure_tracing(
+            os.environ.get(app.TRACE_FILE_ENV_VAR) or self.get_setting("trace_file")
+        )
+
+        self.__scratch_space = app.ScratchSpace(
+            self.get_setting("scratch_locations"),
+            self.get_setting("scratch_quota") * 1024 * 1024,
+        )
+
+        self.__session_cache = app.SessionCache(self.get_setting("session_cache_ttl"))
+        self.__context_cache = app.ContextCache()
+
+        # Its threads are only started when needed, and then reused.
+        self.__background_executor = concurrent.futures.ThreadPoolExecutor(
+            thread_name_prefix="ReviewSubmissionBackground"
+        )
+
+        # Created on first use, the object storage clients being slow to create.
+        self.__storage = None
+
+        self.__upload_bandwidth = app.UploadBandwidth(
+            os.path.join(self.cache_location, "upload_bandwidth.json")
+        )
+
         display_name = self.get_setting("display_name")
 
         # Only register the command to the engine if the display name is explicitely added to the config.
@@ -53,6 +78,90 @@ class MultiReviewSubmissionApp(sgtk.platform.Application):
                 menu_caption, lambda: app.send_for_review(), menu_options
             )
 
+        if self.engine.name == "tk-shell":
+            self.engine.register_command(
+                "submit_manifest",
+                lambda *args: app.submit_manifest(*args),
+                {
+                    "short_name": "submit_manifest",
+                    "description": "Render and submit the Versions listed in a manifest",
+                },
+            )
+
+        if self.engine.name == "tk-shell" and self.get_setting(
+            "submission_daemon_port"
+        ):
+            self.engine.register_command(
+                "submission_daemon",
+                lambda: app.run_submission_daemon(),
+                {
+                    "short_name": "submission_daemon",
+                    "description": "Run the local review submission daemon",
+                },
+            )
+
+    @property
+    def scratch_space(self):
+        """
+        The :class:`~tk_multi_reviewsubmission.ScratchSpace` handing out the local paths
+        review media are rendered to before being uploaded or copied to their final location.
+        """
+        return self.__scratch_space
+
+    @property
+    def storage(self):
+        """
+        The storage backend the movies are stored to when ``store_on_disk`` is enabled,
+        as configured by the ``movie_storage`` setting: the file system, or an S3
+        compatible object storage.
+        """
+        if self.__storage is None:
+            app = self.import_module("tk_multi_reviewsubmission")
+            template = self.get_template("movie_path_template")
+            self.__storage = app.get_storage(
+                self.get_setting("movie_storage"),
+                root=template.root_path if template else None,
+                endpoint_url=self.get_setting("movie_storage_endpoint"),
+                part_size=self.get_setting("movie_storage_part_size") * 1024 * 1024,
+                concurrency=self.get_setting("movie_storage_concurrency"),
+                ensure_folder_exists=self.ensure_folder_exists,
+            )
+        return self.__storage
+
+    @property
+    def upload_bandwidth(self):
+        """
+        The :class:`~tk_multi_reviewsubmission.UploadBandwidth` recording the throughput
+        of the movie uploads of the host, to fit the movies to the ``upload_time_budget``.
+        """
+        return self.__upload_bandwidth
+
+    @property
+    def session_cache(self):
+        """
+        The :class:`~tk_multi_reviewsubmission.SessionCache` keeping the values looked up
+        on the site, like the current user, between the submissions of the session.
+        """
+        return self.__session_cache
+
+    @property
+    def context_cache(self):
+        """
+        The :class:`~tk_multi_reviewsubmission.ContextCache` keeping the values derived
+        from the current context and the settings, like the slate texts, between the
+        submissions made in that context.
+        """
+        return self.__context_cache
+
+    @property
+    def background_executor(self):
+        """
+        The :class:`concurrent.futures.ThreadPoolExecutor` running the requests to the
+        site overlapping the renders, like the creation of the Versions while their
+        media are rendered.
+        """
+        return self.__background_executor
+
     @property
     def context_change_allowed(self):
         """
@@ -60,6 +169,22 @@ class MultiReviewSubmissionApp(sgtk.platform.Application):
         """
         return True
 
+    def destroy_app(self):
+        """
+        Stop the threads of the background executor once their requests are done.
+        """
+        self.__background_executor.shutdown(wait=False)
+
+    def post_context_change(self, old_context, new_context):
+        """
+        Forget the values looked up or derived for the previous context.
+
+        :param old_context:     The context being changed away from.
+        :param new_context:     The new context.
+        """
+        self.__session_cache.invalidate()
+        self.__context_cache.invalidate()
+
     def render_and_submit_version(
         self,
         template,
@@ -105,7 +230,60 @@ class MultiReviewSubmissionApp(sgtk.platform.Application):
             comment,
             thumbnail_path,
             progress_cb,
-            color_space=None,
+            color_space,
             *args,
             **kwargs
         )
+
+    def render_and_submit_versions(
+        self,
+        items,
+        sg_publishes=None,
+        sg_task=None,
+        comment=None,
+        thumbnail_path=None,
+        progress_cb=None,
+        color_space=None,
+    ):
+        """
+        Batch entry point to be called by other applications / hooks. All the items are
+        rendered in a single pass and each of them is submitted as its own Version.
+
+        Each item is a dictionary accepting the ``template``, ``fields``, ``first_frame``,
+        ``last_frame`` and ``name`` keys, all optional, along with the engine specific
+        options of the render media hook: ``camera`` in Maya, ``document`` and
+        ``layer_comp`` in Photoshop. For example, a Maya sequencer scene can be sent for
+        review with::
+
+            app.render_and_submit_versions(
+                [
+                    {"camera": "sh010_cam", "first_frame": 1001, "last_frame": 1048, "name": "sh010"},
+                    {"camera": "sh020_cam", "first_frame": 1049, "last_frame": 1120, "name": "sh020"},
+                ],
+                sg_task=task,
+                comment="Layout pass",
+            )
+
+        :param list(dict) items: The items to render and submit.
+        :param sg_publishes:    A list of shotgun published file objects to link the publishes against.
+        :param sg_task:         A Shotgun task object to link against. Can be None.
+        :param comment:         A description to add to the Versions in Shotgun.
+        :param thumbnail_path:  The path to a thumbnail to use for the versions when the movies aren't
+                                being uploaded to Shotgun (this is set in the config)
+        :param progress_cb:     A callback to report progress with.
+        :param color_space:     The colorspace of the rendered frames
+
+        :returns:               The Version Shotgun entity dictionaries that were created.
+        :rtype:                 list(dict)
+        """
+        app = self.import_module("tk_multi_reviewsubmission")
+
+        return app.render_and_submit_versions(
+            items,
+            sg_publishes,
+            sg_task,
+            comment,
+            thumbnail_path,
+            progress_cb,
+            color_space,
+        )
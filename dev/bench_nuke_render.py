@@ -0,0 +1,239 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Benchmark of the throughput and the peak memory of the Nuke review renders across the
+``render_threads``, ``render_cache_memory`` and ``render_priority`` settings, to tune
+them for each class of workstation.
+
+Each combination of the given settings renders the Write node of a Nuke script the way
+the tk-nuke render media hook does when the settings are set: in a ``nuke -t`` process
+running ``resources/nuke_render.py``, started with ``-m`` and ``-c`` at the given
+priority. The script is typically a review render group copied from a session, with
+its Read node pointing to representative plates.
+
+The benchmark reports, for each combination, the frames rendered per second and the
+peak resident memory of the render process, the median of the repeated runs. Running
+it while the workstation is in its usual use, e.g. with a Nuke session open, shows the
+impact of the priority.
+
+Usage::
+
+    python dev/bench_nuke_render.py /usr/local/Nuke15.0v4/Nuke15.0 review.nk Write1 \\
+        1001 1100 --threads 0 4 8 --cache-memory 0 4096 --priority 0 10 \\
+        --repeat 3 --report nuke_render.json
+
+The peak memory is only measured on the platforms providing ``os.wait4``.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python")
+)
+
+import tk_multi_reviewsubmission  # noqa: E402
+
+RENDER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "resources", "nuke_render.py"
+)
+
+# Prefix of the lines printed by the render script for each frame rendered.
+FRAME_PREFIX = "tk-multi-reviewsubmission-frame"
+
+
+def render(options, threads, cache_memory, priority, work_folder):
+    """
+    Render the Write node of the script with the given settings.
+
+    :param options:         The parsed command line options.
+    :param int threads:     Number of render threads, the Nuke default when 0.
+    :param int cache_memory: Cache memory in megabytes, the Nuke default when 0.
+    :param int priority:    Niceness of the render process.
+    :param str work_folder: Folder to write the job and the rendered media to.
+
+    :returns:               The number of frames rendered, the duration of the render
+                            and its peak memory in bytes, None if unknown.
+    :rtype:                 tuple(int, float, int)
+    :raises RuntimeError:   If the render fails.
+    """
+    output_path = os.path.join(
+        work_folder, "render%s" % os.path.splitext(options.output_name)[1]
+    )
+    job_path = os.path.join(work_folder, "render.json")
+    with open(job_path, "w") as f:
+        json.dump(
+            {
+                "root_knobs": "",
+                "nodes_path": os.path.abspath(options.script),
+                "view": options.view,
+                "executions": [
+                    [
+                        options.first_frame,
+                        options.last_frame,
+                        [options.write_node],
+                        {
+                            options.write_node: [
+                                "file",
+                                output_path.replace(os.sep, "/"),
+                            ]
+                        },
+                    ]
+                ],
+            },
+            f,
+        )
+
+    command = [options.nuke, "-t"]
+    if options.nukex:
+        command.append("--nukex")
+    if threads:
+        command.extend(["-m", str(threads)])
+    if cache_memory:
+        command.extend(["-c", "%dM" % cache_memory])
+    command.extend([RENDER_SCRIPT, job_path])
+
+    frames = [0]
+
+    def count_frame(line):
+        if line.startswith(FRAME_PREFIX):
+            frames[0] += 1
+
+    process = tk_multi_reviewsubmission.GovernedProcess(command, priority)
+    start_time = time.monotonic()
+    exit_code = process.run(count_frame)
+    duration = time.monotonic() - start_time
+
+    if exit_code != 0:
+        raise RuntimeError(
+            "The Nuke render process failed with exit code %d: %s"
+            % (exit_code, process.output)
+        )
+
+    return frames[0], duration, process.peak_memory
+
+
+def run(options):
+    """
+    Render the script with each combination of the settings and report the measures.
+
+    :param options:         The parsed command line options.
+
+    :returns:               The measures of each combination.
+    :rtype:                 list(dict)
+    """
+    results = []
+    print(
+        "%8s %10s %9s %10s %12s"
+        % ("threads", "cache (MB)", "priority", "frames/s", "peak (MB)")
+    )
+    for threads, cache_memory, priority in itertools.product(
+        options.threads, options.cache_memory, options.priority
+    ):
+        rates = []
+        peaks = []
+        for _ in range(options.repeat):
+            work_folder = tempfile.mkdtemp(prefix="bench-nuke-render-")
+            try:
+                frames, duration, peak_memory = render(
+                    options, threads, cache_memory, priority, work_folder
+                )
+            finally:
+                shutil.rmtree(work_folder, ignore_errors=True)
+            rates.append(frames / duration if duration else 0.0)
+            if peak_memory is not None:
+                peaks.append(peak_memory)
+
+        result = {
+            "render_threads": threads,
+            "render_cache_memory": cache_memory,
+            "render_priority": priority,
+            "frames_per_second": round(statistics.median(rates), 3),
+            "peak_memory": int(statistics.median(peaks)) if peaks else None,
+        }
+        results.append(result)
+        print(
+            "%8s %10s %9d %10.2f %12s"
+            % (
+                threads or "default",
+                cache_memory or "default",
+                priority,
+                result["frames_per_second"],
+                (
+                    "%.0f" % (result["peak_memory"] / 1e6)
+                    if result["peak_memory"] is not None
+                    else "unknown"
+                ),
+            )
+        )
+
+    if options.report:
+        with open(options.report, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the Nuke review renders across the render settings."
+    )
+    parser.add_argument("nuke", help="Path of the Nuke executable.")
+    parser.add_argument("script", help="Nuke script holding the nodes to render.")
+    parser.add_argument("write_node", help="Name of the Write node to render.")
+    parser.add_argument("first_frame", type=int, help="First frame to render.")
+    parser.add_argument("last_frame", type=int, help="Last frame to render.")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[0],
+        help="Render thread counts to compare, 0 for the Nuke default.",
+    )
+    parser.add_argument(
+        "--cache-memory",
+        type=int,
+        nargs="+",
+        default=[0],
+        help="Cache memory sizes in megabytes to compare, 0 for the Nuke default.",
+    )
+    parser.add_argument(
+        "--priority",
+        type=int,
+        nargs="+",
+        default=[0],
+        help="Render priorities to compare, from 0 to 19.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Number of runs of each combination."
+    )
+    parser.add_argument(
+        "--output-name",
+        default="render.mov",
+        help="Name of the rendered media, its extension picking the file format.",
+    )
+    parser.add_argument("--view", default="main", help="View to render.")
+    parser.add_argument("--nukex", action="store_true", help="Render with NukeX.")
+    parser.add_argument("--report", help="File to write the measures to.")
+
+    run(parser.parse_args())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
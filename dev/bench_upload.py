@@ -0,0 +1,277 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Benchmark of the memory used to upload movies of growing sizes.
+
+Each movie goes through the path of the uploader thread: a single :func:`fan_out` read
+feeding the checksum, the copy to the movie destination and a
+:class:`ShotgunUploadSink`. The sink talks to a stand-in for the Shotgun API which
+discards the uploaded parts, so only the memory of the upload path is measured, not the
+one of the network stack.
+
+Each size is uploaded by a process of its own, which reports the growth of its peak
+resident memory over the upload. The growth should stay the same whatever the size of
+the movie, about one read buffer plus one upload part. The benchmark fails when the
+growth differs by more than the given tolerance between the sizes.
+
+The movies are sparse files by default, so no disk space is used, or random data
+written to the given folder with ``--random``.
+
+Usage::
+
+    python dev/bench_upload.py --sizes 100 1000 5000 20000 --report upload.json
+
+The Toolkit core needs to be in the Python path. The peak memory is measured with the
+resource module, which isn't available on Windows.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python")
+)
+
+import tk_multi_reviewsubmission  # noqa: E402
+
+# Size of the chunks of random data written to the movies.
+WRITE_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class ShotgunStandIn(object):
+    """
+    Stand-in for the storage upload helpers of the Shotgun API used by
+    :class:`ShotgunUploadSink`, discarding the uploaded data.
+    """
+
+    class config(object):
+        scheme = "https"
+        server = "bench.shotgunstudio.com"
+
+    def __init__(self, part_size):
+        """
+        :param int part_size:   Size of the parts uploaded to the storage.
+        """
+        self._MULTIPART_UPLOAD_CHUNK_SIZE = part_size
+        self.parts = 0
+
+    def _requires_direct_s3_upload(self, entity_type, field_name):
+        return True
+
+    def _get_attachment_upload_info(self, is_thumbnail, file_name, is_multipart):
+        return {"upload_url": "https://storage/upload", "upload_info": {}}
+
+    def _get_upload_part_link(self, upload_info, file_name, part_number):
+        return "https://storage/upload/%d" % part_number
+
+    def _upload_data_to_storage(self, data, content_type, size, url):
+        self.parts += 1
+        return "etag-%d" % self.parts
+
+    def _complete_multipart_upload(self, upload_info, file_name, etags):
+        pass
+
+    def _auth_params(self):
+        return {}
+
+    def _send_form(self, url, params):
+        return "1"
+
+
+def create_movie(path, size, random_data):
+    """
+    Create a movie of the given size.
+
+    :param str path:        Path of the movie.
+    :param int size:        Size of the movie in bytes.
+    :param bool random_data: Whether to write random data, the movie being a sparse
+                            file otherwise.
+    """
+    with open(path, "wb") as f:
+        if not random_data:
+            f.truncate(size)
+            return
+
+        remaining = size
+        while remaining:
+            chunk_size = min(remaining, WRITE_CHUNK_SIZE)
+            f.write(os.urandom(chunk_size))
+            remaining -= chunk_size
+
+
+def get_peak_memory():
+    """
+    :returns:               Peak resident memory of the process in bytes.
+    :rtype:                 int
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def upload(path, buffer_size, part_size):
+    """
+    Upload a movie through the path of the uploader thread and measure it.
+
+    :param str path:        Path of the movie.
+    :param int buffer_size: Size of the chunks read from the movie.
+    :param int part_size:   Size of the parts uploaded to the storage.
+
+    :returns:               The measures of the upload.
+    :rtype:                 dict
+    """
+    sg = ShotgunStandIn(part_size)
+    checksum = tk_multi_reviewsubmission.ChecksumSink()
+    start_memory = get_peak_memory()
+    start_time = time.monotonic()
+
+    with open(os.devnull, "wb") as destination:
+        upload_sink = tk_multi_reviewsubmission.ShotgunUploadSink(
+            sg, "Version", 1, path, "sg_uploaded_movie"
+        )
+        size = tk_multi_reviewsubmission.fan_out(
+            path, [checksum, destination, upload_sink], buffer_size
+        )
+        upload_sink.close()
+
+    duration = time.monotonic() - start_time
+    peak_memory = get_peak_memory()
+    return {
+        "size": size,
+        "seconds": round(duration, 3),
+        "megabytes_per_second": round(size / duration / 1e6, 1) if duration else None,
+        "parts": sg.parts,
+        "peak_memory": peak_memory,
+        "memory_growth": peak_memory - start_memory,
+        "checksum": checksum.hexdigest(),
+    }
+
+
+def run(options):
+    """
+    Upload a movie of each size from a process of its own and report the measures.
+
+    :param options:         The parsed command line options.
+
+    :returns:               The measures of each upload.
+    :rtype:                 list(dict)
+    """
+    folder = options.folder or tempfile.mkdtemp(prefix="bench-upload-")
+    os.makedirs(folder, exist_ok=True)
+
+    results = []
+    print(
+        "%10s %10s %10s %12s %12s"
+        % ("size (MB)", "seconds", "MB/s", "peak (MB)", "growth (MB)")
+    )
+    for size in options.sizes:
+        path = os.path.join(folder, "bench_%dMB.mov" % size)
+        create_movie(path, int(size * 1e6), options.random)
+        try:
+            output = subprocess.check_output(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--child",
+                    path,
+                    "--buffer-size",
+                    str(options.buffer_size),
+                    "--part-size",
+                    str(options.part_size),
+                ],
+                universal_newlines=True,
+            )
+        finally:
+            os.unlink(path)
+
+        result = json.loads(output.splitlines()[-1])
+        results.append(result)
+        print(
+            "%10d %10.1f %10s %12.1f %12.1f"
+            % (
+                size,
+                result["seconds"],
+                result["megabytes_per_second"],
+                result["peak_memory"] / 1e6,
+                result["memory_growth"] / 1e6,
+            )
+        )
+
+    if options.report:
+        with open(options.report, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the memory used to upload movies of growing sizes."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=[100, 1000, 5000, 20000],
+        help="Sizes of the movies in megabytes.",
+    )
+    parser.add_argument(
+        "--folder",
+        help="Folder to write the movies to, a temporary folder when not given.",
+    )
+    parser.add_argument(
+        "--random",
+        action="store_true",
+        help="Write random data to the movies instead of creating sparse files.",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=tk_multi_reviewsubmission.streaming.DEFAULT_BUFFER_SIZE,
+        help="Size of the chunks read from the movies in bytes.",
+    )
+    parser.add_argument(
+        "--part-size",
+        type=int,
+        default=tk_multi_reviewsubmission.upload.DEFAULT_PART_SIZE,
+        help="Size of the parts uploaded to the storage in bytes.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=16,
+        help="Difference of the memory growth between the sizes allowed, in "
+        "megabytes.",
+    )
+    parser.add_argument("--report", help="File to write the measures to.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    if options.child:
+        print(json.dumps(upload(options.child, options.buffer_size, options.part_size)))
+        return 0
+
+    results = run(options)
+
+    growths = [result["memory_growth"] for result in results]
+    spread = (max(growths) - min(growths)) / 1e6
+    print("Memory growth spread between the sizes: %.1f MB" % spread)
+    return 1 if spread > options.tolerance else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,909 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Load and soak test harness of the submission path.
+
+Runs many simulated submitters at once, each of them calling
+:meth:`Actions.render_and_submit_version` in a loop from its own thread, for as long as
+requested, e.g. hours. The app runs in a tk-shell engine started for the given pipeline
+configuration and entity, with:
+
+- A stub render media hook, writing movies of a given size after a given render time,
+  instead of rendering the frames.
+- A stand-in for the Shotgun API, which serves the requests of the submissions in
+  memory, or with mockgun when a schema is given, adding latency, failures and a
+  bandwidth limit shared by all the uploads.
+
+The site is only used to authenticate and to build the context, the submissions never
+reach it. The movies are stored as configured, e.g. to the movie path template, so point
+the configuration to a disposable storage.
+
+The harness reports, at a regular interval and once done, the throughput, the latency
+percentiles and the errors of the submissions, along with the resources of the process:
+memory, open handles, threads, live QThreads and files left in the scratch space. A
+resource growing steadily over the run points to a leak. Each report is also appended
+as a JSON document to the report file, if given.
+
+Usage::
+
+    python dev/soak.py /path/to/pipeline_configuration Shot 1234 \\
+        --submitters 40 --duration 14400 --movie-size 50 --bandwidth 100 \\
+        --latency 0.2 --error-rate 0.01 --report soak.jsonl
+
+The Toolkit core of the configuration needs to be in the Python path, along with a Qt
+binding.
+"""
+
+import argparse
+import collections
+import gc
+import json
+import os
+import random
+import signal
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+import sgtk
+
+APP_NAME = "tk-multi-reviewsubmission"
+
+# Fields of the Version entity reported by the stand-in when no schema is given.
+VERSION_FIELDS = [
+    "code",
+    "description",
+    "entity",
+    "sg_task",
+    "project",
+    "user",
+    "created_by",
+    "published_files",
+    "tank_published_file",
+    "sg_path_to_frames",
+    "sg_path_to_movie",
+    "sg_first_frame",
+    "sg_last_frame",
+    "frame_count",
+    "frame_range",
+    "sg_movie_has_slate",
+    "sg_uploaded_movie",
+    "image",
+    "filmstrip_image",
+]
+
+# Size of the chunks the uploads are read in.
+CHUNK_SIZE = 1024 * 1024
+
+
+class InjectedFailure(Exception):
+    """
+    Failure of a request injected by the Shotgun stand-in.
+    """
+
+
+class Throttle(object):
+    """
+    Limits the rate of the data transferred by all the threads sharing it, like the
+    uplink of a department.
+    """
+
+    def __init__(self, bytes_per_second):
+        """
+        :param float bytes_per_second: The transfer rate, unlimited when 0.
+        """
+        self._bytes_per_second = bytes_per_second
+        self._available_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, size):
+        """
+        Wait until a chunk of data can be transferred.
+
+        :param int size:        Size of the chunk.
+        """
+        if not self._bytes_per_second:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._available_at = (
+                max(now, self._available_at) + size / self._bytes_per_second
+            )
+            delay = self._available_at - now
+        time.sleep(delay)
+
+
+class ShotgunStandIn(object):
+    """
+    Serves the requests the submissions make to the Shotgun API, with injected latency
+    and failures. The uploads are read from the disk through the shared throttle.
+
+    The entities are kept in memory, or in mockgun when it is given. Only the filters
+    used by the submission path, ``is`` and ``in``, are supported in memory.
+    """
+
+    def __init__(self, latency, jitter, error_rate, throttle, mockgun=None, user=None):
+        """
+        :param float latency:   Mean latency of the requests, in seconds.
+        :param float jitter:    Standard deviation of the latency, in seconds.
+        :param float error_rate: Probability of a request to fail.
+        :param throttle:        The :class:`Throttle` of the uploads.
+        :param mockgun:         The mockgun Shotgun instance storing the entities, in
+                                memory when None.
+        :param dict user:       The HumanUser of the submissions.
+        """
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rate = error_rate
+        self._throttle = throttle
+        self._mockgun = mockgun
+
+        self._lock = threading.Lock()
+        self._entities = collections.defaultdict(dict)
+        self._next_id = 1
+        self.requests = collections.Counter()
+        self.bytes_uploaded = 0
+
+        if user:
+            self._entities["HumanUser"][user["id"]] = dict(user)
+
+    def create(self, entity_type, data, return_fields=None):
+        self._request("create")
+        if self._mockgun:
+            with self._lock:
+                return self._mockgun.create(entity_type, data, return_fields)
+
+        with self._lock:
+            entity = dict(data, type=entity_type, id=self._next_id)
+            self._next_id += 1
+            self._entities[entity_type][entity["id"]] = entity
+        return dict(entity)
+
+    def update(self, entity_type, entity_id, data, multi_entity_update_modes=None):
+        self._request("update")
+        if self._mockgun:
+            with self._lock:
+                return self._mockgun.update(
+                    entity_type, entity_id, data, multi_entity_update_modes
+                )
+
+        with self._lock:
+            entity = self._entities[entity_type].setdefault(
+                entity_id, {"type": entity_type, "id": entity_id}
+            )
+            for field_name, value in data.items():
+                mode = (multi_entity_update_modes or {}).get(field_name, "set")
+                if mode == "add":
+                    value = (entity.get(field_name) or []) + list(value)
+                entity[field_name] = value
+        return dict(entity)
+
+    def find(self, entity_type, filters, fields=None, order=None, limit=0, **kwargs):
+        self._request("find")
+        if self._mockgun:
+            with self._lock:
+                return self._mockgun.find(
+                    entity_type, filters, fields, order, limit=limit, **kwargs
+                )
+
+        with self._lock:
+            entities = [
+                dict(entity)
+                for entity in self._entities[entity_type].values()
+                if all(_matches(entity, condition) for condition in filters)
+            ]
+        for sort in reversed(order or []):
+            entities.sort(
+                key=lambda entity: entity.get(sort["field_name"]) or 0,
+                reverse=sort.get("direction") == "desc",
+            )
+        return entities[:limit] if limit else entities
+
+    def find_one(self, entity_type, filters, fields=None, order=None, **kwargs):
+        entities = self.find(entity_type, filters, fields, order, limit=1, **kwargs)
+        return entities[0] if entities else None
+
+    def schema_field_read(self, entity_type, field_name=None, project_entity=None):
+        self._request("schema_field_read")
+        if self._mockgun:
+            return self._mockgun.schema_field_read(
+                entity_type, field_name, project_entity
+            )
+
+        fields = VERSION_FIELDS if entity_type == "Version" else ["code"]
+        return {name: {} for name in fields if field_name is None or name == field_name}
+
+    def upload(
+        self,
+        entity_type,
+        entity_id,
+        path,
+        field_name=None,
+        display_name=None,
+        tag_list=None,
+    ):
+        self._request("upload")
+        self._transfer(path)
+        return random.randint(1, 2**31)
+
+    def upload_thumbnail(self, entity_type, entity_id, path, **kwargs):
+        self._request("upload_thumbnail")
+        self._transfer(path)
+        return random.randint(1, 2**31)
+
+    def upload_filmstrip_thumbnail(self, entity_type, entity_id, path, **kwargs):
+        self._request("upload_filmstrip_thumbnail")
+        self._transfer(path)
+        return random.randint(1, 2**31)
+
+    def _request(self, name):
+        """
+        Simulate the round trip of a request.
+
+        :param str name:        Name of the request.
+        :raises InjectedFailure: When the request is picked to fail.
+        """
+        with self._lock:
+            self.requests[name] += 1
+        time.sleep(max(0.0, random.gauss(self._latency, self._jitter)))
+        if random.random() < self._error_rate:
+            raise InjectedFailure("Injected failure of the %s request." % name)
+
+    def _transfer(self, path):
+        """
+        Read a file at the rate of the throttle.
+
+        :param str path:        Path of the uploaded file.
+        """
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(CHUNK_SIZE)
+                if not data:
+                    break
+                self._throttle.consume(len(data))
+                with self._lock:
+                    self.bytes_uploaded += len(data)
+
+
+class StubRenderMedia(object):
+    """
+    Stands in for the render media hook, writing movies of random bytes instead of
+    rendering them.
+    """
+
+    def __init__(self, app, render_seconds, movie_size):
+        """
+        :param app:             The app instance.
+        :param float render_seconds: Mean time a render takes.
+        :param int movie_size:  Size of the rendered movies, in bytes.
+        """
+        self._app = app
+        self._render_seconds = render_seconds
+        self._movie_size = movie_size
+        self._data = os.urandom(min(movie_size, CHUNK_SIZE) or 1)
+
+    def pre_render(self, **kwargs):
+        pass
+
+    def post_render(self, **kwargs):
+        pass
+
+    def render_frames(self, **kwargs):
+        # Not supported, the media are rendered with render().
+        return None
+
+    def render(self, output_path, additional_outputs=None, **kwargs):
+        time.sleep(
+            max(0.0, random.gauss(self._render_seconds, self._render_seconds / 4))
+        )
+
+        if not output_path:
+            output_path = self._app.scratch_space.allocate("soak.mov")
+        self._write(output_path, self._movie_size)
+
+        for output in additional_outputs or []:
+            self._write(output["path"], len(self._data))
+
+        return output_path
+
+    def render_batch(self, items):
+        return [self.render(**item) for item in items]
+
+    def _write(self, path, size):
+        """
+        Write a file of random bytes.
+
+        :param str path:        Path of the file.
+        :param int size:        Size of the file.
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as f:
+            while size > 0:
+                data = self._data[:size]
+                f.write(data)
+                size -= len(data)
+
+
+class Statistics(object):
+    """
+    Records the outcome of the submissions and samples the resources of the process.
+    """
+
+    def __init__(self, app, shotgun):
+        """
+        :param app:             The app instance.
+        :param shotgun:         The :class:`ShotgunStandIn`.
+        """
+        self._app = app
+        self._shotgun = shotgun
+        self._lock = threading.Lock()
+        self._window = []
+        self._latencies = []
+        self._errors = collections.Counter()
+        self._start_time = time.monotonic()
+        self._samples = []
+
+    def record(self, latency, error=None):
+        """
+        Record the outcome of a submission.
+
+        :param float latency:   Number of seconds the submission took.
+        :param str error:       Type of the error the submission failed with, None if it
+                                succeeded.
+        """
+        with self._lock:
+            self._window.append((latency, error))
+            self._latencies.append(latency)
+            if error:
+                self._errors[error] += 1
+
+    def report(self, final=False):
+        """
+        Report the submissions since the last report, or all of them once done, along
+        with the resources of the process.
+
+        :param bool final:      Whether this is the final report.
+
+        :returns:               The report.
+        :rtype:                 dict
+        """
+        now = time.monotonic()
+        with self._lock:
+            if final:
+                outcomes = [(latency, None) for latency in self._latencies]
+                error_count = sum(self._errors.values())
+                errors = dict(self._errors)
+                duration = now - self._start_time
+            else:
+                outcomes = self._window
+                errors = dict(
+                    collections.Counter(error for _, error in outcomes if error)
+                )
+                error_count = sum(errors.values())
+                previous = self._samples[-1]["elapsed"] if self._samples else 0
+                duration = now - self._start_time - previous
+            self._window = []
+
+        latencies = sorted(latency for latency, _ in outcomes)
+        report = {
+            "elapsed": round(now - self._start_time, 1),
+            "submissions": len(latencies),
+            "per_minute": round(len(latencies) * 60 / duration, 2) if duration else 0,
+            "errors": error_count,
+            "error_rate": round(error_count / len(latencies), 4) if latencies else 0,
+            "error_types": errors,
+            "latency": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "p99": _percentile(latencies, 99),
+                "max": round(latencies[-1], 3) if latencies else None,
+            },
+            "uploaded_mb": round(self._shotgun.bytes_uploaded / 1024 / 1024, 1),
+            "resources": self._sample_resources(),
+        }
+
+        if final:
+            report["requests"] = dict(self._shotgun.requests)
+            report["growth_per_hour"] = self._get_growth()
+        else:
+            self._samples.append(report)
+        return report
+
+    def _sample_resources(self):
+        """
+        :returns:               The resources of the process.
+        :rtype:                 dict
+        """
+        resources = {
+            "rss_mb": _get_rss_mb(),
+            "open_handles": _get_open_handles(),
+            "os_threads": _get_os_threads(),
+            "python_threads": threading.active_count(),
+            "qthreads": _get_qthreads(),
+            "scratch_files": _count_files(self._app.scratch_space.root),
+            "staging_files": _count_files(
+                self._app.scratch_space.root, lambda name: ".partial" in name
+            ),
+            "temp_entries": len(os.listdir(tempfile.gettempdir())),
+        }
+        return resources
+
+    def _get_growth(self):
+        """
+        Growth of the resources between the first and the last report, per hour.
+
+        :returns:               The growth of each resource.
+        :rtype:                 dict
+        """
+        if len(self._samples) < 2:
+            return {}
+
+        first, last = self._samples[0], self._samples[-1]
+        hours = (last["elapsed"] - first["elapsed"]) / 3600
+        growth = {}
+        for name, value in last["resources"].items():
+            if value is None or first["resources"][name] is None:
+                continue
+            growth[name] = round((value - first["resources"][name]) / hours, 2)
+        return growth
+
+
+class Submitter(threading.Thread):
+    """
+    Simulated submitter, submitting Versions in a loop until stopped.
+    """
+
+    def __init__(self, index, app, statistics, stop, options):
+        """
+        :param int index:       Index of the submitter.
+        :param app:             The app instance.
+        :param statistics:      The :class:`Statistics` to record the submissions to.
+        :param stop:            The ``threading.Event`` stopping the submitter.
+        :param options:         The command line options.
+        """
+        super(Submitter, self).__init__(name="Submitter%03d" % index, daemon=True)
+        self._index = index
+        self._app = app
+        self._statistics = statistics
+        self._stop_event = stop
+        self._options = options
+
+    def run(self):
+        app_module = self._app.import_module("tk_multi_reviewsubmission")
+        actions = app_module.Actions()
+
+        template = self._app.get_template("movie_path_template")
+        context_fields = (
+            self._app.context.as_template_fields(template) if template else {}
+        )
+
+        count = 0
+        # Spread the first submissions over the think time.
+        delay = random.uniform(0, self._options.think_time)
+        while not self._stop_event.wait(delay):
+            count += 1
+            if random.random() < self._options.collision_rate:
+                # Same output as the other submitters colliding, to exercise the locks.
+                name, version = "soak_shared", 1
+            else:
+                name, version = "soak_%03d_%06d" % (self._index, count), count
+
+            start_time = time.monotonic()
+            error = None
+            try:
+                actions.render_and_submit_version(
+                    fields=dict(context_fields, name=name, version=version),
+                    first_frame=1001,
+                    last_frame=1001 + self._options.frames - 1,
+                    comment="Soak test submission %d of %s" % (count, self.name),
+                )
+            except Exception as e:
+                error = type(e).__name__
+                if self._options.verbose:
+                    traceback.print_exc()
+            self._statistics.record(time.monotonic() - start_time, error)
+
+            delay = random.expovariate(1 / self._options.think_time)
+
+
+def run(options):
+    """
+    Run the soak test.
+
+    :param options:         The command line options.
+
+    :returns:               The final report.
+    :rtype:                 dict
+    """
+    if options.verbose:
+        sgtk.LogManager().global_debug = True
+
+    # Authenticate with the site to build the context, the submissions don't reach it.
+    user = sgtk.authentication.ShotgunAuthenticator().get_user()
+    sgtk.set_authenticated_user(user)
+
+    tk = sgtk.sgtk_from_path(options.pipeline_configuration)
+    context = tk.context_from_entity(options.entity_type, options.entity_id)
+    sg_user = sgtk.util.get_current_user(tk)
+
+    engine = sgtk.platform.start_engine("tk-shell", tk, context)
+    try:
+        from sgtk.platform.qt import QtCore
+
+        # The submitter waits for its upload thread with a Qt event loop.
+        if QtCore and not QtCore.QCoreApplication.instance():
+            QtCore.QCoreApplication([])
+
+        app = next((app for app in engine.apps.values() if app.name == APP_NAME), None)
+        if app is None:
+            raise RuntimeError(
+                "%s isn't configured for the tk-shell engine in the context %s."
+                % (APP_NAME, context)
+            )
+
+        shotgun = ShotgunStandIn(
+            options.latency,
+            options.jitter,
+            options.error_rate,
+            Throttle(options.bandwidth * 1024 * 1024),
+            _get_mockgun(options.mockgun_schema),
+            sg_user,
+        )
+        _install_stand_ins(app, tk, shotgun, options)
+
+        return _soak(app, shotgun, options)
+    finally:
+        engine.destroy()
+
+
+def _install_stand_ins(app, tk, shotgun, options):
+    """
+    Route the Shotgun requests of the app to the stand-in and its render media hook
+    calls to the stub.
+
+    :param app:             The app instance.
+    :param tk:              The Toolkit API instance of the engine.
+    :param shotgun:         The :class:`ShotgunStandIn`.
+    :param options:         The command line options.
+    """
+    type(tk).shotgun = property(lambda self: shotgun)
+
+    render_media = StubRenderMedia(
+        app, options.render_seconds, int(options.movie_size * 1024 * 1024)
+    )
+    execute_hook_method = app.execute_hook_method
+
+    def execute_stub_hook_method(key, method_name, base_class=None, **kwargs):
+        if key == "render_media_hook":
+            return getattr(render_media, method_name)(**kwargs)
+        return execute_hook_method(
+            key=key, method_name=method_name, base_class=base_class, **kwargs
+        )
+
+    app.execute_hook_method = execute_stub_hook_method
+
+
+def _soak(app, shotgun, options):
+    """
+    Run the submitters for the duration of the test, reporting at a regular interval.
+
+    :param app:             The app instance.
+    :param shotgun:         The :class:`ShotgunStandIn`.
+    :param options:         The command line options.
+
+    :returns:               The final report.
+    :rtype:                 dict
+    """
+    statistics = Statistics(app, shotgun)
+    stop = threading.Event()
+
+    # Stop on Ctrl+C, letting the running submissions finish.
+    signal.signal(signal.SIGINT, lambda *args: stop.set())
+
+    submitters = [
+        Submitter(index, app, statistics, stop, options)
+        for index in range(options.submitters)
+    ]
+    for submitter in submitters:
+        submitter.start()
+
+    print(
+        "Running %d submitters for %ds, reporting every %ds."
+        % (options.submitters, options.duration, options.report_interval)
+    )
+    deadline = time.monotonic() + options.duration
+    while not stop.wait(
+        max(min(options.report_interval, deadline - time.monotonic()), 0)
+    ):
+        _write_report(statistics.report(), options.report)
+        if time.monotonic() >= deadline:
+            stop.set()
+
+    print("Waiting for the running submissions to finish.")
+    for submitter in submitters:
+        submitter.join()
+
+    report = statistics.report(final=True)
+    _write_report(report, options.report, final=True)
+    return report
+
+
+def _write_report(report, path=None, final=False):
+    """
+    Print a report and append it to the report file.
+
+    :param dict report:     The report.
+    :param str path:        Path of the report file. Can be None.
+    :param bool final:      Whether this is the final report.
+    """
+    latency = report["latency"]
+    resources = report["resources"]
+    print(
+        "%s%7.0fs  %5d submissions  %6.1f/min  errors %4d (%.1f%%)  "
+        "p50 %s  p95 %s  p99 %s  rss %sMB  handles %s  threads %s  qthreads %s  "
+        "scratch files %s"
+        % (
+            "TOTAL " if final else "",
+            report["elapsed"],
+            report["submissions"],
+            report["per_minute"],
+            report["errors"],
+            report["error_rate"] * 100,
+            latency["p50"],
+            latency["p95"],
+            latency["p99"],
+            resources["rss_mb"],
+            resources["open_handles"],
+            resources["os_threads"],
+            resources["qthreads"],
+            resources["scratch_files"],
+        )
+    )
+    if final:
+        print(json.dumps(report, indent=4, sort_keys=True))
+
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps(dict(report, final=final)) + "\n")
+
+
+def _matches(entity, condition):
+    """
+    :param dict entity:     The entity dictionary.
+    :param list condition:  A filter condition, ``[field, operator, value]``.
+
+    :returns:               Whether the entity matches the condition.
+    :rtype:                 bool
+    :raises NotImplementedError: If the operator isn't supported.
+    """
+    field_name, operator, value = condition
+    if operator == "is":
+        return entity.get(field_name) == value
+    if operator == "in":
+        return entity.get(field_name) in value
+    raise NotImplementedError(
+        "The %s operator isn't supported without mockgun." % operator
+    )
+
+
+def _percentile(values, percentile):
+    """
+    :param list(float) values: The sorted values.
+    :param int percentile:  The percentile, between 0 and 100.
+
+    :returns:               The nearest rank percentile, None if there are no values.
+    :rtype:                 float
+    """
+    if not values:
+        return None
+    rank = max(int(round(percentile / 100.0 * len(values) + 0.5)) - 1, 0)
+    return round(values[min(rank, len(values) - 1)], 3)
+
+
+def _get_rss_mb():
+    """
+    :returns:               The resident memory of the process in megabytes, None if it
+                            can't be read.
+    :rtype:                 float
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return round(psutil.Process().memory_info().rss / 1024 / 1024, 1)
+
+
+def _get_open_handles():
+    """
+    :returns:               The number of file descriptors, or handles on Windows, opened
+                            by the process. None if it can't be read.
+    :rtype:                 int
+    """
+    for folder in ("/proc/self/fd", "/dev/fd"):
+        if os.path.isdir(folder):
+            return len(os.listdir(folder))
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().num_handles()
+
+
+def _get_os_threads():
+    """
+    :returns:               The number of threads of the process, the Qt ones included.
+                            None if it can't be read.
+    :rtype:                 int
+    """
+    if os.path.isdir("/proc/self/task"):
+        return len(os.listdir("/proc/self/task"))
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().num_threads()
+
+
+def _get_qthreads():
+    """
+    :returns:               The number of QThread objects alive, None without Qt.
+    :rtype:                 int
+    """
+    from sgtk.platform.qt import QtCore
+
+    if not QtCore:
+        return None
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, QtCore.QThread))
+
+
+def _count_files(folder, accept=None):
+    """
+    :param str folder:      The folder to count the files of, recursively.
+    :param accept:          Callable accepting the file names to count, all of them when
+                            None.
+
+    :returns:               The number of files.
+    :rtype:                 int
+    """
+    count = 0
+    for _, _, file_names in os.walk(folder):
+        count += sum(1 for name in file_names if accept is None or accept(name))
+    return count
+
+
+def _get_mockgun(schema_folder):
+    """
+    :param str schema_folder: Folder holding the ``schema.pickle`` and
+                            ``schema_entity.pickle`` files of the site, as written by
+                            ``mockgun.generate_schema``. Can be None.
+
+    :returns:               A mockgun Shotgun instance using the schema, None if no
+                            schema is given.
+    """
+    if not schema_folder:
+        return None
+
+    from tank_vendor.shotgun_api3.lib import mockgun
+
+    mockgun.Shotgun.set_schema_paths(
+        os.path.join(schema_folder, "schema.pickle"),
+        os.path.join(schema_folder, "schema_entity.pickle"),
+    )
+    return mockgun.Shotgun(
+        "https://soak.shotgunstudio.com", script_name="soak", api_key="soak"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load and soak test of the review submissions."
+    )
+    parser.add_argument(
+        "pipeline_configuration", help="Path of the pipeline configuration."
+    )
+    parser.add_argument("entity_type", help="Type of the entity to submit for.")
+    parser.add_argument("entity_id", type=int, help="Id of the entity to submit for.")
+    parser.add_argument(
+        "--submitters", type=int, default=20, help="Number of concurrent submitters."
+    )
+    parser.add_argument(
+        "--duration", type=float, default=3600, help="Duration of the test in seconds."
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=5.0,
+        help="Mean number of seconds between the submissions of a submitter.",
+    )
+    parser.add_argument(
+        "--render-seconds",
+        type=float,
+        default=2.0,
+        help="Mean number of seconds a render takes.",
+    )
+    parser.add_argument(
+        "--frames", type=int, default=100, help="Number of frames of the submissions."
+    )
+    parser.add_argument(
+        "--movie-size",
+        type=float,
+        default=20.0,
+        help="Size of the rendered movies in megabytes.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.1,
+        help="Mean latency of the Shotgun requests in seconds.",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.05,
+        help="Standard deviation of the latency in seconds.",
+    )
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=0,
+        help="Upload bandwidth shared by the submitters in megabytes per second, "
+        "unlimited when 0.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Probability of a Shotgun request to fail.",
+    )
+    parser.add_argument(
+        "--collision-rate",
+        type=float,
+        default=0.0,
+        help="Probability of a submission to write the same output as the others.",
+    )
+    parser.add_argument(
+        "--mockgun-schema",
+        help="Folder holding the schema.pickle and schema_entity.pickle files of the "
+        "site, to store the entities with mockgun.",
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=60,
+        help="Number of seconds between the reports.",
+    )
+    parser.add_argument("--report", help="File to append the reports to.")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Log the debug messages and the errors."
+    )
+
+    report = run(parser.parse_args())
+
+    # Fail when no submission went through.
+    return 1 if report["errors"] == report["submissions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
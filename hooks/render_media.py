@@ -10,7 +10,7 @@
 
 
 import sgtk
-import tempfile
+import os
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
@@ -31,6 +31,8 @@ class RenderMedia(HookBaseClass):
         version,
         name,
         color_space,
+        additional_outputs=None,
+        encode_settings=None,
     ):
         """
         Render the media
@@ -44,12 +46,205 @@ class RenderMedia(HookBaseClass):
         :param int version:         Version number to use for the output movie slate and burn-in
         :param str name:            Name to use in the slate for the output movie
         :param str color_space:     Colorspace of the input frames              (Unused)
+        :param list(dict) additional_outputs: Additional media to render from the same read
+                                    of the input frames, with their ``kind``, out of ``movie``,
+                                    ``thumbnail`` and ``filmstrip``, their ``path``, ``width``
+                                    and ``height``. A height of 0 keeps the aspect ratio of
+                                    the frames. The outputs which aren't rendered are skipped
+                                    by the submitter. Only passed when configured.
+        :param dict encode_settings: Settings fitting the upload of the movie to the
+                                    ``upload_time_budget`` setting: the ``bitrate`` in
+                                    kilobits per second, and the ``width``, ``height`` and
+                                    ``scale`` of the movie. Only passed when the movie
+                                    doesn't fit the budget with the default settings.
 
         :returns:               Location of the rendered media
         :rtype:                 str
         """
         raise NotImplementedError()
 
+    def render_batch(self, items):
+        """
+        Render the media of several items in a single pass.
+
+        Each item is a dictionary holding the arguments of :meth:`render` as well as any
+        engine specific option, like the ``camera`` to render through. This default
+        implementation ignores these options and renders the items one after the other.
+
+        :param list(dict) items:    Items to render
+
+        :returns:               Location of the rendered media of each item
+        :rtype:                 list(str)
+        """
+        output_paths = []
+        for item in items:
+            render_args = dict(
+                input_path=item["input_path"],
+                output_path=item["output_path"],
+                width=item["width"],
+                height=item["height"],
+                first_frame=item["first_frame"],
+                last_frame=item["last_frame"],
+                version=item["version"],
+                name=item["name"],
+                color_space=item["color_space"],
+            )
+            if item.get("additional_outputs"):
+                render_args["additional_outputs"] = item["additional_outputs"]
+            if item.get("encode_settings"):
+                render_args["encode_settings"] = item["encode_settings"]
+
+            output_paths.append(self.render(**render_args))
+
+        return output_paths
+
+    def get_rendered_frame_count(self, first_frame, last_frame):
+        """
+        Get the number of frames of the movie rendered for a frame range, used to pick the
+        bitrate fitting the upload of the movie to the ``upload_time_budget`` setting.
+
+        This default implementation counts the slate frame prepended by :meth:`encode`.
+
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+
+        :returns:               Number of frames of the movie.
+        :rtype:                 int
+        """
+        return last_frame - first_frame + 2
+
+    def supports_frame_capture(self):
+        """
+        Whether the hook can capture the frames of the media with :meth:`render_frames`,
+        so the movie is encoded in the background.
+
+        The frames can be captured when a derived hook implements :meth:`render_frames`.
+
+        :returns:               True if the frames can be captured.
+        :rtype:                 bool
+        """
+        return type(self).render_frames is not RenderMedia.render_frames
+
+    def render_frames(
+        self,
+        input_path,
+        output_path,
+        width,
+        height,
+        first_frame,
+        last_frame,
+        version,
+        name,
+        color_space,
+        additional_outputs=None,
+        encode_settings=None,
+    ):
+        """
+        Capture the frames of the media without encoding them, so the movie can be
+        encoded in the background by :meth:`encode`.
+
+        This default implementation doesn't support capturing frames and returns None, see
+        :meth:`supports_frame_capture`, in which case the media is rendered with
+        :meth:`render` instead.
+
+        :param str input_path:      Path to the input frames for the movie
+        :param str output_path:     Path to the output movie that will be rendered
+        :param int width:           Width of the output movie
+        :param int height:          Height of the output movie
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+        :param int version:         Version number to use for the output movie slate and burn-in
+        :param str name:            Name to use in the slate for the output movie
+        :param str color_space:     Colorspace of the input frames
+        :param list(dict) additional_outputs: Additional media encoded along with the movie
+        :param dict encode_settings: Settings the movie is encoded with, see :meth:`render`
+
+        :returns:               The :meth:`encode` arguments to update with the captured frames
+                                ``input_path``, ``first_frame``, ``last_frame`` and ``frame_rate``.
+                                When ``temporary`` is set, the frames are removed once encoded.
+        :rtype:                 dict
+        """
+        return None
+
+    def encode(
+        self,
+        input_path,
+        output_path,
+        width,
+        height,
+        first_frame,
+        last_frame,
+        version,
+        name,
+        color_space,
+        frame_rate=24.0,
+        additional_outputs=None,
+        encode_settings=None,
+    ):
+        """
+        Encode a sequence of frames into a movie with a slate and burn-ins using ffmpeg.
+
+        This method doesn't use the DCC API and can be executed from a background thread.
+
+        :param str input_path:      Path to the input frames for the movie
+        :param str output_path:     Path to the output movie that will be rendered
+        :param int width:           Width of the output movie
+        :param int height:          Height of the output movie
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+        :param int version:         Version number to use for the output movie slate and burn-in
+        :param str name:            Name to use in the slate for the output movie
+        :param str color_space:     Colorspace of the input frames, transformed to the review
+                                    display with a LUT baked once, see :meth:`_get_color_lut`
+        :param float frame_rate:    Frame rate of the output movie
+        :param list(dict) additional_outputs: Additional media to encode from the same read
+                                    of the input frames, see :meth:`render`
+        :param dict encode_settings: Bitrate and resolution fitting the upload of the movie
+                                    to the ``upload_time_budget`` setting, see :meth:`render`
+
+        :returns:               Location of the rendered media
+        :rtype:                 str
+        """
+        app = self.parent
+
+        if not output_path:
+            output_path = self._get_temp_media_path(name, version, ".mov")
+
+        app.ensure_folder_exists(os.path.dirname(output_path))
+
+        encoder = app.import_module("tk_multi_reviewsubmission").FFmpegEncoder(
+            ffmpeg_path=app.get_setting("ffmpeg_path"),
+            font_path=os.path.join(
+                app.disk_location, "resources", "liberationsans_regular.ttf"
+            ),
+        )
+
+        bitrate = None
+        if encode_settings:
+            width = encode_settings["width"]
+            height = encode_settings["height"]
+            bitrate = encode_settings["bitrate"]
+
+        self.logger.info("Encoding %s to %s" % (input_path, output_path))
+
+        return encoder.encode(
+            input_path,
+            output_path,
+            width,
+            height,
+            first_frame,
+            frame_rate,
+            burnins=dict(
+                self._get_context_burnins(),
+                bottom_left=self._get_version_label(version),
+            ),
+            slate=self._get_slate_text(name, version, first_frame, last_frame),
+            additional_outputs=additional_outputs,
+            frame_count=last_frame - first_frame + 1,
+            lut_path=self._get_color_lut(color_space) if color_space else None,
+            bitrate=bitrate,
+        )
+
     def pre_render(
         self,
         input_path,
@@ -114,7 +309,7 @@ class RenderMedia(HookBaseClass):
 
     def _get_temp_media_path(self, name, version, extension):
         """
-        Build a temporary path to put the rendered media.
+        Build a temporary path to put the rendered media, on the scratch space of the app.
 
         :param str name:            Name of the media being rendered
         :param str version:         Version number of the media being rendered
@@ -127,9 +322,148 @@ class RenderMedia(HookBaseClass):
         name = name or ""
 
         if version:
-            suffix = "_v" + version + extension
+            suffix = "_v%s%s" % (version, extension)
         else:
             suffix = extension
 
-        with tempfile.NamedTemporaryFile(prefix=name + "-", suffix=suffix) as temp_file:
-            return temp_file.name
+        return self.parent.scratch_space.allocate(name + suffix)
+
+    def _get_color_lut(self, color_space):
+        """
+        Get the 3D LUT transforming a colour space to the review display configured by the
+        ``review_display`` and ``review_view`` settings, with the OpenColorIO config of the
+        environment. The LUTs are baked once and cached on disk.
+
+        :param str color_space:     Colorspace of the input frames
+
+        :returns:               Path to the LUT, None if it can't be baked
+        :rtype:                 str
+        """
+        app = self.parent
+        lut_cache = app.import_module("tk_multi_reviewsubmission").ColorLutCache(
+            os.path.join(app.cache_location, "color_luts")
+        )
+        if not lut_cache.is_supported():
+            self.logger.warning(
+                "OpenColorIO isn't available, the %s frames are encoded as is."
+                % color_space
+            )
+            return None
+
+        try:
+            return lut_cache.get_lut(
+                color_space,
+                app.get_setting("review_display") or None,
+                app.get_setting("review_view") or None,
+            )
+        except Exception as e:
+            self.logger.warning("%s The frames are encoded as is." % e)
+            return None
+
+    def _report_progress(self, fraction, message=None):
+        """
+        Report the progress of the render. The reports are throttled before reaching the
+        progress callback of the submission, so this can be called for every frame.
+
+        :param float fraction:      Fraction of the render done, between 0 and 1
+        :param str message:         Description of the current step
+        """
+        self.parent.import_module("tk_multi_reviewsubmission").report_progress(
+            fraction, message
+        )
+
+    def _get_context_burnins(self):
+        """
+        Build the burn-ins naming the context of the rendered media, cached until the
+        context changes.
+
+        :returns:               The ``top_left`` and ``top_right`` burn-ins, the names of
+                                the project and of the entity.
+        :rtype:                 dict
+        """
+
+        def get_context_burnins():
+            ctx = self.parent.context
+            return {
+                "top_left": ctx.project["name"] if ctx.project else None,
+                "top_right": ctx.entity["name"] if ctx.entity else None,
+            }
+
+        return dict(
+            self.parent.context_cache.get("context_burnins", get_context_burnins)
+        )
+
+    def _get_version_label(self, version):
+        """
+        Build the version label burnt in the rendered media.
+
+        :param int version:         Version number of the media being rendered
+
+        :returns:               Version label, e.g. ``comp, v003``
+        :rtype:                 str
+        """
+
+        def get_version_label_prefix():
+            ctx = self.parent.context
+            if ctx.task:
+                return "%s, " % ctx.task["name"]
+            elif ctx.step:
+                return "%s, " % ctx.step["name"]
+            return ""
+
+        prefix = self.parent.context_cache.get(
+            "version_label_prefix", get_version_label_prefix
+        )
+        return "%sv%s" % (prefix, self._get_version_string(version))
+
+    def _get_slate_text(self, name, version, first_frame, last_frame):
+        """
+        Build the text of the slate of the rendered media.
+
+        :param str name:            Name of the media being rendered
+        :param int version:         Version number of the media being rendered
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+
+        :returns:               Slate text, one information per line
+        :rtype:                 str
+        """
+
+        def get_slate_context_lines():
+            ctx = self.parent.context
+            header = "Project: %s\n" % ctx.project["name"]
+            header += "%s: %s\n" % (ctx.entity["type"], ctx.entity["name"])
+
+            task = ""
+            if ctx.task:
+                task = "Task: %s\n" % ctx.task["name"]
+            elif ctx.step:
+                task = "Step: %s\n" % ctx.step["name"]
+            return header, task
+
+        header, task = self.parent.context_cache.get(
+            "slate_context_lines", get_slate_context_lines
+        )
+
+        slate_str = header
+        slate_str += "Name: %s\n" % name.capitalize()
+        slate_str += "Version: %s\n" % self._get_version_string(version)
+        slate_str += task
+        slate_str += "Frames: %s - %s\n" % (first_frame, last_frame)
+
+        return slate_str
+
+    def _get_version_string(self, version):
+        """
+        Pad the version number as configured by the ``version_number_padding`` setting.
+
+        :param int version:         Version number of the media being rendered
+
+        :returns:               Padded version number
+        :rtype:                 str
+        """
+        version_padding_format = self.parent.context_cache.get(
+            "version_padding_format",
+            lambda: "%%0%dd" % self.parent.get_setting("version_number_padding"),
+        )
+        return version_padding_format % version
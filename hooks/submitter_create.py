@@ -12,6 +12,8 @@
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
+import os
+
 HookBaseClass = sgtk.get_hook_baseclass()
 
 
@@ -60,6 +62,36 @@ class SubmitterCreate(HookBaseClass):
 
         return True
 
+    def find_submitted_version(self, fingerprint, sg_publishes):
+        """
+        Create doesn't index the Versions it creates, so no media is found already
+        submitted.
+
+        :param str fingerprint: Fingerprint of the content of the media ( Unused )
+        :param list(dict) sg_publishes: Published files to link to the version ( Unused )
+
+        :returns:               None
+        """
+        return None
+
+    def create_pending_version(
+        self, path_to_frames, name, sg_task, description, first_frame, last_frame
+    ):
+        """
+        Create creates the Version by itself once the media is rendered, so no Version
+        is created while the media is being rendered.
+
+        :param str path_to_frames: Path to the frames ( Unused )
+        :param str name: Name of the Version ( Unused )
+        :param dict sg_task: Task that have to be linked to the version ( Unused )
+        :param str description: Description of the version ( Unused )
+        :param int first_frame: Version first frame ( Unused )
+        :param int last_frame: Version last frame ( Unused )
+
+        :returns:               None
+        """
+        return None
+
     def submit_version(
         self,
         path_to_frames,
@@ -70,6 +102,9 @@ class SubmitterCreate(HookBaseClass):
         description,
         first_frame,
         last_frame,
+        movie_destination=None,
+        fingerprint=None,
+        additional_outputs=None,
     ):
         """
         Create a version in Shotgun for a given path and linked to the specified publishes.
@@ -82,6 +117,13 @@ class SubmitterCreate(HookBaseClass):
         :param str description: Description of the version.
         :param int first_frame: Version first frame ( Unused )
         :param int last_frame: Version last frame ( Unused )
+        :param str movie_destination: Final location of the movie when it was rendered to the
+                                      scratch space. The movie is moved there before being
+                                      handed over to Create.
+        :param str fingerprint: Fingerprint of the content of the media ( Unused )
+        :param list(dict) additional_outputs: Additional media rendered along with the movie.
+                                Create builds its own derived media, so they are only
+                                removed.
 
         Note: Shotgun Create will create the thumbnail for the movie passed in and
         will inspect the media to get the first and last frame, so these parameters are ignored.
@@ -92,6 +134,25 @@ class SubmitterCreate(HookBaseClass):
         Because of the asynchronous nature of this hook. It doesn't returns any Version Shotgun entity dictionary.
         """
 
+        if path_to_movie and movie_destination:
+            app_module = self.__app.import_module("tk_multi_reviewsubmission")
+            destination = self.__app.storage.open(movie_destination)
+            try:
+                app_module.fan_out(path_to_movie, [destination])
+                destination.close()
+            except Exception:
+                destination.abort()
+                raise
+
+            # Create reads the movie by itself, from the scratch space when the movie
+            # was stored in an object storage.
+            if self.__app.storage.is_local:
+                self.__app.scratch_space.release(path_to_movie)
+                path_to_movie = movie_destination
+
+        for output in additional_outputs or []:
+            self.__app.scratch_space.release(output["path"])
+
         path_to_media = path_to_movie or path_to_frames
 
         # Starts Shotgun Create in the right context if not already running.
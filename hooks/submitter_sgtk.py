@@ -13,6 +13,7 @@ import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
 import os
+import time
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
@@ -29,6 +30,7 @@ class SubmitterSGTK(HookBaseClass):
 
         self._upload_to_shotgun = self.__app.get_setting("upload_to_shotgun")
         self._store_on_disk = self.__app.get_setting("store_on_disk")
+        self._checksum_field = self.__app.get_setting("movie_checksum_field")
 
     def can_submit(self):
         """
@@ -63,6 +65,10 @@ class SubmitterSGTK(HookBaseClass):
         description,
         first_frame,
         last_frame,
+        movie_destination=None,
+        fingerprint=None,
+        additional_outputs=None,
+        pending_version=None,
     ):
         """
         Create a version in Shotgun for a given path and linked to the specified publishes.
@@ -75,13 +81,219 @@ class SubmitterSGTK(HookBaseClass):
         :param str description: Description of the version.
         :param int first_frame: Version first frame.
         :param int last_frame: Version last frame.
+        :param str movie_destination: Final location of the movie when it was rendered to the
+                                      scratch space. The movie is copied there while being
+                                      uploaded, from a single read of the rendered movie.
+        :param str fingerprint: Fingerprint of the content of the movie. When a Version was
+                                already submitted with the same fingerprint, it is returned
+                                instead of creating a new one, see :meth:`_find_duplicate`.
+        :param list(dict) additional_outputs: Additional media rendered along with the movie,
+                                with their ``kind`` and ``path``, and the ``field`` to upload
+                                the movies to. They are removed once uploaded.
+        :param dict pending_version: Version created by :meth:`create_pending_version` while
+                                the media was rendered, completed instead of creating a new
+                                one.
 
         :returns:               The Version Shotgun entity dictionary that was created.
         :rtype:                 dict
         """
 
+        if fingerprint:
+            sg_version = self._find_duplicate(fingerprint)
+            if sg_version:
+                self.__app.log_info(
+                    "%s was already submitted as Version %s, skipping its upload."
+                    % (path_to_movie, sg_version["id"])
+                )
+                self._link_publishes(sg_version, sg_publishes)
+                if pending_version:
+                    self.discard_pending_version(pending_version)
+
+                # The stored movie, if any, is the one of the existing Version.
+                if (not self._store_on_disk or movie_destination) and os.path.exists(
+                    path_to_movie
+                ):
+                    self.__app.scratch_space.release(path_to_movie)
+                self._release_additional_outputs(additional_outputs)
+
+                return sg_version
+
+        # The fields only known once the media is rendered.
+        data = {"sg_status_list": self.__app.get_setting("new_version_status")}
+
+        sg_publishes = [self._get_link(sg_publish) for sg_publish in sg_publishes]
+        if self._get_published_file_entity_type() == "PublishedFile":
+            data["published_files"] = sg_publishes
+        else:  # == "TankPublishedFile"
+            if len(sg_publishes) > 0:
+                if len(sg_publishes) > 1:
+                    self.__app.log_warning(
+                        "Only the first publish of %d can be registered for the new version!"
+                        % len(sg_publishes)
+                    )
+                data["tank_published_file"] = sg_publishes[0]
+
+        if self._store_on_disk:
+            data["sg_path_to_movie"] = (
+                self.__app.storage.get_location(movie_destination)
+                if movie_destination
+                else path_to_movie
+            )
+
+        app_module = self.__app.import_module("tk_multi_reviewsubmission")
+        if pending_version:
+            # Complete the Version created while the media was rendered, its other
+            # fields being set already.
+            data = self._filter_version_fields(data)
+            with app_module.trace_span(
+                "complete_version", version_id=pending_version["id"]
+            ):
+                sg_version = dict(
+                    pending_version,
+                    **self.__app.sgtk.shotgun.update(
+                        "Version", pending_version["id"], data
+                    ),
+                )
+            self.__app.log_debug("Completed version in shotgun: %s" % str(data))
+        else:
+            version_data = self._get_version_data(
+                path_to_frames,
+                path_to_movie,
+                sg_task,
+                description,
+                first_frame,
+                last_frame,
+            )
+            version_data.update(data)
+            data = self._filter_version_fields(version_data)
+            with app_module.trace_span("create_version") as span:
+                sg_version = self.__app.sgtk.shotgun.create("Version", data)
+                if span:
+                    span.set_attribute("version_id", sg_version["id"])
+            self.__app.log_debug("Created version in shotgun: %s" % str(data))
+
+        # upload files:
+        stored, checksum, uploaded = self._upload_files(
+            sg_version,
+            path_to_movie,
+            thumbnail_path,
+            movie_destination,
+            additional_outputs,
+        )
+
+        # Only Versions with their media are worth being found again.
+        if fingerprint and uploaded:
+            self._get_content_index().add(fingerprint, sg_version)
+
+        if checksum and self._checksum_field:
+            if self._checksum_field in self._get_version_fields():
+                self.__app.sgtk.shotgun.update(
+                    "Version", sg_version["id"], {self._checksum_field: checksum}
+                )
+                sg_version[self._checksum_field] = checksum
+            else:
+                self.__app.log_warning(
+                    "Not storing the checksum of %s, the movie_checksum_field %s isn't "
+                    "a field of the Version entity."
+                    % (path_to_movie, self._checksum_field)
+                )
+
+        # Remove from filesystem if required. A movie which failed to be copied to its
+        # final location is kept on the scratch space so it can be recovered.
+        if (
+            not self._store_on_disk or (movie_destination and stored)
+        ) and os.path.exists(path_to_movie):
+            self.__app.scratch_space.release(path_to_movie)
+        self._release_additional_outputs(additional_outputs)
+
+        return sg_version
+
+    def find_submitted_version(self, fingerprint, sg_publishes):
+        """
+        Find a Version already submitted for the same content, before its media is
+        rendered, so the render and the upload are skipped. The publishes are linked to
+        the Version found.
+
+        :param str fingerprint: Fingerprint of the content of the movie, see
+                                :meth:`_find_duplicate`.
+        :param list(dict) sg_publishes: Published files that have to be linked to the version.
+
+        :returns:               The Version Shotgun entity dictionary, None if the content
+                                wasn't submitted yet.
+        :rtype:                 dict
+        """
+        sg_version = self._find_duplicate(fingerprint)
+        if sg_version:
+            self._link_publishes(sg_version, sg_publishes)
+        return sg_version
+
+    def create_pending_version(
+        self, path_to_frames, name, sg_task, description, first_frame, last_frame
+    ):
+        """
+        Create the Version of a media while it is being rendered, in the status of the
+        ``pending_version_status`` setting, so the round trip to the site overlaps the
+        render and the reviewers see the Version coming. :meth:`submit_version`
+        completes it once the media is rendered.
+
+        :param str path_to_frames: Path to the frames.
+        :param str name: Name of the Version, e.g. the file name of the movie.
+        :param dict sg_task: Task that have to be linked to the version.
+        :param str description: Description of the version.
+        :param int first_frame: Version first frame.
+        :param int last_frame: Version last frame.
+
+        :returns:               The Version Shotgun entity dictionary that was created.
+        :rtype:                 dict
+        """
+        data = self._get_version_data(
+            path_to_frames, name, sg_task, description, first_frame, last_frame
+        )
+        data["sg_status_list"] = self.__app.get_setting("pending_version_status")
+
+        sg_version = self.__app.sgtk.shotgun.create(
+            "Version", self._filter_version_fields(data)
+        )
+        self.__app.log_debug("Created pending version in shotgun: %s" % str(data))
+        return sg_version
+
+    def discard_pending_version(self, pending_version):
+        """
+        Delete a Version created by :meth:`create_pending_version` which won't be
+        completed, e.g. when its media failed to render.
+
+        :param dict pending_version: The Version entity dictionary.
+        """
+        self.__app.sgtk.shotgun.delete("Version", pending_version["id"])
+        self.__app.log_debug("Deleted pending version %s" % pending_version["id"])
+
+    def _get_version_data(
+        self,
+        path_to_frames,
+        path_to_movie,
+        sg_task,
+        description,
+        first_frame,
+        last_frame,
+    ):
+        """
+        Build the fields of a Version known before its media is rendered, linking the
+        entities by type and id only to keep the requests small.
+
+        :param str path_to_frames: Path to the frames.
+        :param str path_to_movie: Path to the movie, or name of the media.
+        :param dict sg_task: Task that have to be linked to the version.
+        :param str description: Description of the version.
+        :param int first_frame: Version first frame.
+        :param int last_frame: Version last frame.
+
+        :returns:               The fields of the Version.
+        :rtype:                 dict
+        """
         # get current shotgun user
-        current_user = sgtk.util.get_current_user(self.__app.sgtk)
+        current_user = self.__app.session_cache.get(
+            "current_user", lambda: sgtk.util.get_current_user(self.__app.sgtk)
+        )
 
         # create a name for the version based on the file name
         # grab the file name, strip off extension
@@ -91,76 +303,223 @@ class SubmitterSGTK(HookBaseClass):
         # and capitalize
         name = name.capitalize()
 
-        # Create the version in Shotgun
         ctx = self.__app.context
         data = {
             "code": name,
             "sg_status_list": self.__app.get_setting("new_version_status"),
-            "entity": ctx.entity,
-            "sg_task": sg_task,
+            "entity": self._get_link(ctx.entity),
+            "sg_task": self._get_link(sg_task),
             "sg_first_frame": first_frame,
             "sg_last_frame": last_frame,
             "sg_frames_have_slate": False,
-            "created_by": current_user,
-            "user": current_user,
+            "created_by": self._get_link(current_user),
+            "user": self._get_link(current_user),
             "description": description,
             "sg_path_to_frames": path_to_frames,
             "sg_movie_has_slate": True,
-            "project": ctx.project,
+            "project": self._get_link(ctx.project),
         }
 
         if first_frame and last_frame:
             data["frame_count"] = last_frame - first_frame + 1
             data["frame_range"] = "%s-%s" % (first_frame, last_frame)
 
-        if sgtk.util.get_published_file_entity_type(self.__app.sgtk) == "PublishedFile":
-            data["published_files"] = sg_publishes
-        else:  # == "TankPublishedFile"
-            if len(sg_publishes) > 0:
-                if len(sg_publishes) > 1:
-                    self.__app.log_warning(
-                        "Only the first publish of %d can be registered for the new version!"
-                        % len(sg_publishes)
-                    )
-                data["tank_published_file"] = sg_publishes[0]
-
-        if self._store_on_disk:
-            data["sg_path_to_movie"] = path_to_movie
+        return data
 
-        sg_version = self.__app.sgtk.shotgun.create("Version", data)
-        self.__app.log_debug("Created version in shotgun: %s" % str(data))
+    def _filter_version_fields(self, data):
+        """
+        Leave out the fields the site doesn't have, e.g. frame_range, with a warning so
+        a misnamed or removed field doesn't go unnoticed.
 
-        # upload files:
-        self._upload_files(sg_version, path_to_movie, thumbnail_path)
+        :param dict data:       The fields of a Version.
 
-        # Remove from filesystem if required
-        if not self._store_on_disk and os.path.exists(path_to_movie):
-            os.unlink(path_to_movie)
+        :returns:               The fields the Version entity has.
+        :rtype:                 dict
+        """
+        version_fields = self._get_version_fields()
+        for field_name in [key for key in data if key not in version_fields]:
+            self.__app.log_warning(
+                "Skipping %s, which isn't a field of the Version entity." % field_name
+            )
+            del data[field_name]
+        return data
+
+    def _release_additional_outputs(self, additional_outputs):
+        """
+        Remove the additional outputs from the scratch space.
 
-        return sg_version
+        :param list(dict) additional_outputs: The additional outputs. Can be None.
+        """
+        for output in additional_outputs or []:
+            self.__app.scratch_space.release(output["path"])
 
-    def _upload_files(self, sg_version, output_path, thumbnail_path):
+    def _upload_files(
+        self,
+        sg_version,
+        output_path,
+        thumbnail_path,
+        movie_destination=None,
+        additional_outputs=None,
+    ):
         """
         Upload the required files to Shotgun.
 
         :param dict sg_version:      Version to which uploaded files should be linked.
         :param str output_path:     Media to upload to Shotgun.
         :param str thumbnail_path:  Thumbnail to upload to Shotgun.
+        :param str movie_destination: Location to copy the media to while uploading it.
+        :param list(dict) additional_outputs: Additional media to upload to Shotgun.
+
+        :returns:               Whether the media was copied to its destination, its
+                                SHA-256 checksum if it was computed, and whether all the
+                                files were uploaded and copied without errors.
+        :rtype:                 tuple(bool, str, bool)
         """
         # Upload in a new thread and make our own event loop to wait for the
         # thread to finish.
         event_loop = QtCore.QEventLoop()
         thread = UploaderThread(
-            self.__app, sg_version, output_path, thumbnail_path, self._upload_to_shotgun
+            self.__app,
+            sg_version,
+            output_path,
+            thumbnail_path,
+            self._upload_to_shotgun,
+            movie_destination,
+            bool(self._checksum_field),
+            additional_outputs,
         )
         thread.finished.connect(event_loop.quit)
+
+        # Poll the progress of the transfer from the main thread, the reports are
+        # throttled before reaching the progress callback.
+        report_progress = self.__app.import_module(
+            "tk_multi_reviewsubmission"
+        ).report_progress
+        progress_timer = QtCore.QTimer()
+        progress_timer.setInterval(100)
+        progress_timer.timeout.connect(
+            lambda: report_progress(thread.get_progress(), "Uploading movie")
+        )
+
         thread.start()
-        event_loop.exec_()
+        progress_timer.start()
+        try:
+            event_loop.exec_()
+        finally:
+            progress_timer.stop()
 
         # log any errors generated in the thread
         for e in thread.get_errors():
             self.__app.log_error(e)
 
+        return thread.is_movie_stored(), thread.get_checksum(), not thread.get_errors()
+
+    def _find_duplicate(self, fingerprint):
+        """
+        Find a Version already submitted for the same content in the local content index.
+
+        Unless the ``confirm_duplicates_on_server`` setting is disabled, the Versions found
+        in the index are checked with a single query, so the Versions deleted from the site
+        are ignored and removed from the index.
+
+        :param str fingerprint: Fingerprint of the content.
+
+        :returns:               The most recent Version submitted for the content, None if
+                                there is none.
+        :rtype:                 dict
+        """
+        index = self._get_content_index()
+        candidates = index.find(fingerprint)
+        if not candidates:
+            return None
+
+        if not self.__app.get_setting("confirm_duplicates_on_server"):
+            return candidates[0]
+
+        candidate_ids = [candidate["id"] for candidate in candidates]
+        sg_versions = self.__app.sgtk.shotgun.find(
+            "Version",
+            [["id", "in", candidate_ids]],
+            ["code", "entity", "sg_task", "project"],
+            order=[{"field_name": "id", "direction": "desc"}],
+        )
+
+        stale_ids = set(candidate_ids) - set(
+            sg_version["id"] for sg_version in sg_versions
+        )
+        if stale_ids:
+            index.discard(fingerprint, stale_ids)
+
+        return sg_versions[0] if sg_versions else None
+
+    def _link_publishes(self, sg_version, sg_publishes):
+        """
+        Link publishes to an existing Version.
+
+        :param dict sg_version: The Version entity dictionary.
+        :param list(dict) sg_publishes: Published files to link to the Version.
+        """
+        if not sg_publishes:
+            return
+
+        if self._get_published_file_entity_type() != "PublishedFile":
+            return
+
+        self.__app.sgtk.shotgun.update(
+            "Version",
+            sg_version["id"],
+            {
+                "published_files": [
+                    self._get_link(sg_publish) for sg_publish in sg_publishes
+                ]
+            },
+            multi_entity_update_modes={"published_files": "add"},
+        )
+
+    def _get_published_file_entity_type(self):
+        """
+        :returns:               The published file entity type of the site, cached for
+                                the session.
+        :rtype:                 str
+        """
+        return self.__app.session_cache.get(
+            "published_file_entity_type",
+            lambda: sgtk.util.get_published_file_entity_type(self.__app.sgtk),
+        )
+
+    def _get_version_fields(self):
+        """
+        :returns:               The names of the fields of the Version entity, cached for
+                                the session.
+        :rtype:                 set(str)
+        """
+        return self.__app.session_cache.get(
+            "version_fields",
+            lambda: set(self.__app.sgtk.shotgun.schema_field_read("Version")),
+        )
+
+    def _get_link(self, entity):
+        """
+        Strip an entity dictionary down to its type and id.
+
+        :param dict entity:     The entity dictionary. Can be None.
+
+        :returns:               The entity link, None if no entity was given.
+        :rtype:                 dict
+        """
+        if not entity:
+            return None
+        return {"type": entity["type"], "id": entity["id"]}
+
+    def _get_content_index(self):
+        """
+        :returns:               The local index of the submitted content.
+        :rtype:                 :class:`~tk_multi_reviewsubmission.ContentIndex`
+        """
+        return self.__app.import_module("tk_multi_reviewsubmission").ContentIndex(
+            os.path.join(self.__app.cache_location, "content_index.db")
+        )
+
 
 class UploaderThread(QtCore.QThread):
     """
@@ -169,14 +528,36 @@ class UploaderThread(QtCore.QThread):
     even though an upload is happening.
     """
 
-    def __init__(self, app, version, path_to_movie, thumbnail_path, upload_to_shotgun):
+    def __init__(
+        self,
+        app,
+        version,
+        path_to_movie,
+        thumbnail_path,
+        upload_to_shotgun,
+        movie_destination=None,
+        checksum_required=False,
+        additional_outputs=None,
+    ):
         QtCore.QThread.__init__(self)
         self._app = app
         self._version = version
         self._path_to_movie = path_to_movie
         self._thumbnail_path = thumbnail_path
         self._upload_to_shotgun = upload_to_shotgun
+        self._movie_destination = movie_destination
+        self._checksum_required = checksum_required
+        self._additional_outputs = additional_outputs or []
+        self._movie_stored = False
+        self._checksum = None
         self._errors = []
+        self._byte_counter = None
+        self._movie_size = 0
+
+        # Traced as a child of the span which started the upload.
+        self._trace_parent = app.import_module(
+            "tk_multi_reviewsubmission"
+        ).get_current_span()
 
     def get_errors(self):
         """
@@ -187,15 +568,70 @@ class UploaderThread(QtCore.QThread):
         """
         return self._errors
 
+    def is_movie_stored(self):
+        """
+        Returns whether the movie was copied to its destination.
+
+        :returns:   True if the movie was copied
+        :rtype:     bool
+        """
+        return self._movie_stored
+
+    def get_checksum(self):
+        """
+        Returns the SHA-256 checksum of the movie computed while uploading or copying it.
+
+        :returns:   Checksum of the movie, None if it wasn't computed
+        :rtype:     str
+        """
+        return self._checksum
+
+    def get_progress(self):
+        """
+        Returns the fraction of the movie read so far to be copied, uploaded or hashed.
+
+        :returns:   Fraction of the movie read, between 0 and 1
+        :rtype:     float
+        """
+        if not self._byte_counter or not self._movie_size:
+            return 0.0
+        return min(float(self._byte_counter.bytes_written) / self._movie_size, 1.0)
+
     def run(self):
         """
         This function implements what get executed in the UploaderThread.
+
+        The movie is read once, in fixed size chunks, and each chunk feeds the checksum of
+        the movie, its copy to its destination in the storage of the app and, when the
+        site supports it, its upload to Shotgun. The memory used doesn't depend on the
+        size of the movie.
+        """
+        app_module = self._app.import_module("tk_multi_reviewsubmission")
+        with app_module.attach_span(self._trace_parent), app_module.trace_span(
+            "upload_files", version_id=self._version["id"]
+        ):
+            self._upload_files(app_module)
+
+    def _upload_files(self, app_module):
+        """
+        Copy, hash and upload the movie, then upload the additional outputs and the
+        thumbnail, see :meth:`run`.
+
+        :param app_module:  The ``tk_multi_reviewsubmission`` module.
         """
+        sg = self._app.sgtk.shotgun
+
+        checksum = app_module.ChecksumSink()
+        destination = self._open_destination()
+        upload_sink = None
         upload_error = False
 
-        if self._upload_to_shotgun:
+        if self._upload_to_shotgun and app_module.ShotgunUploadSink.is_supported(
+            sg, "Version", "sg_uploaded_movie"
+        ):
             try:
-                self._app.sgtk.shotgun.upload(
+                upload_sink = app_module.ShotgunUploadSink(
+                    sg,
                     "Version",
                     self._version["id"],
                     self._path_to_movie,
@@ -205,10 +641,178 @@ class UploaderThread(QtCore.QThread):
                 self._errors.append("Movie upload to PTR failed: %s" % e)
                 upload_error = True
 
-        if not self._upload_to_shotgun or upload_error:
+        sinks = [sink for sink in (destination, upload_sink) if sink]
+        if sinks or self._checksum_required:
+            sinks.append(checksum)
+
+        failed_sinks = {}
+        start_time = time.monotonic()
+        try:
+            if sinks:
+                self._movie_size = os.path.getsize(self._path_to_movie)
+                self._byte_counter = app_module.ByteCounterSink()
+                with app_module.trace_span(
+                    "stream_movie",
+                    size=self._movie_size,
+                    stored=bool(destination),
+                    uploaded=bool(upload_sink),
+                ):
+                    app_module.fan_out(
+                        self._path_to_movie,
+                        sinks + [self._byte_counter],
+                        on_error=failed_sinks.__setitem__,
+                    )
+        except Exception as e:
+            # The movie couldn't be read, all the sinks failed.
+            failed_sinks = dict((sink, e) for sink in sinks)
+
+        if destination:
+            if destination not in failed_sinks:
+                try:
+                    with app_module.trace_span("store_movie"):
+                        destination.close()
+                    self._movie_stored = True
+                except Exception as e:
+                    failed_sinks[destination] = e
+            else:
+                destination.abort()
+
+            if destination in failed_sinks:
+                self._errors.append(
+                    "Movie copy to %s failed, the rendered movie was kept at %s: %s"
+                    % (
+                        self._movie_destination,
+                        self._path_to_movie,
+                        failed_sinks[destination],
+                    )
+                )
+
+        if checksum in sinks and checksum not in failed_sinks:
+            self._checksum = checksum.hexdigest()
+            self._app.log_debug(
+                "Checksum of %s: sha256 %s" % (self._path_to_movie, self._checksum)
+            )
+
+        if upload_sink:
+            error = failed_sinks.get(upload_sink)
+            if error is None:
+                try:
+                    with app_module.trace_span("attach_movie"):
+                        upload_sink.close()
+                except Exception as e:
+                    error = e
+            if error is not None:
+                self._errors.append("Movie upload to PTR failed: %s" % error)
+                upload_error = True
+            else:
+                # Measured over the whole read of the movie, which the upload usually
+                # paces rather than its copy.
+                self._app.upload_bandwidth.record(
+                    self._movie_size, time.monotonic() - start_time
+                )
+
+        elif self._upload_to_shotgun and not upload_error:
+            # The site doesn't support streamed uploads, let the Shotgun API read the movie.
             try:
-                self._app.sgtk.shotgun.upload_thumbnail(
-                    "Version", self._version["id"], self._thumbnail_path
+                start_time = time.monotonic()
+                with app_module.trace_span("upload_movie"):
+                    sg.upload(
+                        "Version",
+                        self._version["id"],
+                        self._path_to_movie,
+                        "sg_uploaded_movie",
+                    )
+                self._app.upload_bandwidth.record(
+                    os.path.getsize(self._path_to_movie), time.monotonic() - start_time
                 )
+            except Exception as e:
+                self._errors.append("Movie upload to PTR failed: %s" % e)
+                upload_error = True
+
+        thumbnail_uploaded = self._upload_additional_outputs(sg, app_module)
+
+        if (not self._upload_to_shotgun or upload_error) and not thumbnail_uploaded:
+            try:
+                with app_module.trace_span("upload_thumbnail"):
+                    sg.upload_thumbnail(
+                        "Version", self._version["id"], self._thumbnail_path
+                    )
             except Exception as e:
                 self._errors.append("Thumbnail upload to PTR failed: %s" % e)
+
+    def _upload_additional_outputs(self, sg, app_module):
+        """
+        Upload the additional outputs rendered along with the movie: the movies to their
+        field, the thumbnail and the filmstrip as the ones of the Version. The outputs
+        the render media hook didn't render are skipped.
+
+        :param sg:  Shotgun API instance.
+        :param app_module:  The ``tk_multi_reviewsubmission`` module.
+
+        :returns:   Whether a thumbnail was uploaded
+        :rtype:     bool
+        """
+        thumbnail_uploaded = False
+        for output in self._additional_outputs:
+            if not os.path.isfile(output["path"]):
+                self._app.log_debug(
+                    "Skipping the %s output, which wasn't rendered." % output["name"]
+                )
+                continue
+
+            try:
+                with app_module.trace_span(
+                    "upload_%s" % output["name"], kind=output["kind"]
+                ):
+                    thumbnail_uploaded |= self._upload_additional_output(sg, output)
+            except Exception as e:
+                self._errors.append(
+                    "Upload of the %s output to PTR failed: %s" % (output["name"], e)
+                )
+
+        return thumbnail_uploaded
+
+    def _upload_additional_output(self, sg, output):
+        """
+        Upload an additional output.
+
+        :param sg:  Shotgun API instance.
+        :param dict output: The additional output.
+
+        :returns:   Whether the output was uploaded as the thumbnail
+        :rtype:     bool
+        """
+        if output["kind"] == "thumbnail":
+            sg.upload_thumbnail("Version", self._version["id"], output["path"])
+            return True
+
+        if output["kind"] == "filmstrip":
+            sg.upload_filmstrip_thumbnail(
+                "Version", self._version["id"], output["path"]
+            )
+        elif output.get("field"):
+            sg.upload("Version", self._version["id"], output["path"], output["field"])
+        else:
+            self._app.log_warning(
+                "No field to upload the %s output to." % output["name"]
+            )
+        return False
+
+    def _open_destination(self):
+        """
+        Open the destination of the movie for writing, in the storage of the app.
+
+        :returns:   The sink writing the movie to its destination, None if the movie
+                    doesn't have to be copied or if the destination can't be opened.
+        """
+        if not self._movie_destination:
+            return None
+
+        try:
+            return self._app.storage.open(self._movie_destination)
+        except Exception as e:
+            self._errors.append(
+                "Movie copy to %s failed, the rendered movie was kept at %s: %s"
+                % (self._movie_destination, self._path_to_movie, e)
+            )
+            return None
@@ -11,6 +11,8 @@
 
 import sgtk
 import maya
+import maya.OpenMaya
+import contextlib
 import os
 import re
 import json
@@ -38,6 +40,8 @@ class RenderMedia(HookBaseClass):
         version,
         name,
         color_space,
+        additional_outputs=None,
+        encode_settings=None,
     ):
         """
         Render the media using the Maya Playblast API
@@ -51,27 +55,260 @@ class RenderMedia(HookBaseClass):
         :param int version:         Version number to use for the output movie slate and burn-in
         :param str name:            Name to use in the slate for the output movie
         :param str color_space:     Colorspace of the input frames              (Unused)
+        :param list(dict) additional_outputs: Additional media                  (Unused)
+        :param dict encode_settings: Settings fitting the upload of the movie to the
+                                    ``upload_time_budget`` setting. Only its ``scale`` is
+                                    applied, to the size of the playblast.
 
         :returns:               Location of the rendered media
         :rtype:                 str
         """
 
+        name = self._get_media_name(name)
+
+        if not output_path:
+            output_path = self._get_temp_media_path(name, version, "")
+
+        playblast_args = self.get_default_playblastlast_args(output_path)
+        self._apply_encode_settings(playblast_args, encode_settings)
+
+        return self._playblast(playblast_args)
+
+    def render_frames(
+        self,
+        input_path,
+        output_path,
+        width,
+        height,
+        first_frame,
+        last_frame,
+        version,
+        name,
+        color_space,
+        additional_outputs=None,
+        encode_settings=None,
+    ):
+        """
+        Playblast a JPEG image sequence to the scratch space of the app, so the movie can be
+        encoded in the background and the artist gets the control back right after the
+        viewport capture.
+
+        :param str input_path:      Path to the input frames for the movie      (Unused)
+        :param str output_path:     Path to the output movie that will be rendered (Unused)
+        :param int width:           Width of the output movie                   (Unused)
+        :param int height:          Height of the output movie                  (Unused)
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+        :param int version:         Version number to use for the output movie slate and burn-in
+        :param str name:            Name to use in the slate for the output movie
+        :param str color_space:     Colorspace of the input frames              (Unused)
+        :param list(dict) additional_outputs: Additional media, encoded from the captured frames
+        :param dict encode_settings: Settings the captured frames are encoded with   (Unused)
+
+        :returns:               The captured frames ``input_path``, ``first_frame``,
+                                ``last_frame`` and ``frame_rate``, along with the media ``name``.
+        :rtype:                 dict
+        """
+
+        name = self._get_media_name(name)
+        frames_prefix = self.parent.scratch_space.allocate(
+            os.path.splitext(name)[0] or "frames"
+        )
+
+        playblast_args = self.get_default_playblastlast_args(frames_prefix)
+        playblast_args["format"] = "image"
+        playblast_args["compression"] = "jpg"
+        playblast_args.setdefault("framePadding", 4)
+
+        if first_frame is not None and last_frame is not None:
+            playblast_args["startTime"] = float(first_frame)
+            playblast_args["endTime"] = float(last_frame)
+        elif "startTime" not in playblast_args:
+            playblast_args["startTime"] = maya.cmds.playbackOptions(
+                query=True, minTime=True
+            )
+            playblast_args["endTime"] = maya.cmds.playbackOptions(
+                query=True, maxTime=True
+            )
+
+        self.logger.info(
+            "Writing playblast frames to: %s using (%s)"
+            % (frames_prefix, playblast_args)
+        )
+        with self._report_playblast_progress(playblast_args):
+            maya.cmds.playblast(**playblast_args)
+
+        return {
+            "input_path": "%s.%%0%dd.jpg"
+            % (frames_prefix, playblast_args["framePadding"]),
+            "first_frame": int(playblast_args["startTime"]),
+            "last_frame": int(playblast_args["endTime"]),
+            "frame_rate": maya.mel.eval("currentTimeUnitToFPS"),
+            "name": name,
+            "temporary": True,
+        }
+
+    def render_batch(self, items):
+        """
+        Render the media of several items in a single offscreen playblast session.
+
+        The playblast settings are collected once and the same model editor is reused
+        for all the captures, only switching its camera between the items, so the
+        viewport and the evaluation caches are kept warm from one capture to the next.
+
+        :param list(dict) items:    Items to render. On top of the :meth:`render` arguments,
+                                    each item can provide the ``camera`` to playblast through.
+
+        :returns:               Location of the rendered media of each item
+        :rtype:                 list(str)
+        """
+
+        if not items:
+            return []
+
+        default_playblast_args = self.get_default_playblastlast_args(None)
+        default_playblast_args["offScreen"] = True
+
+        # Playblast the same editor for all the items.
+        editor = maya.cmds.playblast(activeEditor=True)
+        panel = maya.cmds.modelEditor(editor, query=True, panel=True)
+        default_playblast_args["editorPanelName"] = panel
+        original_camera = maya.cmds.modelEditor(editor, query=True, camera=True)
+
+        output_paths = []
+        try:
+            for index, item in enumerate(items):
+                name = self._get_media_name(item["name"])
+
+                output_path = item["output_path"]
+                if not output_path:
+                    output_path = self._get_temp_media_path(name, item["version"], "")
+
+                playblast_args = dict(default_playblast_args, filename=output_path)
+                self._apply_encode_settings(playblast_args, item.get("encode_settings"))
+
+                if item["first_frame"] is not None and item["last_frame"] is not None:
+                    playblast_args["startTime"] = float(item["first_frame"])
+                    playblast_args["endTime"] = float(item["last_frame"])
+
+                # Only the first capture is allowed to clear the playblast cache.
+                if index:
+                    playblast_args["clearCache"] = False
+
+                if item.get("camera"):
+                    maya.cmds.modelEditor(editor, edit=True, camera=item["camera"])
+
+                output_paths.append(
+                    self._playblast(playblast_args, index=index, count=len(items))
+                )
+        finally:
+            maya.cmds.modelEditor(editor, edit=True, camera=original_camera)
+
+        return output_paths
+
+    def get_rendered_frame_count(self, first_frame, last_frame):
+        """
+        Get the number of frames of the movie rendered for a frame range. The playblasts
+        have no slate, unlike the movies encoded in the background from the captured
+        frames.
+
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+
+        :returns:               Number of frames of the movie.
+        :rtype:                 int
+        """
+        if self.parent.get_setting("background_encode"):
+            return super().get_rendered_frame_count(first_frame, last_frame)
+        return last_frame - first_frame + 1
+
+    def _apply_encode_settings(self, playblast_args, encode_settings):
+        """
+        Scale the playblast down to fit the upload of the movie to the
+        ``upload_time_budget`` setting. The bitrate of the playblast can't be set, its
+        compression being the one of the playblast options.
+
+        :param dict playblast_args: Playblast arguments, updated in place.
+        :param dict encode_settings: The encode settings of the movie. Can be None.
+        """
+        if not encode_settings or encode_settings["scale"] >= 1.0:
+            return
+
+        percent = playblast_args.get("percent", 100)
+        playblast_args["percent"] = max(int(percent * encode_settings["scale"]), 1)
+        self.logger.info(
+            "Playblasting at %d%% to fit the upload time budget."
+            % playblast_args["percent"]
+        )
+
+    def _get_media_name(self, name):
+        """
+        Get the name of the media, falling back on the scene name for unnamed media.
+
+        :param str name:            Name to use in the slate for the output movie
+
+        :returns:               Name of the media
+        :rtype:                 str
+        """
         if name == "Unnamed":
             current_file_path = maya.cmds.file(query=True, sn=True)
 
             if current_file_path:
                 name = os.path.basename(current_file_path)
 
-        if not output_path:
-            output_path = self._get_temp_media_path(name, version, "")
+        return name
 
-        playblast_args = self.get_default_playblastlast_args(output_path)
+    @contextlib.contextmanager
+    def _report_playblast_progress(self, playblast_args, index=0, count=1):
+        """
+        Report the progress of a playblast frame by frame, as the time changes.
+
+        :param dict playblast_args: Playblast arguments
+        :param int index:           Index of the playblast in a batch of playblasts
+        :param int count:           Number of playblasts in the batch
+        """
+        first_frame = playblast_args.get("startTime")
+        if first_frame is None:
+            first_frame = maya.cmds.playbackOptions(query=True, minTime=True)
+        last_frame = playblast_args.get("endTime")
+        if last_frame is None:
+            last_frame = maya.cmds.playbackOptions(query=True, maxTime=True)
+        frame_count = max(last_frame - first_frame + 1, 1)
+
+        def report_frame_progress(time, client_data):
+            frame = time.asUnits(maya.OpenMaya.MTime.uiUnit())
+            fraction = min(max((frame - first_frame + 1) / frame_count, 0.0), 1.0)
+            self._report_progress(
+                (index + fraction) / count, "Playblasting frame %d" % frame
+            )
+
+        callback_id = maya.OpenMaya.MDGMessage.addTimeChangeCallback(
+            report_frame_progress
+        )
+        try:
+            yield
+        finally:
+            maya.OpenMaya.MMessage.removeCallback(callback_id)
+
+    def _playblast(self, playblast_args, index=0, count=1):
+        """
+        Run the playblast command and find the media it wrote on disk.
+
+        :param dict playblast_args: Playblast arguments
+        :param int index:           Index of the playblast in a batch of playblasts
+        :param int count:           Number of playblasts in the batch
+
+        :returns:               Location of the rendered media
+        :rtype:                 str
+        """
+        output_path = playblast_args["filename"]
 
         self.logger.info(
             "Writing playblast to: %s using (%s)" % (output_path, playblast_args)
         )
 
-        output_path = maya.cmds.playblast(**playblast_args)
+        with self._report_playblast_progress(playblast_args, index, count):
+            output_path = maya.cmds.playblast(**playblast_args)
         self.logger.info("Playblast maybe written to %s" % output_path)
 
         if os.path.exists(output_path):
@@ -9,11 +9,25 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import sgtk
+import functools
+import json
+import math
 import os
+import shutil
+import tempfile
+import time
 import nuke
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# Maximum number of frames of a filmstrip.
+FILMSTRIP_MAX_FRAMES = 20
+
+# Prefixes of the lines printed by the render process for each frame and each
+# execution, see resources/nuke_render.py.
+NUKE_RENDER_FRAME_PREFIX = "tk-multi-reviewsubmission-frame"
+NUKE_RENDER_EXECUTION_PREFIX = "tk-multi-reviewsubmission-execution"
+
 
 class RenderMedia(HookBaseClass):
     """
@@ -25,27 +39,39 @@ class RenderMedia(HookBaseClass):
 
         self.__app = self.parent
 
-        self._burnin_nk = os.path.join(
-            self.__app.disk_location, "resources", "burnin.nk"
+        # The paths of the slate resources only depend on the settings.
+        self._burnin_nk, self._font, self._logo = self.__app.context_cache.get(
+            "nuke_slate_resources", self.__get_slate_resources
         )
-        self._font = os.path.join(
+
+    def __get_slate_resources(self):
+        """
+        Get the paths of the resources of the slate and the burn-ins, as expected by
+        Nuke.
+
+        :returns:               The paths of the burn-in script, of the font and of the
+                                logo, empty when there is no logo.
+        :rtype:                 tuple(str, str, str)
+        """
+        burnin_nk = os.path.join(self.__app.disk_location, "resources", "burnin.nk")
+        font = os.path.join(
             self.__app.disk_location, "resources", "liberationsans_regular.ttf"
         )
 
         # If the slate_logo supplied was an empty string, the result of getting
         # the setting will be the config folder which is invalid so catch that
         # and make our logo path an empty string which Nuke won't have issues with.
-        self._logo = None
-        if os.path.isfile(self.__app.get_setting("slate_logo", "")):
-            self._logo = self.__app.get_setting("slate_logo", "")
-        else:
-            self._logo = ""
+        logo = self.__app.get_setting("slate_logo", "")
+        if not os.path.isfile(logo):
+            logo = ""
 
         # now transform paths to be forward slashes, otherwise it wont work on windows.
         if sgtk.util.is_windows():
-            self._font = self._font.replace(os.sep, "/")
-            self._logo = self._logo.replace(os.sep, "/")
-            self._burnin_nk = self._burnin_nk.replace(os.sep, "/")
+            font = font.replace(os.sep, "/")
+            logo = logo.replace(os.sep, "/")
+            burnin_nk = burnin_nk.replace(os.sep, "/")
+
+        return burnin_nk, font, logo
 
     def render(
         self,
@@ -58,10 +84,16 @@ class RenderMedia(HookBaseClass):
         version,
         name,
         color_space,
+        additional_outputs=None,
+        encode_settings=None,
     ):
         """
         Use Nuke to render a movie.
 
+        The additional outputs are rendered by their own Write nodes, in the same execution
+        as the movie, so the input frames are read once. When several views are selected by
+        the ``render_views`` setting, they are rendered side by side in the movie.
+
         :param str input_path:      Path to the input frames for the movie
         :param str output_path:     Path to the output movie that will be rendered
         :param int width:           Width of the output movie
@@ -71,12 +103,443 @@ class RenderMedia(HookBaseClass):
         :param str version:         Version number to use for the output movie slate and burn-in
         :param str name:            Name to use in the slate for the output movie
         :param str color_space:     Colorspace of the input frames
+        :param list(dict) additional_outputs: Additional media to render along with the movie
+        :param dict encode_settings: Bitrate and resolution fitting the upload of the movie
+                                    to the ``upload_time_budget`` setting. The bitrate is
+                                    applied from Nuke 13 on, the movie being encoded in H.264.
 
         :returns:               Location of the rendered media
         :rtype:                 str
         """
-        output_node = None
-        ctx = self.__app.context
+        return self.render_batch(
+            [
+                {
+                    "input_path": input_path,
+                    "output_path": output_path,
+                    "width": width,
+                    "height": height,
+                    "first_frame": first_frame,
+                    "last_frame": last_frame,
+                    "version": version,
+                    "name": name,
+                    "color_space": color_space,
+                    "additional_outputs": additional_outputs,
+                    "encode_settings": encode_settings,
+                }
+            ]
+        )[0]
+
+    def render_batch(self, items):
+        """
+        Render the movies of several items with Nuke, the items sharing the same frame
+        range being rendered in a single execution.
+
+        An item can hold the ``view`` to render, e.g. to submit each eye of a stereo
+        sequence as its own Version from a single execution. Otherwise, the views selected
+        by the ``render_views`` setting are rendered side by side, the first view only
+        when there is no selection.
+
+        The items longer than the ``render_checkpoint_frames`` setting are rendered in
+        segments, see :meth:`__get_checkpoint`.
+
+        :param list(dict) items:    Items to render
+
+        :returns:               Location of the rendered media of each item
+        :rtype:                 list(str)
+        """
+        groups = []
+        try:
+            executions = []
+            shared_executions = {}
+            checkpoints = []
+
+            # Report the progress of the render frame by frame, over all the movies.
+            movie_nodes = set()
+            frame_count = 0
+            rendered_frames = [0]
+
+            for item in items:
+                views = (
+                    [item["view"]] if item.get("view") else self.__get_render_views()
+                )
+
+                group, output_node, additional_nodes = self.__create_render_group(
+                    item, views
+                )
+                groups.append(group)
+
+                # Make sure the output folder exists
+                self.__app.ensure_folder_exists(os.path.dirname(item["output_path"]))
+
+                movie_nodes.add(output_node.fullName())
+                # The slate frame included.
+                frame_count += item["last_frame"] - item["first_frame"] + 2
+
+                outputs = [("review", output_node, item["output_path"], "movie")] + [
+                    ("extra_%s" % output["name"], node, output["path"], output["kind"])
+                    for output, node in zip(
+                        item.get("additional_outputs") or [], additional_nodes
+                    )
+                ]
+
+                checkpoint = self.__get_checkpoint(item, views)
+                if checkpoint:
+                    for index in checkpoint.completed:
+                        first_frame, last_frame = checkpoint.segments[index]
+                        rendered_frames[0] += last_frame - first_frame + 1
+                    executions.extend(
+                        self.__get_segment_executions(checkpoint, outputs)
+                    )
+                    checkpoints.append((checkpoint, outputs))
+                    continue
+
+                # Group the Write nodes by frame range, the slate frame included.
+                frame_range = (item["first_frame"] - 1, item["last_frame"])
+                if frame_range not in shared_executions:
+                    shared_executions[frame_range] = {
+                        "first_frame": frame_range[0],
+                        "last_frame": frame_range[1],
+                        "write_nodes": [],
+                        "files": {},
+                        "on_done": None,
+                    }
+                    executions.append(shared_executions[frame_range])
+                shared_executions[frame_range]["write_nodes"].extend(
+                    node for _, node, _, _ in outputs
+                )
+
+            def report_frame_progress(node_name, frame):
+                if node_name not in movie_nodes:
+                    return
+                rendered_frames[0] += 1
+                self._report_progress(
+                    float(rendered_frames[0]) / frame_count,
+                    "Rendering frame %d" % frame,
+                )
+
+            if self.__is_render_governed():
+                self.__execute_in_process(groups, executions, report_frame_progress)
+            else:
+                self.__execute(executions, report_frame_progress)
+
+            for checkpoint, outputs in checkpoints:
+                self.__join_segments(checkpoint, outputs)
+        finally:
+            # Cleanup after ourselves
+            for group in groups:
+                nuke.delete(group)
+
+        return [item["output_path"] for item in items]
+
+    def __get_checkpoint(self, item, views):
+        """
+        Get the checkpoint of an item longer than the ``render_checkpoint_frames`` setting.
+
+        Such items are rendered in segments of that many frames, recorded in a checkpoint
+        as they complete, so rendering the same frames with the same settings again after
+        an interruption only renders the missing segments. The segments are joined with
+        ffmpeg.
+
+        :param dict item:       The item, with the arguments of :meth:`render`.
+        :param list(str) views: Views rendered for the item.
+
+        :returns:               The checkpoint of the item, None if it isn't rendered in
+                                segments.
+        :rtype:                 :class:`~tk_multi_reviewsubmission.RenderCheckpoint`
+        """
+        segment_size = self.__app.get_setting("render_checkpoint_frames")
+        if (
+            not segment_size
+            or item["last_frame"] - item["first_frame"] + 2 <= segment_size
+        ):
+            return None
+
+        ffmpeg_path = self.__app.get_setting("ffmpeg_path")
+        if not shutil.which(ffmpeg_path):
+            self.__app.log_warning(
+                "Unable to find ffmpeg executable '%s' to join the segments of the "
+                "render, rendering %s without checkpoints."
+                % (ffmpeg_path, item["name"])
+            )
+            return None
+
+        # The checkpoint is only valid for the same frames rendered the same way.
+        settings = dict(
+            (key, value)
+            for key, value in item.items()
+            if key not in ("input_path", "output_path", "additional_outputs")
+        )
+        settings["additional_outputs"] = [
+            dict((key, value) for key, value in output.items() if key != "path")
+            for output in item.get("additional_outputs") or []
+        ]
+        settings["views"] = views
+        burnins = self._get_context_burnins()
+        settings["project"] = burnins["top_left"]
+        settings["entity"] = burnins["top_right"]
+        settings["version_label"] = self._get_version_label(item["version"])
+        settings["logo"] = self._logo
+
+        app_module = self.__app.import_module("tk_multi_reviewsubmission")
+        key = app_module.get_frames_fingerprint(
+            item["input_path"], item["first_frame"], item["last_frame"], settings
+        )
+        if not key:
+            return None
+
+        root = os.path.join(self.__app.cache_location, "render_checkpoints")
+        app_module.RenderCheckpoint.cleanup(root)
+        return app_module.RenderCheckpoint(
+            root, key, item["first_frame"] - 1, item["last_frame"], segment_size
+        )
+
+    def __get_segment_executions(self, checkpoint, outputs):
+        """
+        Build the executions rendering the missing segments of a checkpoint. The movies
+        are written segment by segment, the stills by the segment holding their frame.
+
+        :param checkpoint:          The checkpoint.
+        :param list outputs:        Name, Write node, path and kind of each output.
+
+        :returns:               The executions.
+        :rtype:                 list(dict)
+        """
+        executions = []
+        for index, first_frame, last_frame in checkpoint.get_pending_segments():
+            write_nodes = []
+            files = {}
+            for name, node, path, kind in outputs:
+                extension = os.path.splitext(path)[1]
+                if kind == "movie":
+                    segment_path = checkpoint.get_segment_path(name, index, extension)
+                else:
+                    still_frame = int(node["first"].value())
+                    if not first_frame <= still_frame <= last_frame:
+                        continue
+                    segment_path = checkpoint.get_still_path(name, extension)
+
+                # The review movie is written to the proxy path in proxy mode.
+                knob_name = "file"
+                if name == "review" and nuke.root()["proxy"].value():
+                    knob_name = "proxy"
+
+                write_nodes.append(node)
+                files[node.fullName()] = (knob_name, segment_path.replace(os.sep, "/"))
+
+            executions.append(
+                {
+                    "first_frame": first_frame,
+                    "last_frame": last_frame,
+                    "write_nodes": write_nodes,
+                    "files": files,
+                    "on_done": functools.partial(checkpoint.complete_segment, index),
+                }
+            )
+
+        return executions
+
+    def __join_segments(self, checkpoint, outputs):
+        """
+        Join the segments of the movies of a checkpoint and copy its stills to their
+        final location, then remove the checkpoint.
+
+        :param checkpoint:          The checkpoint.
+        :param list outputs:        Name, Write node, path and kind of each output.
+        """
+        for name, _, path, kind in outputs:
+            extension = os.path.splitext(path)[1]
+            if kind == "movie":
+                checkpoint.join(
+                    name, extension, path, self.__app.get_setting("ffmpeg_path")
+                )
+            else:
+                shutil.copyfile(checkpoint.get_still_path(name, extension), path)
+
+        checkpoint.discard()
+
+    def __execute(self, executions, report_frame_progress):
+        """
+        Execute the Write nodes in the session.
+
+        :param list(dict) executions: Frame range, Write nodes and paths to write them to
+                                    of each execution, along with a callable to call once
+                                    it is done.
+        :param report_frame_progress: Callable receiving the name of a Write node and the
+                                    frame it rendered.
+        """
+
+        def report_frame():
+            report_frame_progress(nuke.thisNode().fullName(), nuke.frame())
+
+        nuke.addAfterFrameRender(report_frame, nodeClass="Write")
+        try:
+            for execution in executions:
+                for node_name, (knob_name, path) in execution["files"].items():
+                    nuke.toNode(node_name)[knob_name].setValue(path)
+
+                # The views are picked by the render groups, Nuke renders them in
+                # parallel on its render threads.
+                nuke.executeMultiple(
+                    execution["write_nodes"],
+                    ([execution["first_frame"], execution["last_frame"], 1],),
+                    [nuke.views()[0]],
+                )
+
+                if execution["on_done"]:
+                    execution["on_done"]()
+        finally:
+            nuke.removeAfterFrameRender(report_frame, nodeClass="Write")
+
+    def __is_render_governed(self):
+        """
+        :returns:               Whether the render thread count, cache memory or priority
+                                are configured, in which case the render runs in a Nuke
+                                process of its own.
+        :rtype:                 bool
+        """
+        return bool(
+            self.__app.get_setting("render_threads")
+            or self.__app.get_setting("render_cache_memory")
+            or self.__app.get_setting("render_priority")
+        )
+
+    def __execute_in_process(self, groups, executions, report_frame_progress):
+        """
+        Execute the Write nodes in a Nuke process started with the thread count, the
+        cache memory and the priority configured by the ``render_threads``,
+        ``render_cache_memory`` and ``render_priority`` settings, so the render doesn't
+        compete with the session for the resources of the workstation.
+
+        The throughput and the peak memory of the render are logged, to tune the settings
+        of each kind of workstation.
+
+        :param list groups:         The render groups.
+        :param list(dict) executions: The executions, see :meth:`__execute`.
+        :param report_frame_progress: Callable receiving the name of a Write node and the
+                                    frame it rendered.
+        :raises RuntimeError:   If the render process fails.
+        """
+        app_module = self.__app.import_module("tk_multi_reviewsubmission")
+
+        work_folder = tempfile.mkdtemp(prefix="tk-multi-reviewsubmission-")
+        try:
+            # Copy the render groups only, leaving the selection of the artist untouched.
+            nodes_path = os.path.join(work_folder, "render.nk")
+            selection = nuke.selectedNodes()
+            for node in selection:
+                node.setSelected(False)
+            try:
+                for group in groups:
+                    group.setSelected(True)
+                nuke.nodeCopy(nodes_path)
+            finally:
+                for group in groups:
+                    group.setSelected(False)
+                for node in selection:
+                    node.setSelected(True)
+
+            job_path = os.path.join(work_folder, "render.json")
+            with open(job_path, "w") as f:
+                json.dump(
+                    {
+                        "root_knobs": nuke.root().writeKnobs(
+                            nuke.TO_SCRIPT | nuke.WRITE_NON_DEFAULT_ONLY
+                        ),
+                        "nodes_path": nodes_path,
+                        "view": nuke.views()[0],
+                        "executions": [
+                            [
+                                execution["first_frame"],
+                                execution["last_frame"],
+                                [node.fullName() for node in execution["write_nodes"]],
+                                execution["files"],
+                            ]
+                            for execution in executions
+                        ],
+                    },
+                    f,
+                )
+
+            command = [nuke.EXE_PATH, "-t"]
+            if nuke.env.get("nukex"):
+                command.append("--nukex")
+            threads = self.__app.get_setting("render_threads")
+            if threads:
+                command.extend(["-m", str(threads)])
+            cache_memory = self.__app.get_setting("render_cache_memory")
+            if cache_memory:
+                command.extend(["-c", "%dM" % cache_memory])
+            command.extend(
+                [
+                    os.path.join(
+                        self.__app.disk_location, "resources", "nuke_render.py"
+                    ),
+                    job_path,
+                ]
+            )
+
+            rendered_frames = [0]
+
+            def report_frame(line):
+                if line.startswith(NUKE_RENDER_EXECUTION_PREFIX):
+                    on_done = executions[int(line.rsplit(" ", 1)[1])]["on_done"]
+                    if on_done:
+                        on_done()
+                    return
+                if not line.startswith(NUKE_RENDER_FRAME_PREFIX):
+                    return
+                _, node_name, frame = line.rsplit(" ", 2)
+                rendered_frames[0] += 1
+                report_frame_progress(node_name, int(frame))
+
+            process = app_module.GovernedProcess(
+                command, self.__app.get_setting("render_priority")
+            )
+            start_time = time.monotonic()
+            exit_code = process.run(report_frame)
+            duration = time.monotonic() - start_time
+        finally:
+            shutil.rmtree(work_folder, ignore_errors=True)
+
+        if exit_code != 0:
+            raise RuntimeError(
+                "The Nuke render process failed with exit code %d: %s"
+                % (exit_code, process.output)
+            )
+
+        self.__app.log_info(
+            "Rendered %d frames in %.1fs (%.2f frames/s) with %s threads and %s MB of "
+            "cache memory, peak memory %s."
+            % (
+                rendered_frames[0],
+                duration,
+                rendered_frames[0] / duration if duration else 0.0,
+                threads or "the default",
+                cache_memory or "the default",
+                (
+                    "%d MB" % (process.peak_memory // (1024 * 1024))
+                    if process.peak_memory is not None
+                    else "unknown"
+                ),
+            )
+        )
+
+    def __create_render_group(self, item, views):
+        """
+        Create the group of nodes rendering the movie of an item and its additional
+        outputs.
+
+        :param dict item:       The item, with the arguments of :meth:`render`.
+        :param list(str) views: Views to render side by side, the one picked by the
+                                execution when empty.
+
+        :returns:               The group, the Write node of the movie and the Write nodes
+                                of the additional outputs.
+        :rtype:                 tuple(Nuke node, Nuke node, list(Nuke node))
+        """
+        first_frame = item["first_frame"]
+        last_frame = item["last_frame"]
+        version = item["version"]
 
         # create group where everything happens
         group = nuke.nodes.Group()
@@ -85,12 +548,14 @@ class RenderMedia(HookBaseClass):
         group.begin()
         try:
             # create read node
-            read = nuke.nodes.Read(name="source", file=input_path.replace(os.sep, "/"))
+            read = nuke.nodes.Read(
+                name="source", file=item["input_path"].replace(os.sep, "/")
+            )
             read["on_error"].setValue("black")
             read["first"].setValue(first_frame)
             read["last"].setValue(last_frame)
-            if color_space:
-                read["colorspace"].setValue(color_space)
+            if item["color_space"]:
+                read["colorspace"].setValue(item["color_space"])
 
             # now create the slate/burnin node
             burn = nuke.nodePaste(self._burnin_nk)
@@ -107,61 +572,121 @@ class RenderMedia(HookBaseClass):
             burn.node("logo")["file"].setValue(self._logo)
 
             # format the burnins
-            version_padding_format = "%%0%dd" % self.__app.get_setting(
-                "version_number_padding"
+            burnins = self._get_context_burnins()
+            burn.node("top_left_text")["message"].setValue(burnins["top_left"])
+            burn.node("top_right_text")["message"].setValue(burnins["top_right"])
+            burn.node("bottom_left_text")["message"].setValue(
+                self._get_version_label(version)
             )
-            version_str = version_padding_format % version
-
-            if ctx.task:
-                version_label = "%s, v%s" % (ctx.task["name"], version_str)
-            elif ctx.step:
-                version_label = "%s, v%s" % (ctx.step["name"], version_str)
-            else:
-                version_label = "v%s" % version_str
-
-            burn.node("top_left_text")["message"].setValue(ctx.project["name"])
-            burn.node("top_right_text")["message"].setValue(ctx.entity["name"])
-            burn.node("bottom_left_text")["message"].setValue(version_label)
 
             # and the slate
-            slate_str = "Project: %s\n" % ctx.project["name"]
-            slate_str += "%s: %s\n" % (ctx.entity["type"], ctx.entity["name"])
-            slate_str += "Name: %s\n" % name.capitalize()
-            slate_str += "Version: %s\n" % version_str
-
-            if ctx.task:
-                slate_str += "Task: %s\n" % ctx.task["name"]
-            elif ctx.step:
-                slate_str += "Step: %s\n" % ctx.step["name"]
-
-            slate_str += "Frames: %s - %s\n" % (first_frame, last_frame)
+            slate_str = self._get_slate_text(
+                item["name"], version, first_frame, last_frame
+            )
 
             burn.node("slate_info")["message"].setValue(slate_str)
 
+            # Lower the resolution to fit the upload time budget.
+            width, height = item["width"], item["height"]
+            encode_settings = item.get("encode_settings")
+            if encode_settings:
+                width, height = encode_settings["width"], encode_settings["height"]
+
             # create a scale node
             scale = self.__create_scale_node(width, height)
             scale.setInput(0, burn)
 
+            if len(views) > 1:
+                movie = self.__create_side_by_side_node(scale, views, width, height)
+            else:
+                movie = self.__create_view_node(scale, views)
+
             # Create the output node
-            output_node = self.__create_output_node(output_path)
-            output_node.setInput(0, scale)
-        finally:
+            output_node = self.__create_output_node(
+                item["output_path"], encode_settings
+            )
+            output_node.setInput(0, movie)
+
+            # The additional outputs show the first view.
+            additional_nodes = []
+            for output in item.get("additional_outputs") or []:
+                additional_nodes.append(
+                    self.__create_additional_output_nodes(
+                        output,
+                        self.__create_view_node(read, views),
+                        self.__create_view_node(burn, views),
+                        first_frame,
+                        last_frame,
+                    )
+                )
+        except Exception:
             group.end()
+            nuke.delete(group)
+            raise
 
-        if output_node:
-            # Make sure the output folder exists
-            output_folder = os.path.dirname(output_path)
-            self.__app.ensure_folder_exists(output_folder)
+        group.end()
 
-            # Render the outputs, first view only
-            nuke.executeMultiple(
-                [output_node], ([first_frame - 1, last_frame, 1],), [nuke.views()[0]]
-            )
+        return group, output_node, additional_nodes
 
-        # Cleanup after ourselves
-        nuke.delete(group)
+    def __get_render_views(self):
+        """
+        Get the views selected by the ``render_views`` setting.
+
+        :returns:               The views of the script to render, empty to render the
+                                first view only.
+        :rtype:                 list(str)
+        """
+        selected_views = self.__app.get_setting("render_views") or []
+        if "*" in selected_views:
+            return nuke.views()
+
+        views = [view for view in selected_views if view in nuke.views()]
+        for view in selected_views:
+            if view not in views:
+                self.__app.log_warning("Skipping unknown view %s." % view)
+        return views
+
+    def __create_view_node(self, node, views):
+        """
+        Pick the first of the views out of the output of a node.
+
+        :param node:            The node
+        :param list(str) views: Views to render, empty to let the execution pick the view
+
+        :returns:               OneView node, or the given node when there are no views
+        :rtype:                 Nuke node
+        """
+        if not views:
+            return node
 
-        return output_path
+        view_node = nuke.nodes.OneView()
+        view_node["view"].setValue(views[0])
+        view_node.setInput(0, node)
+        return view_node
+
+    def __create_side_by_side_node(self, node, views, width, height):
+        """
+        Lay the views of the output of a node side by side.
+
+        :param node:            The node
+        :param list(str) views: Views to lay out, from left to right
+        :param int width:       Width of each view
+        :param int height:      Height of each view
+
+        :returns:               ContactSheet node of the views
+        :rtype:                 Nuke node
+        """
+        sheet = nuke.nodes.ContactSheet()
+        sheet["width"].setValue(width * len(views))
+        sheet["height"].setValue(height)
+        sheet["rows"].setValue(1)
+        sheet["columns"].setValue(len(views))
+        sheet["gap"].setValue(0)
+
+        for index, view in enumerate(views):
+            sheet.setInput(index, self.__create_view_node(node, [view]))
+
+        return sheet
 
     def __create_scale_node(self, width, height):
         """
@@ -183,17 +708,169 @@ class RenderMedia(HookBaseClass):
         scale["black_outside"].setValue(True)
         return scale
 
-    def __create_output_node(self, path):
+    def __create_additional_output_nodes(
+        self, output, read, burn, first_frame, last_frame
+    ):
+        """
+        Create the nodes rendering an additional output. The movies are rendered from the
+        burn-in node, the thumbnail and the filmstrip from the input frames.
+
+        :param dict output:         The additional output
+        :param read:                Read node of the input frames
+        :param burn:                Burn-in node
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+
+        :returns:               The Write node of the output
+        :rtype:                 Nuke node
+        """
+        path = output["path"].replace(os.sep, "/")
+
+        if output["kind"] == "movie":
+            scale = self.__create_additional_scale_node(
+                output["width"], output["height"]
+            )
+            scale.setInput(0, burn)
+            wn_settings = self.__get_web_movie_settings()
+            node = nuke.nodes.Write(file_type=wn_settings.get("file_type"), file=path)
+            for knob_name, knob_value in wn_settings.items():
+                if knob_name != "file_type":
+                    node.knob(knob_name).setValue(knob_value)
+            node.setInput(0, scale)
+            return node
+
+        scale = self.__create_additional_scale_node(output["width"], output["height"])
+        scale.setInput(0, read)
+
+        node = nuke.nodes.Write(file=path, file_type="jpeg")
+        node["_jpeg_quality"].setValue(0.9)
+
+        # Each still is written once, on a single frame of the execution.
+        node["use_limit"].setValue(True)
+        if output["kind"] == "thumbnail":
+            still_frame = (first_frame + last_frame) // 2
+            node.setInput(0, scale)
+        else:
+            still_frame = first_frame
+            node.setInput(
+                0,
+                self.__create_filmstrip_node(
+                    scale, output["width"], read, first_frame, last_frame
+                ),
+            )
+        node["first"].setValue(still_frame)
+        node["last"].setValue(still_frame)
+
+        return node
+
+    def __create_additional_scale_node(self, width, height):
+        """
+        Create the Nuke scale node of an additional output.
+
+        :param int width:           Width of the output
+        :param int height:          Height of the output, 0 to keep the aspect ratio
+
+        :returns:               Pre-configured Reformat node
+        :rtype:                 Nuke node
+        """
+        if height:
+            return self.__create_scale_node(width, height)
+
+        scale = nuke.nodes.Reformat()
+        scale["type"].setValue("to box")
+        scale["box_width"].setValue(width)
+        scale["box_fixed"].setValue(False)
+        return scale
+
+    def __create_filmstrip_node(
+        self, scale, frame_width, read, first_frame, last_frame
+    ):
+        """
+        Create the nodes laying frames spread over the sequence side by side.
+
+        :param scale:               Reformat node of the frames
+        :param int frame_width:     Width of each frame of the filmstrip
+        :param read:                Read node of the input frames
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+
+        :returns:               ContactSheet node of the filmstrip
+        :rtype:                 Nuke node
+        """
+        frame_count = last_frame - first_frame + 1
+        step = int(math.ceil(float(frame_count) / FILMSTRIP_MAX_FRAMES))
+        frames = list(range(first_frame, last_frame + 1, step))
+
+        source_format = read.format()
+        frame_height = int(
+            round(
+                frame_width
+                * source_format.height()
+                * source_format.pixelAspect()
+                / source_format.width()
+            )
+        )
+
+        sheet = nuke.nodes.ContactSheet()
+        sheet["width"].setValue(frame_width * len(frames))
+        sheet["height"].setValue(frame_height)
+        sheet["rows"].setValue(1)
+        sheet["columns"].setValue(len(frames))
+        sheet["gap"].setValue(0)
+
+        for index, frame in enumerate(frames):
+            hold = nuke.nodes.FrameHold()
+            # The knob was renamed in Nuke 13.
+            (hold.knob("firstFrame") or hold.knob("first_frame")).setValue(frame)
+            hold.setInput(0, scale)
+            sheet.setInput(index, hold)
+
+        return sheet
+
+    def __get_web_movie_settings(self):
+        """
+        Allows modifying the codec settings of the additional movies, smaller files
+        streaming from the web. Returns a dictionary of settings to be used for the Write
+        Node that generates them.
+
+        :returns:               Codec settings
+        :rtype:                 dict
+        """
+        settings = self.__get_quicktime_settings()
+        if nuke.NUKE_VERSION_MAJOR >= 13:
+            # H.264 is available from Nuke 13.0v1 on.
+            settings = {
+                "file_type": "mov",
+                "mov64_codec": "h264",
+                "mov64_bitrate": 2000,
+            }
+        return settings
+
+    def __create_output_node(self, path, encode_settings=None):
         """
         Create the Nuke output node for the movie.
 
         :param str path:           Path of the output movie
+        :param dict encode_settings: Bitrate fitting the upload of the movie to the
+                                    ``upload_time_budget`` setting. Can be None.
 
         :returns:               Pre-configured Write node
         :rtype:                 Nuke node
         """
         # get the Write node settings we'll use for generating the Quicktime
         wn_settings = self.__get_quicktime_settings()
+        if encode_settings:
+            if nuke.NUKE_VERSION_MAJOR >= 13:
+                wn_settings = {
+                    "file_type": "mov",
+                    "mov64_codec": "h264",
+                    "mov64_bitrate": encode_settings["bitrate"],
+                }
+            else:
+                self.__app.log_debug(
+                    "H.264 isn't available before Nuke 13, only the resolution of the "
+                    "movie is lowered to fit the upload time budget."
+                )
 
         node = nuke.nodes.Write(file_type=wn_settings.get("file_type"))
 
@@ -12,6 +12,8 @@
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
+import os
+
 HookBaseClass = sgtk.get_hook_baseclass()
 
 
@@ -75,35 +77,162 @@ class RenderMedia(HookBaseClass):
         version,
         name,
         color_space,
+        additional_outputs=None,
+        encode_settings=None,
     ):
         """
-        Render the media using the engine implementation of ``export_as_jpeg``
+        Render the media using the engine implementation of ``export_as_jpeg``. The image is
+        downsampled to fit in the configured movie dimensions.
 
         :param str input_path:      Path to the input frames for the movie      (Unused)
         :param str output_path:     Path to the output movie that will be rendered
-        :param int width:           Width of the output movie                   (Unused)
-        :param int height:          Height of the output movie                  (Unused)
+        :param int width:           Width of the output movie
+        :param int height:          Height of the output movie
         :param int first_frame:     The first frame of the sequence of frames.  (Unused)
         :param int last_frame:      The last frame of the sequence of frames.   (Unused)
         :param int version:         Version number to use for the output movie slate and burn-in
         :param str name:            Name to use in the slate for the output movie
         :param str color_space:     Colorspace of the input frames              (Unused)
+        :param list(dict) additional_outputs: Additional media                  (Unused)
+        :param dict encode_settings: Settings of the movie                      (Unused)
 
         :returns:               Location of the rendered media
         :rtype:                 str
         """
         engine = sgtk.platform.current_engine()
+        document = engine.adobe.get_active_document()
 
         if name == "Unnamed":
-            name = engine.adobe.get_active_document().name
+            name = document.name
+
+        return self._export(engine, document, output_path, width, height, version, name)
+
+    def render_batch(self, items):
+        """
+        Export several documents or layer comps in a single pass, each of them as its own
+        review item.
+
+        On top of the :meth:`render` arguments, each item can provide the name of the
+        ``document`` to export, the active document being used otherwise, and the name of
+        the ``layer_comp`` to apply before exporting it. The layer comps of the documents
+        are restored once exported.
+
+        :param list(dict) items:    Items to render
+
+        :returns:               Location of the rendered media of each item
+        :rtype:                 list(str)
+        """
+        engine = sgtk.platform.current_engine()
 
+        # Grab the documents only once, each access is a round trip to Photoshop.
+        active_document = engine.adobe.get_active_document()
+        documents = dict((doc.name, doc) for doc in engine.adobe.app.documents)
+
+        output_paths = []
+        # Documents we applied a layer comp to, along with the layer comp saving their state.
+        saved_states = {}
+        try:
+            for item in items:
+                document_name = item.get("document")
+                if document_name:
+                    document = documents.get(document_name)
+                    if not document:
+                        raise RuntimeError(
+                            "Unable to find the document '%s'." % document_name
+                        )
+                else:
+                    document = active_document
+
+                name = item["name"]
+                if name == "Unnamed":
+                    name = document.name
+
+                layer_comp_name = item.get("layer_comp")
+                if layer_comp_name:
+                    if document.name not in saved_states:
+                        saved_states[document.name] = (
+                            document,
+                            document.layerComps.add(
+                                "tk-multi-reviewsubmission", "", True, True, True
+                            ),
+                        )
+                    document.layerComps.getByName(layer_comp_name).apply()
+
+                    if item["name"] == "Unnamed":
+                        name = "%s - %s" % (
+                            os.path.splitext(document.name)[0],
+                            layer_comp_name,
+                        )
+
+                output_paths.append(
+                    self._export(
+                        engine,
+                        document,
+                        item["output_path"],
+                        item["width"],
+                        item["height"],
+                        item["version"],
+                        name,
+                    )
+                )
+        finally:
+            for document, saved_state in saved_states.values():
+                saved_state.apply()
+                saved_state.remove()
+
+        return output_paths
+
+    def _export(self, engine, document, output_path, width, height, version, name):
+        """
+        Export a document as a JPG image fitting in the given dimensions.
+
+        :param engine:              The tk-photoshopcc engine
+        :param document:            The document to export
+        :param str output_path:     Path to the output image, a temporary path is used if None
+        :param int width:           Maximum width of the output image
+        :param int height:          Maximum height of the output image
+        :param int version:         Version number of the exported image
+        :param str name:            Name of the exported image
+
+        :returns:               Location of the exported image
+        :rtype:                 str
+        """
         if not output_path:
             output_path = self._get_temp_media_path(name, version, ".jpg")
 
-        self.logger.info("Saving as a JPG to: %s " % output_path)
+        max_size = self._get_max_size(document, width, height)
+
+        self.logger.info(
+            "Saving %s as a JPG to: %s (max size %spx)"
+            % (document.name, output_path, max_size)
+        )
 
-        output_path = engine.export_as_jpeg(None, output_path)
+        output_path = engine.export_as_jpeg(
+            document=document, output_path=output_path, max_size=max_size
+        )
 
         self.logger.info("JPG written")
 
         return output_path
+
+    def _get_max_size(self, document, width, height):
+        """
+        Compute the size of the longest side of the document once fitted in the given
+        dimensions. Documents are never upscaled.
+
+        :param document:            The document to export
+        :param int width:           Maximum width of the output image
+        :param int height:          Maximum height of the output image
+
+        :returns:               The maximum size of the exported image
+        :rtype:                 int
+        """
+        try:
+            document_width = float(document.width.value)
+            document_height = float(document.height.value)
+        except Exception:
+            # The document dimensions can't be read, fit its longest side in the box.
+            return max(width, height)
+
+        scale = min(1.0, width / document_width, height / document_height)
+        return int(round(max(document_width, document_height) * scale))
@@ -0,0 +1,70 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+
+import sgtk
+
+HookBaseClass = sgtk.get_hook_baseclass()
+
+
+class RenderMedia(HookBaseClass):
+    """
+    RenderMedia hook implementation for the tk-shell engine, used by the submission
+    daemon. Without a DCC at hand, the movies are encoded from the input frames with
+    ffmpeg.
+    """
+
+    def render(
+        self,
+        input_path,
+        output_path,
+        width,
+        height,
+        first_frame,
+        last_frame,
+        version,
+        name,
+        color_space,
+        additional_outputs=None,
+        encode_settings=None,
+    ):
+        """
+        Encode the input frames into a movie with ffmpeg.
+
+        :param str input_path:      Path to the input frames for the movie
+        :param str output_path:     Path to the output movie that will be rendered
+        :param int width:           Width of the output movie
+        :param int height:          Height of the output movie
+        :param int first_frame:     The first frame of the sequence of frames.
+        :param int last_frame:      The last frame of the sequence of frames.
+        :param int version:         Version number to use for the output movie slate and burn-in
+        :param str name:            Name to use in the slate for the output movie
+        :param str color_space:     Colorspace of the input frames              (Unused)
+        :param list(dict) additional_outputs: Additional media to encode from the same read
+                                    of the input frames
+        :param dict encode_settings: Bitrate and resolution fitting the upload of the movie
+                                    to the ``upload_time_budget`` setting
+
+        :returns:               Location of the rendered media
+        :rtype:                 str
+        """
+        return self.encode(
+            input_path,
+            output_path,
+            width,
+            height,
+            first_frame,
+            last_frame,
+            version,
+            name,
+            color_space,
+            additional_outputs=additional_outputs,
+            encode_settings=encode_settings,
+        )
@@ -9,6 +9,40 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 from .actions import Actions
+from .cache import ContextCache, SessionCache
+from .checkpoint import RenderCheckpoint
+from .color import ColorLutCache
+from .bulk import BulkSubmission, read_manifest
+from .content_index import (
+    ContentIndex,
+    get_frames_fingerprint,
+    get_submission_fingerprint,
+)
+from .daemon import DaemonClient, SubmissionDaemon
+from .encode_policy import EncodePolicy, UploadBandwidth
+from .encoder import FFmpegEncoder
+from .governor import GovernedProcess
+from .locking import OutputLock, get_staging_path
+from .profiling import SubmissionProfiler, execute_hook_method, profile_submission
+from .progress import ProgressReporter, get_current_reporter, report_progress
+from .scratch import ScratchSpace
+from .storage import PosixStorage, S3Storage, get_storage
+from .streaming import ByteCounterSink, ChecksumSink, copy_file, fan_out
+from .tracing import (
+    TRACE_FILE_ENV_VAR,
+    FileSpanExporter,
+    Span,
+    attach_span,
+    configure_tracing,
+    get_current_span,
+    get_traceparent,
+    is_tracing_enabled,
+    trace_span,
+)
+from .upload import ShotgunUploadSink
+
+import argparse
+import os
 
 import sgtk
 
@@ -30,6 +64,76 @@ def send_for_review():
         logger.error(str(e))
 
 
+def run_submission_daemon():
+    """
+    Entry point of the submission daemon command, serving the submissions until the
+    process is interrupted.
+    """
+    app = sgtk.platform.current_bundle()
+
+    daemon = SubmissionDaemon(
+        os.path.join(app.cache_location, "submission_daemon"),
+        app.get_setting("submission_daemon_port"),
+        app.get_setting("submission_daemon_workers"),
+        configurations=[app.sgtk.pipeline_configuration.get_path()]
+        + app.get_setting("submission_daemon_configurations"),
+        scratch_root=app.scratch_space.root,
+    )
+    logger.info("Submission daemon listening on %s:%d." % daemon.address)
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Submission daemon stopped.")
+
+
+def submit_manifest(*args):
+    """
+    Entry point of the submit manifest command, rendering and submitting the rows of
+    a manifest, see :class:`BulkSubmission`.
+
+    :param args:            Command line arguments.
+
+    :returns:               Summary of the run.
+    :rtype:                 dict
+    """
+    parser = argparse.ArgumentParser(
+        prog="submit_manifest",
+        description="Render and submit the Versions listed in a JSON or CSV manifest. "
+        "Running the same manifest again resumes it.",
+    )
+    parser.add_argument("manifest", help="Path of the manifest.")
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of renders running at once.",
+    )
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=4,
+        help="Number of submissions running at once.",
+    )
+    parser.add_argument(
+        "--results",
+        help="Path of the results file, defaults to the manifest path with a "
+        ".results.jsonl extension.",
+    )
+    options = parser.parse_args(args)
+
+    submission = BulkSubmission(
+        sgtk.platform.current_bundle(),
+        options.manifest,
+        options.render_workers,
+        options.upload_workers,
+        options.results,
+    )
+    summary = submission.run()
+    logger.info("Results written to %s." % submission.results_path)
+    return summary
+
+
 def render_and_submit_version(
     template,
     fields,
@@ -80,3 +184,42 @@ def render_and_submit_version(
         )
     except Exception as e:
         logger.error(str(e))
+
+
+def render_and_submit_versions(
+    items,
+    sg_publishes=None,
+    sg_task=None,
+    comment=None,
+    thumbnail_path=None,
+    progress_cb=None,
+    color_space=None,
+):
+    """
+    Batch entry point to be called by other applications / hooks.
+
+    :param list(dict) items: The items to render and submit, see :meth:`Actions.render_and_submit_versions`.
+    :param sg_publishes:    A list of shotgun published file objects to link the publishes against.
+    :param sg_task:         A Shotgun task object to link against. Can be None.
+    :param comment:         A description to add to the Versions in Shotgun.
+    :param thumbnail_path:  The path to a thumbnail to use for the versions when the movies aren't
+                            being uploaded to Shotgun (this is set in the config)
+    :param progress_cb:     A callback to report progress with.
+    :param color_space:     The colorspace of the rendered frames
+
+    :returns:               The Version Shotgun entity dictionaries that were created.
+    :rtype:                 list(dict)
+    """
+    try:
+        action = Actions()
+        return action.render_and_submit_versions(
+            items,
+            sg_publishes,
+            sg_task,
+            comment,
+            thumbnail_path,
+            progress_cb,
+            color_space,
+        )
+    except Exception as e:
+        logger.error(str(e))
@@ -9,18 +9,60 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import sgtk
+import collections
+import contextlib
 import copy
+import os
+import threading
+import time
+
+from .background import BackgroundSubmission
+from .content_index import get_frames_fingerprint, get_submission_fingerprint
+from .daemon import DaemonClient
+from .encode_policy import EncodePolicy
+from .locking import OutputLock, get_staging_path
+from .profiling import execute_hook_method, profile_submission
+from .progress import ProgressReporter
+from .tracing import attach_span, get_current_span, get_traceparent, trace_span
+
+# Arguments of the render media hook methods.
+RENDER_ARGS = (
+    "input_path",
+    "output_path",
+    "width",
+    "height",
+    "first_frame",
+    "last_frame",
+    "version",
+    "name",
+    "color_space",
+)
+
+# Keys of the render_and_submit_versions items consumed by the app.
+BATCH_ITEM_KEYS = ("template", "fields", "first_frame", "last_frame", "name")
+
+# Default extension and size of the additional outputs, by kind. A height of 0 keeps
+# the aspect ratio of the frames.
+ADDITIONAL_OUTPUT_DEFAULTS = {
+    "movie": {"extension": ".mp4", "width": 960, "height": 540},
+    "thumbnail": {"extension": ".jpg", "width": 720, "height": 0},
+    "filmstrip": {"extension": ".jpg", "width": 240, "height": 0},
+}
 
 
 class Actions(object):
+    """
+    Renders and submits review media. An instance can run several submissions at once
+    from different threads, the state of each submission being kept by its thread.
+    """
+
     def __init__(self):
         self.__app = sgtk.platform.current_bundle()
 
-        can_submit = self.__app.execute_hook_method(
-            key="submitter_hook",
-            method_name="can_submit",
-            base_class=None,
-        )
+        # State of the submission running in each thread.
+        self.__submission = threading.local()
+
+        can_submit = execute_hook_method(self.__app, "submitter_hook", "can_submit")
 
         if not can_submit:
             raise RuntimeError(
@@ -59,20 +101,385 @@ class Actions(object):
         :rtype:                 dict
         """
 
-        # Wrap the method so we don't have to worry about process_cb being None
-        def dispatch_progress(*args):
-            if progress_cb:
-                progress_cb(*args)
+        progress = ProgressReporter(progress_cb)
+        self._reset_timings()
+
+        # The outputs stay locked until the Version is submitted.
+        with trace_span("render_and_submit_version"), profile_submission(
+            self.__app, "render_and_submit_version"
+        ), progress.activate(), contextlib.ExitStack() as output_locks:
+            progress.begin_stage(0, 5, "Building the rendering options dictionary")
+
+            input_path, movie_destination, render_media_hook_args = (
+                self._get_render_media_hook_args(
+                    template, fields, first_frame, last_frame, color_space
+                )
+            )
+
+            fingerprint = self._get_submission_fingerprint(
+                self._get_fingerprint(input_path, render_media_hook_args),
+                sg_task,
+                comment,
+            )
+            version = self._find_submitted_version(
+                fingerprint, render_media_hook_args, sg_publishes
+            )
+            if version:
+                self._log_metric()
+                progress.finish("Version already submitted")
+                return version
+
+            if self.__app.get_setting("background_encode"):
+                submitted = self._submit_in_background(
+                    input_path,
+                    movie_destination,
+                    render_media_hook_args,
+                    thumbnail_path,
+                    sg_publishes,
+                    sg_task,
+                    comment,
+                    progress,
+                )
+                if submitted:
+                    # The Version is created once the movie is encoded in the background.
+                    self._log_metric()
+                    return None
+
+            pending_version = self._create_pending_version(
+                input_path, movie_destination, render_media_hook_args, sg_task, comment
+            )
+            try:
+                output_path = self._render(
+                    [render_media_hook_args], progress, 5, 70, output_locks=output_locks
+                )[0]
+            except Exception:
+                self._discard_pending_version(pending_version)
+                raise
+
+            progress.begin_stage(70, 100, "Creating PTR Version and uploading movie")
+
+            version = self._submit(
+                input_path,
+                output_path,
+                thumbnail_path,
+                sg_publishes,
+                sg_task,
+                comment,
+                first_frame,
+                last_frame,
+                movie_destination,
+                fingerprint,
+                render_media_hook_args.get("additional_outputs"),
+                self._get_pending_version(pending_version),
+            )
+
+            self._log_metric()
+
+            progress.finish("Version submitted")
+
+        return version
+
+    def render_and_submit_versions(
+        self,
+        items,
+        sg_publishes=None,
+        sg_task=None,
+        comment=None,
+        thumbnail_path=None,
+        progress_cb=None,
+        color_space=None,
+    ):
+        """
+        Render several media in a single render hook call and submit each of them
+        as its own Version.
+
+        Each item is a dictionary accepting the following keys, all optional:
+
+        - ``template``: The template defining the path where frames should be found.
+        - ``fields``: Dictionary of fields to be used to fill out the templates with.
+        - ``first_frame``: The first frame of the item.
+        - ``last_frame``: The last frame of the item.
+        - ``name``: Name of the item, overrides the ``name`` field.
 
-        dispatch_progress(20, "Building the rendering options dictionary")
+        Any other key is passed along to the ``render_batch`` method of the render media
+        hook, e.g. the ``camera`` to render the item through in Maya, the ``document``
+        and ``layer_comp`` to export in Photoshop, or the ``view`` to render in Nuke.
+
+        :param list(dict) items: The items to render and submit.
+        :param sg_publishes:    A list of shotgun published file objects to link the publishes against.
+        :param sg_task:         A Shotgun task object to link against. Can be None.
+        :param comment:         A description to add to the Versions in Shotgun.
+        :param thumbnail_path:  The path to a thumbnail to use for the versions when the movies aren't
+                                being uploaded to Shotgun (this is set in the config)
+        :param progress_cb:     A callback to report progress with.
+        :param color_space:     The colorspace of the rendered frames
 
-        if not fields:
-            fields = {}
+        :returns:               The Version Shotgun entity dictionaries that were created.
+        :rtype:                 list(dict)
+        """
 
-        if not sg_publishes:
-            sg_publishes = []
+        progress = ProgressReporter(progress_cb)
+        self._reset_timings()
 
-        dispatch_progress(10, "Preparing")
+        # The outputs stay locked until the Versions are submitted.
+        with trace_span(
+            "render_and_submit_versions", items=len(items)
+        ), profile_submission(
+            self.__app, "render_and_submit_versions"
+        ), progress.activate(), contextlib.ExitStack() as output_locks:
+            return self._render_and_submit_versions(
+                items,
+                sg_publishes,
+                sg_task,
+                comment,
+                thumbnail_path,
+                color_space,
+                progress,
+                output_locks,
+            )
+
+    def _render_and_submit_versions(
+        self,
+        items,
+        sg_publishes,
+        sg_task,
+        comment,
+        thumbnail_path,
+        color_space,
+        progress,
+        output_locks,
+    ):
+        """
+        Implementation of :meth:`render_and_submit_versions`, reporting its progress
+        to the given :class:`ProgressReporter` and holding the locks of the outputs in
+        the given :class:`contextlib.ExitStack`.
+        """
+        progress.begin_stage(0, 5, "Building the rendering options dictionaries")
+
+        # The items already submitted are neither rendered nor submitted again.
+        versions = [None] * len(items)
+        indexes = []
+        input_paths = []
+        movie_destinations = []
+        items_hook_args = []
+        fingerprints = []
+        for index, item in enumerate(items):
+            fields = copy.copy(item.get("fields") or {})
+            if item.get("name"):
+                fields["name"] = item["name"]
+
+            input_path, movie_destination, render_media_hook_args = (
+                self._get_render_media_hook_args(
+                    item.get("template"),
+                    fields,
+                    item.get("first_frame"),
+                    item.get("last_frame"),
+                    color_space,
+                )
+            )
+            render_media_hook_args.update(
+                (key, value)
+                for key, value in item.items()
+                if key not in BATCH_ITEM_KEYS
+            )
+
+            fingerprint = self._get_submission_fingerprint(
+                self._get_fingerprint(input_path, render_media_hook_args),
+                sg_task,
+                comment,
+            )
+            versions[index] = self._find_submitted_version(
+                fingerprint, render_media_hook_args, sg_publishes
+            )
+            if versions[index]:
+                continue
+
+            indexes.append(index)
+            input_paths.append(input_path)
+            movie_destinations.append(movie_destination)
+            items_hook_args.append(render_media_hook_args)
+            fingerprints.append(fingerprint)
+
+        if not items_hook_args:
+            self._log_metric()
+            progress.finish("Versions already submitted")
+            return versions
+
+        pending_versions = [
+            self._create_pending_version(
+                input_path, movie_destination, render_media_hook_args, sg_task, comment
+            )
+            for input_path, movie_destination, render_media_hook_args in zip(
+                input_paths, movie_destinations, items_hook_args
+            )
+        ]
+        try:
+            output_paths = self._render(
+                items_hook_args, progress, 5, 50, batch=True, output_locks=output_locks
+            )
+        except Exception:
+            for pending_version in pending_versions:
+                self._discard_pending_version(pending_version)
+            raise
+
+        for index, (
+            input_path,
+            output_path,
+            movie_destination,
+            render_media_hook_args,
+            fingerprint,
+        ) in enumerate(
+            zip(
+                input_paths,
+                output_paths,
+                movie_destinations,
+                items_hook_args,
+                fingerprints,
+            )
+        ):
+            progress.begin_stage(
+                50 + 50.0 * index / len(items_hook_args),
+                50 + 50.0 * (index + 1) / len(items_hook_args),
+                "Creating PTR Version and uploading movie for %s"
+                % render_media_hook_args["name"],
+            )
+
+            try:
+                versions[indexes[index]] = self._submit(
+                    input_path,
+                    output_path,
+                    thumbnail_path,
+                    sg_publishes,
+                    sg_task,
+                    comment,
+                    render_media_hook_args["first_frame"],
+                    render_media_hook_args["last_frame"],
+                    movie_destination,
+                    fingerprint,
+                    render_media_hook_args.get("additional_outputs"),
+                    self._get_pending_version(pending_versions[index]),
+                )
+            except Exception:
+                # The Versions of the items left won't be completed.
+                for pending_version in pending_versions[index + 1 :]:
+                    self._discard_pending_version(pending_version)
+                raise
+
+        self._log_metric()
+
+        progress.finish("Versions submitted")
+
+        return versions
+
+    def render_version(
+        self, template, fields, first_frame, last_frame, color_space=None
+    ):
+        """
+        Render the media of a Version without submitting it, so the render and the
+        submission can run in different processes, see :meth:`submit_rendered_version`.
+
+        :param template:        The template defining the path where frames should be found.
+        :param fields:          Dictionary of fields to be used to fill out the template with.
+        :param first_frame:     The first frame of the sequence of frames.
+        :param last_frame:      The last frame of the sequence of frames.
+        :param color_space:     The colorspace of the rendered frames
+
+        :returns:               The rendered media, with its ``input_path``, ``output_path``,
+                                ``first_frame``, ``last_frame``, ``movie_destination``,
+                                content ``fingerprint`` and ``additional_outputs``.
+        :rtype:                 dict
+        """
+        self._reset_timings()
+
+        with trace_span("render_version"), profile_submission(
+            self.__app, "render_version"
+        ):
+            input_path, movie_destination, render_media_hook_args = (
+                self._get_render_media_hook_args(
+                    template, fields, first_frame, last_frame, color_space
+                )
+            )
+
+            output_path = self._render(
+                [render_media_hook_args], ProgressReporter(None), 0, 100
+            )[0]
+
+        return {
+            "input_path": input_path,
+            "output_path": output_path,
+            "first_frame": first_frame,
+            "last_frame": last_frame,
+            "movie_destination": movie_destination,
+            "fingerprint": self._get_fingerprint(input_path, render_media_hook_args),
+            "additional_outputs": render_media_hook_args.get("additional_outputs"),
+        }
+
+    def submit_rendered_version(
+        self,
+        rendered,
+        sg_publishes=None,
+        sg_task=None,
+        comment=None,
+        thumbnail_path=None,
+    ):
+        """
+        Submit media rendered by :meth:`render_version`.
+
+        :param dict rendered:   The rendered media returned by :meth:`render_version`.
+        :param sg_publishes:    A list of shotgun published file objects to link the publish against.
+        :param sg_task:         A Shotgun task object to link against. Can be None.
+        :param comment:         A description to add to the Version in Shotgun.
+        :param thumbnail_path:  The path to a thumbnail to use for the version when the movie isn't
+                                being uploaded to Shotgun (this is set in the config)
+
+        :returns:               The Version Shotgun entity dictionary that was created.
+        :rtype:                 dict
+        """
+        self._reset_timings()
+
+        with trace_span("submit_rendered_version"), profile_submission(
+            self.__app, "submit_rendered_version"
+        ):
+            version = self._submit(
+                rendered["input_path"],
+                rendered["output_path"],
+                thumbnail_path,
+                sg_publishes,
+                sg_task,
+                comment,
+                rendered["first_frame"],
+                rendered["last_frame"],
+                rendered["movie_destination"],
+                self._get_submission_fingerprint(
+                    rendered.get("fingerprint"), sg_task, comment
+                ),
+                rendered.get("additional_outputs"),
+            )
+
+        self._log_metric()
+
+        return version
+
+    def _get_render_media_hook_args(
+        self, template, fields, first_frame, last_frame, color_space
+    ):
+        """
+        Build the arguments passed to the render media hook methods.
+
+        :param template:        The template defining the path where frames should be found.
+        :param fields:          Dictionary of fields to be used to fill out the template with.
+        :param first_frame:     The first frame of the sequence of frames.
+        :param last_frame:      The last frame of the sequence of frames.
+        :param color_space:     The colorspace of the rendered frames
+
+        :returns:               The path to the input frames, the final location of the movie
+                                when it is rendered to the scratch space before being stored
+                                there, and the render media hook arguments.
+        :rtype:                 tuple(str, str, dict)
+        """
+
+        # Make sure we don't overwrite the caller's fields
+        fields = copy.copy(fields or {})
 
         if template:
             for key_name in [
@@ -87,9 +494,6 @@ class Actions(object):
         else:
             input_path = None
 
-        # Make sure we don't overwrite the caller's fields
-        fields = copy.copy(fields)
-
         width = self.__app.get_setting("movie_width")
         height = self.__app.get_setting("movie_height")
         fields["width"] = width
@@ -98,8 +502,27 @@ class Actions(object):
         # Get an output path for the movie.
         output_path_template = self.__app.get_template("movie_path_template")
 
+        movie_destination = None
         if output_path_template:
             output_path = output_path_template.apply_fields(fields)
+
+            if not self.__app.get_setting("store_on_disk"):
+                # The movie is only rendered to be uploaded, so keep it on the local
+                # scratch space instead of the storage of the movie path template.
+                output_path = self.__app.scratch_space.allocate(
+                    os.path.basename(output_path)
+                )
+            elif not self.__app.storage.is_local or (
+                self.__app.get_setting("upload_to_shotgun")
+                and self.__app.get_setting("stage_movies_locally")
+            ):
+                # Render locally, the submitter copies the movie to its final location
+                # while uploading it, saving a network read of the movie. Movies stored
+                # in an object storage can only be written this way.
+                movie_destination = output_path
+                output_path = self.__app.scratch_space.allocate(
+                    os.path.basename(output_path)
+                )
         else:
             output_path = None
 
@@ -115,60 +538,841 @@ class Actions(object):
             "color_space": color_space,
         }
 
-        dispatch_progress(20, "Executing the pre-rende hook")
+        # Only passed when configured, so render media hooks implementing the original
+        # interface keep working.
+        additional_outputs = self._get_additional_outputs(
+            output_path,
+            render_media_hook_args["name"],
+            render_media_hook_args["version"],
+        )
+        if additional_outputs:
+            render_media_hook_args["additional_outputs"] = additional_outputs
 
-        self.__app.execute_hook_method(
-            key="render_media_hook",
-            method_name="pre_render",
-            base_class=None,
-            **render_media_hook_args
+        encode_settings = self._get_encode_settings(
+            width, height, first_frame, last_frame, render_media_hook_args["name"]
         )
+        if encode_settings:
+            render_media_hook_args["encode_settings"] = encode_settings
+
+        return input_path, movie_destination, render_media_hook_args
+
+    def _get_encode_settings(self, width, height, first_frame, last_frame, name):
+        """
+        Pick the encode settings fitting the upload of the movie to the
+        ``upload_time_budget`` setting, at the bandwidth measured on the recent uploads.
+
+        :param int width:       Width of the movie.
+        :param int height:      Height of the movie.
+        :param int first_frame: The first frame of the sequence of frames.
+        :param int last_frame:  The last frame of the sequence of frames.
+        :param str name:        Name of the media.
+
+        :returns:               The encode settings, see :meth:`EncodePolicy.choose`. None
+                                when the movie is encoded with the default settings.
+        :rtype:                 dict
+        """
+        upload_budget = self.__app.get_setting("upload_time_budget")
+        if (
+            not upload_budget
+            or not self.__app.get_setting("upload_to_shotgun")
+            or first_frame is None
+            or last_frame is None
+        ):
+            return None
+
+        bandwidth = self.__app.upload_bandwidth.estimate()
+        if not bandwidth:
+            self.__app.log_debug(
+                "No upload measured yet, encoding %s with the default settings." % name
+            )
+            return None
+
+        policy = EncodePolicy(
+            upload_budget,
+            min_bitrate=self.__app.get_setting("encode_min_bitrate"),
+            max_bitrate=self.__app.get_setting("encode_max_bitrate"),
+            min_scale=self.__app.get_setting("encode_min_scale"),
+        )
+        frame_count = execute_hook_method(
+            self.__app,
+            "render_media_hook",
+            "get_rendered_frame_count",
+            first_frame=first_frame,
+            last_frame=last_frame,
+        )
+        encode_settings = policy.choose(width, height, frame_count, bandwidth)
+        if not encode_settings:
+            self.__app.log_debug(
+                "%s fits the upload time budget of %ds at %.1f Mbps with the default "
+                "settings." % (name, upload_budget, bandwidth * 8 / 1e6)
+            )
+            return None
+
+        message = (
+            "Encoding %s at %d kbps and %dx%d to upload it in about %ds at %.1f Mbps, "
+            "for an upload time budget of %ds."
+            % (
+                name,
+                encode_settings["bitrate"],
+                encode_settings["width"],
+                encode_settings["height"],
+                encode_settings["upload_seconds"],
+                bandwidth * 8 / 1e6,
+                upload_budget,
+            )
+        )
+        if encode_settings["within_budget"]:
+            self.__app.log_info(message)
+        else:
+            self.__app.log_warning(
+                "%s The movie is too long to fit the budget at the lowest bitrate and "
+                "resolution allowed." % message
+            )
+        return encode_settings
+
+    def _get_additional_outputs(self, output_path, name, version):
+        """
+        Build the additional outputs to render along with the movie, as configured by
+        the ``additional_outputs`` setting, each of them allocated in the scratch space.
+
+        :param str output_path: Path to the output movie. Can be None.
+        :param str name:        Name of the media.
+        :param int version:     Version number of the media.
+
+        :returns:               The additional outputs, with their ``name``, ``kind``,
+                                ``path``, ``width``, ``height`` and ``field``.
+        :rtype:                 list(dict)
+        :raises RuntimeError:   If the kind of an output is unknown.
+        """
+        if output_path:
+            base_name = os.path.splitext(os.path.basename(output_path))[0]
+        else:
+            base_name = "%s_v%s" % (name, version)
+
+        # The outputs only depend on the settings, only their paths are per media.
+        output_specs = self.__app.context_cache.get(
+            "additional_output_specs", self._get_additional_output_specs
+        )
+        return [
+            dict(
+                spec,
+                path=self.__app.scratch_space.allocate(
+                    "%s_%s%s" % (base_name, spec["name"], extension)
+                ),
+            )
+            for spec, extension in output_specs
+        ]
+
+    def _get_additional_output_specs(self):
+        """
+        Resolve the ``additional_outputs`` setting, the defaults of their kind applied.
+
+        :returns:               The additional outputs without their path, with the
+                                extension of their files.
+        :rtype:                 list(tuple(dict, str))
+        :raises RuntimeError:   If the kind of an output is unknown.
+        """
+        output_specs = []
+        for output in self.__app.get_setting("additional_outputs") or []:
+            defaults = ADDITIONAL_OUTPUT_DEFAULTS.get(output["kind"])
+            if defaults is None:
+                raise RuntimeError(
+                    "Unknown kind %s of the additional output %s, expected one of %s."
+                    % (
+                        output["kind"],
+                        output["name"],
+                        ", ".join(sorted(ADDITIONAL_OUTPUT_DEFAULTS)),
+                    )
+                )
+
+            extension = output.get("extension") or defaults["extension"]
+            if not extension.startswith("."):
+                extension = "." + extension
+
+            output_specs.append(
+                (
+                    {
+                        "name": output["name"],
+                        "kind": output["kind"],
+                        "width": output.get("width") or defaults["width"],
+                        "height": output.get("height") or defaults["height"],
+                        "field": output.get("field") or None,
+                    },
+                    extension,
+                )
+            )
+
+        return output_specs
+
+    def _render(
+        self, items_hook_args, progress, start, end, batch=False, output_locks=None
+    ):
+        """
+        Execute the render media hook for the given items.
+
+        The media rendered to their final location rather than to the scratch space are
+        locked, so the submissions of the host resolving the same path wait for each
+        other, and rendered to a unique staging path first, then moved to their final
+        location, so a failed render never leaves a partial file there.
+
+        :param list(dict) items_hook_args:  Render media hook arguments of each item.
+        :param progress:                    :class:`ProgressReporter` to report progress to.
+        :param float start:                 Overall percentage at the beginning of the render.
+        :param float end:                   Overall percentage at the end of the render.
+        :param bool batch:                  When True, the items are rendered in one go by
+                                            the ``render_batch`` hook method. Otherwise, the
+                                            single item is rendered by the ``render`` method.
+        :param output_locks:                :class:`contextlib.ExitStack` holding the locks
+                                            of the outputs, to keep them locked until they
+                                            are submitted. They are released once rendered
+                                            when None.
+
+        :returns:               Location of the rendered media of each item.
+        :rtype:                 list(str)
+        :raises RuntimeError:   If several items render to the same path, or if the
+                                lock of an output can't be acquired in time.
+        """
+        # The lock of an output path can't be taken twice, checked before taking any.
+        items_by_output_path = collections.defaultdict(list)
+        for render_media_hook_args in items_hook_args:
+            output_path = render_media_hook_args["output_path"]
+            if output_path:
+                items_by_output_path[
+                    os.path.normcase(os.path.abspath(output_path))
+                ].append(render_media_hook_args["name"])
+        for output_path, names in items_by_output_path.items():
+            if len(names) > 1:
+                raise RuntimeError(
+                    "The items %s all render to %s, their names or fields must differ."
+                    % (", ".join(names), output_path)
+                )
+
+        lock_timeout = self.__app.get_setting("output_lock_timeout")
+        with contextlib.ExitStack() as render_locks:
+            staging_paths = {}
+            staged_items_hook_args = []
+            for render_media_hook_args in items_hook_args:
+                output_path = render_media_hook_args["output_path"]
+                if output_path and not self.__app.scratch_space.contains(output_path):
+                    (output_locks or render_locks).enter_context(
+                        OutputLock(output_path, timeout=lock_timeout)
+                    )
+                    staging_path = get_staging_path(output_path)
+                    staging_paths[staging_path] = output_path
+                    render_media_hook_args = dict(
+                        render_media_hook_args, output_path=staging_path
+                    )
+                staged_items_hook_args.append(render_media_hook_args)
+
+            try:
+                output_paths = self._execute_render(
+                    staged_items_hook_args, progress, start, end, batch
+                )
+
+                for index, output_path in enumerate(output_paths):
+                    # Some renderers append the extension of the media to the path.
+                    for staging_path, final_path in staging_paths.items():
+                        if output_path and output_path.startswith(staging_path):
+                            final_path += output_path[len(staging_path) :]
+                            os.replace(output_path, final_path)
+                            output_paths[index] = final_path
+                            break
+            finally:
+                for staging_path in staging_paths:
+                    if os.path.exists(staging_path):
+                        os.unlink(staging_path)
+
+        return output_paths
+
+    def _execute_render(self, items_hook_args, progress, start, end, batch):
+        """
+        Execute the render media hook for the given items, see :meth:`_render`.
+
+        :returns:               Location of the rendered media of each item.
+        :rtype:                 list(str)
+        """
+
+        progress.begin_stage(start, start, "Executing the pre-render hook")
+
+        start_time = time.monotonic()
+
+        self._execute_render_callbacks("pre_render", items_hook_args)
+
+        try:
+            # The render hooks report their progress through report_progress.
+            progress.begin_stage(start, end, "Executing the render hook")
+
+            if not batch:
+                output_paths = [
+                    execute_hook_method(
+                        self.__app, "render_media_hook", "render", **items_hook_args[0]
+                    )
+                ]
+            else:
+                output_paths = list(
+                    execute_hook_method(
+                        self.__app,
+                        "render_media_hook",
+                        "render_batch",
+                        items=items_hook_args,
+                    )
+                )
+
+        finally:
+            progress.begin_stage(end, end, "Executing the post-render hook")
+
+            self._execute_render_callbacks("post_render", items_hook_args)
+
+            self._timings["render_seconds"] += time.monotonic() - start_time
+
+        return output_paths
+
+    def _submit_in_background(
+        self,
+        input_path,
+        movie_destination,
+        render_media_hook_args,
+        thumbnail_path,
+        sg_publishes,
+        sg_task,
+        comment,
+        progress,
+    ):
+        """
+        Capture the frames of the media and encode and submit them in the background.
+
+        :returns:               True if the frames were captured and are being submitted
+                                in the background, False if the render media hook doesn't
+                                support capturing frames.
+        :rtype:                 bool
+        :raises RuntimeError:   If the render media hook didn't capture the frames.
+        """
+
+        # Checked first, so the pre and post render hooks only run once when the media is
+        # rendered as usual instead.
+        if not execute_hook_method(
+            self.__app, "render_media_hook", "supports_frame_capture"
+        ):
+            self.__app.log_debug(
+                "The render media hook doesn't support capturing frames, rendering %s "
+                "as usual." % render_media_hook_args["name"]
+            )
+            return False
+
+        progress.begin_stage(5, 5, "Executing the pre-render hook")
+
+        self._execute_render_callbacks("pre_render", [render_media_hook_args])
+
+        start_time = time.monotonic()
 
         try:
-            dispatch_progress(30, "Executing the render hook")
+            progress.begin_stage(5, 90, "Capturing the frames")
 
-            output_path = self.__app.execute_hook_method(
-                key="render_media_hook",
-                method_name="render",
-                base_class=None,
+            captured = execute_hook_method(
+                self.__app,
+                "render_media_hook",
+                "render_frames",
                 **render_media_hook_args
             )
 
         finally:
-            dispatch_progress(40, "Executing the post-render hook")
+            progress.begin_stage(90, 90, "Executing the post-render hook")
 
-            self.__app.execute_hook_method(
-                key="render_media_hook",
-                method_name="post_render",
-                base_class=None,
-                **render_media_hook_args
+            self._execute_render_callbacks("post_render", [render_media_hook_args])
+
+            self._timings["capture_seconds"] += time.monotonic() - start_time
+
+        # The pre and post render hooks already ran, so the media isn't rendered again.
+        if not captured:
+            raise RuntimeError(
+                "The render media hook didn't capture the frames of %s"
+                % render_media_hook_args["name"]
             )
 
-        dispatch_progress(50, "Creating PTR Version and uploading movie")
+        captured = dict(captured)
+        frames_path = None
+        if captured.pop("temporary", False):
+            frames_path = captured["input_path"]
+
+        encode_args = dict(render_media_hook_args, **captured)
 
+        submit_hook_args = self._get_submit_hook_args(
+            input_path,
+            None,
+            thumbnail_path,
+            sg_publishes,
+            sg_task,
+            comment,
+            encode_args["first_frame"],
+            encode_args["last_frame"],
+            movie_destination,
+            additional_outputs=encode_args.get("additional_outputs"),
+        )
+
+        progress.finish("Encoding and submitting the movie in the background")
+
+        if self.__app.get_setting("submission_daemon_port") and self._submit_to_daemon(
+            encode_args, submit_hook_args, frames_path
+        ):
+            return True
+
+        BackgroundSubmission(
+            self.__app, encode_args, submit_hook_args, frames_path
+        ).start()
+
+        return True
+
+    def _submit_to_daemon(self, encode_args, submit_hook_args, frames_path):
+        """
+        Queue the encoding and the submission of captured frames on the submission daemon
+        of the machine, so they carry on if this session ends.
+
+        :param dict encode_args:        Arguments of the ``encode`` render media hook method.
+        :param dict submit_hook_args:   Arguments of the ``submit_version`` submitter hook method.
+        :param str frames_path:         Path to the captured frames allocated in the scratch
+                                        space. Can be None.
+
+        :returns:               True if the job was queued, False if the daemon can't be reached.
+        :rtype:                 bool
+        """
+        job = {
+            "pipeline_configuration": self.__app.sgtk.pipeline_configuration.get_path(),
+            "context": self.__app.context.serialize(),
+            "app_instance": self.__app.instance_name,
+            "encode_args": dict(encode_args),
+            "submit_args": dict(
+                submit_hook_args,
+                sg_publishes=[
+                    _get_link(sg_publish)
+                    for sg_publish in submit_hook_args["sg_publishes"]
+                ],
+                sg_task=_get_link(submit_hook_args["sg_task"]),
+            ),
+            "frames_path": frames_path,
+            "traceparent": get_traceparent(),
+        }
+
+        # Movies rendered to the scratch space of this session are encoded to the scratch
+        # space of the worker instead, which outlives this session.
+        output_path = encode_args["output_path"]
+        if output_path and self.__app.scratch_space.contains(output_path):
+            job["encode_args"]["output_path"] = None
+            job["output_name"] = os.path.basename(output_path)
+
+        # Same for the additional outputs, always allocated in the scratch space.
+        additional_outputs = encode_args.get("additional_outputs") or []
+        if additional_outputs:
+            job["encode_args"]["additional_outputs"] = [
+                dict(output, path=None, file_name=os.path.basename(output["path"]))
+                for output in additional_outputs
+            ]
+            del job["submit_args"]["additional_outputs"]
+
+        try:
+            job_id = DaemonClient(
+                self.__app.get_setting("submission_daemon_port")
+            ).submit(job)
+        except Exception as e:
+            self.__app.log_warning(
+                "Unable to queue the submission on the submission daemon, submitting it "
+                "from this session instead: %s" % e
+            )
+            return False
+
+        self.__app.log_info(
+            "Queued the submission as job %d of the submission daemon." % job_id
+        )
+
+        # The daemon copied the frames to its own spool folder.
+        if frames_path:
+            self.__app.scratch_space.release(frames_path)
+        if job.get("output_name"):
+            self.__app.scratch_space.release(output_path)
+        for output in additional_outputs:
+            self.__app.scratch_space.release(output["path"])
+
+        return True
+
+    def _execute_render_callbacks(self, method_name, items_hook_args):
+        """
+        Execute the ``pre_render`` or ``post_render`` callback of the render media hook
+        for each item.
+
+        :param str method_name:             Name of the callback to execute.
+        :param list(dict) items_hook_args:  Render media hook arguments of each item.
+        """
+        for render_media_hook_args in items_hook_args:
+            execute_hook_method(
+                self.__app,
+                "render_media_hook",
+                method_name,
+                **self._get_render_args(render_media_hook_args)
+            )
+
+    def _get_render_args(self, render_media_hook_args):
+        """
+        Strip the batch only keys from the render media hook arguments.
+
+        :param dict render_media_hook_args: Render media hook arguments of an item.
+
+        :returns:               Arguments accepted by the single item hook methods.
+        :rtype:                 dict
+        """
+        return dict(
+            (key, value)
+            for key, value in render_media_hook_args.items()
+            if key in RENDER_ARGS
+        )
+
+    def _submit(
+        self,
+        input_path,
+        output_path,
+        thumbnail_path,
+        sg_publishes,
+        sg_task,
+        comment,
+        first_frame,
+        last_frame,
+        movie_destination=None,
+        fingerprint=None,
+        additional_outputs=None,
+        pending_version=None,
+    ):
+        """
+        Execute the submitter hook for a rendered media.
+
+        :returns:               The Version Shotgun entity dictionary that was created.
+        :rtype:                 dict
+        """
+        start_time = time.monotonic()
+        try:
+            return execute_hook_method(
+                self.__app,
+                "submitter_hook",
+                "submit_version",
+                **self._get_submit_hook_args(
+                    input_path,
+                    output_path,
+                    thumbnail_path,
+                    sg_publishes,
+                    sg_task,
+                    comment,
+                    first_frame,
+                    last_frame,
+                    movie_destination,
+                    fingerprint,
+                    additional_outputs,
+                    pending_version,
+                )
+            )
+        finally:
+            self._timings["submit_seconds"] += time.monotonic() - start_time
+            self._timings["versions"] += 1
+
+    def _get_submit_hook_args(
+        self,
+        input_path,
+        output_path,
+        thumbnail_path,
+        sg_publishes,
+        sg_task,
+        comment,
+        first_frame,
+        last_frame,
+        movie_destination=None,
+        fingerprint=None,
+        additional_outputs=None,
+        pending_version=None,
+    ):
+        """
+        Build the arguments passed to the submitter hook ``submit_version`` method.
+
+        The optional arguments are only passed when they are set, so submitter hooks
+        implementing the original interface keep working.
+
+        :returns:               The submitter hook arguments.
+        :rtype:                 dict
+        """
         submit_hook_args = {
             "path_to_frames": input_path,
             "path_to_movie": output_path,
             "thumbnail_path": thumbnail_path,
-            "sg_publishes": sg_publishes,
+            "sg_publishes": sg_publishes or [],
             "sg_task": sg_task,
             "description": comment,
             "first_frame": first_frame,
             "last_frame": last_frame,
         }
 
-        version = self.__app.execute_hook_method(
-            key="submitter_hook",
-            method_name="submit_version",
-            base_class=None,
-            **submit_hook_args
+        if movie_destination:
+            submit_hook_args["movie_destination"] = movie_destination
+        if fingerprint:
+            submit_hook_args["fingerprint"] = fingerprint
+        if additional_outputs:
+            submit_hook_args["additional_outputs"] = additional_outputs
+        if pending_version:
+            submit_hook_args["pending_version"] = pending_version
+
+        return submit_hook_args
+
+    def _create_pending_version(
+        self, input_path, movie_destination, render_media_hook_args, sg_task, comment
+    ):
+        """
+        Start creating the Version of a media from a background thread, so the round
+        trip to the site overlaps the render, when enabled by the
+        ``create_version_early`` setting.
+
+        :param str input_path:  Path to the input frames.
+        :param str movie_destination: Final location of the movie. Can be None.
+        :param dict render_media_hook_args: Render media hook arguments of the media.
+        :param dict sg_task:    The Shotgun task to link the Version to. Can be None.
+        :param str comment:     Description of the Version.
+
+        :returns:               The ``concurrent.futures.Future`` of the Version entity
+                                dictionary, None when disabled.
+        """
+        if not self.__app.get_setting("create_version_early"):
+            return None
+
+        # Named after the movie, like the submitter hook names the Versions.
+        movie_path = movie_destination or render_media_hook_args["output_path"]
+        hook_args = {
+            "path_to_frames": input_path,
+            "name": (
+                os.path.basename(movie_path)
+                if movie_path
+                else render_media_hook_args["name"]
+            ),
+            "sg_task": sg_task,
+            "description": comment,
+            "first_frame": render_media_hook_args["first_frame"],
+            "last_frame": render_media_hook_args["last_frame"],
+        }
+        span = get_current_span()
+
+        def create_pending_version():
+            with attach_span(span):
+                return execute_hook_method(
+                    self.__app, "submitter_hook", "create_pending_version", **hook_args
+                )
+
+        return self.__app.background_executor.submit(create_pending_version)
+
+    def _get_pending_version(self, future):
+        """
+        Wait for the Version created while the media was rendered.
+
+        :param future:          The ``concurrent.futures.Future`` returned by
+                                :meth:`_create_pending_version`. Can be None.
+
+        :returns:               The Version entity dictionary, None if it wasn't created,
+                                in which case the submitter hook creates the Version.
+        :rtype:                 dict
+        """
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception as e:
+            self.__app.log_warning(
+                "Unable to create the Version while rendering, creating it once "
+                "rendered instead: %s" % e
+            )
+            return None
+
+    def _discard_pending_version(self, future):
+        """
+        Delete the Version created while the media was rendered, when the media won't
+        be submitted.
+
+        :param future:          The ``concurrent.futures.Future`` returned by
+                                :meth:`_create_pending_version`. Can be None.
+        """
+        pending_version = self._get_pending_version(future)
+        if not pending_version:
+            return
+
+        try:
+            execute_hook_method(
+                self.__app,
+                "submitter_hook",
+                "discard_pending_version",
+                pending_version=pending_version,
+            )
+        except Exception as e:
+            self.__app.log_warning(
+                "Unable to delete the pending Version %s: %s"
+                % (pending_version["id"], e)
+            )
+
+    def _get_fingerprint(self, input_path, render_media_hook_args):
+        """
+        Fingerprint the input frames and the render settings of a media, so the
+        submitter can recognize media which were already submitted.
+
+        :param str input_path:              Path to the input frames.
+        :param dict render_media_hook_args: Render media hook arguments of the media.
+
+        :returns:               The fingerprint, None if duplicate detection is disabled or
+                                if the input frames can't be found.
+        :rtype:                 str
+        """
+        if not self.__app.get_setting("detect_duplicate_submissions"):
+            return None
+
+        # The output paths change on every render to the scratch space, and the encode
+        # settings with the measured bandwidth, the content stays the same.
+        settings = dict(
+            (key, value)
+            for key, value in render_media_hook_args.items()
+            if key
+            not in (
+                "input_path",
+                "output_path",
+                "additional_outputs",
+                "encode_settings",
+            )
+        )
+        if "additional_outputs" in render_media_hook_args:
+            settings["additional_outputs"] = [
+                dict((key, value) for key, value in output.items() if key != "path")
+                for output in render_media_hook_args["additional_outputs"]
+            ]
+        settings["version_number_padding"] = self.__app.get_setting(
+            "version_number_padding"
         )
+        settings["slate_logo"] = self.__app.get_setting("slate_logo")
+        settings["review_display"] = self.__app.get_setting("review_display")
+        settings["review_view"] = self.__app.get_setting("review_view")
 
-        # Log metrics for this app's usage
+        return get_frames_fingerprint(
+            input_path,
+            render_media_hook_args["first_frame"],
+            render_media_hook_args["last_frame"],
+            settings,
+        )
+
+    def _get_submission_fingerprint(self, fingerprint, sg_task, comment):
+        """
+        Fingerprint the submission of a media, so the media submitted again against
+        another Task, entity or with another comment creates a new Version.
+
+        :param str fingerprint: Fingerprint of the content of the media, see
+                                :meth:`_get_fingerprint`. Can be None.
+        :param dict sg_task:    The Shotgun task the Version is linked to. Can be None.
+        :param str comment:     Description of the Version.
+
+        :returns:               The fingerprint, None if the media has no fingerprint.
+        :rtype:                 str
+        """
+        entity = self.__app.context.entity
+        return get_submission_fingerprint(
+            fingerprint,
+            {
+                "sg_task": sg_task["id"] if sg_task else None,
+                "description": comment,
+                "entity": [entity["type"], entity["id"]] if entity else None,
+            },
+        )
+
+    def _find_submitted_version(
+        self, fingerprint, render_media_hook_args, sg_publishes
+    ):
+        """
+        Find a Version already submitted for the same media, so it is neither rendered
+        nor uploaded again. The publishes are linked to the Version found, and the
+        outputs allocated for the media in the scratch space are released.
+
+        :param str fingerprint: Fingerprint of the submission, see
+                                :meth:`_get_submission_fingerprint`. Can be None.
+        :param dict render_media_hook_args: Render media hook arguments of the media.
+        :param sg_publishes:    A list of shotgun published file objects to link the
+                                Version to.
+
+        :returns:               The Version entity dictionary, None if the media wasn't
+                                submitted yet.
+        :rtype:                 dict
+        """
+        if not fingerprint:
+            return None
+
+        sg_version = execute_hook_method(
+            self.__app,
+            "submitter_hook",
+            "find_submitted_version",
+            fingerprint=fingerprint,
+            sg_publishes=sg_publishes or [],
+        )
+        if not sg_version:
+            return None
+
+        self.__app.log_info(
+            "%s was already submitted as Version %s, skipping its render and upload."
+            % (render_media_hook_args["name"], sg_version["id"])
+        )
+
+        output_path = render_media_hook_args["output_path"]
+        if output_path and self.__app.scratch_space.contains(output_path):
+            self.__app.scratch_space.release(output_path)
+        for output in render_media_hook_args.get("additional_outputs") or []:
+            self.__app.scratch_space.release(output["path"])
+
+        return sg_version
+
+    def _reset_timings(self):
+        """
+        Start timing a new submission in the current thread, so the stages timed by a
+        submission which failed before logging its metrics aren't reported by the next.
+        """
+        self.__submission.timings = collections.defaultdict(float)
+
+    @property
+    def _timings(self):
+        """
+        Duration of the stages of the submission running in the current thread, logged
+        with the usage metrics.
+        """
+        if not hasattr(self.__submission, "timings"):
+            self.__submission.timings = collections.defaultdict(float)
+        return self.__submission.timings
+
+    def _log_metric(self):
+        """
+        Log metrics for this app's usage, along with the duration of the stages of the
+        submission. The core queues the metrics and sends them from its own thread,
+        falling back on ``log_metric`` for the cores without the metrics API.
+        """
+        timings = dict(self._timings)
+        del self.__submission.timings
         try:
-            self.__app.log_metric("Render & Submit Version", log_version=True)
+            try:
+                event_metric = sgtk.util.metrics.EventMetric
+            except AttributeError:
+                self.__app.log_metric("Render & Submit Version", log_version=True)
+            else:
+                event_metric.log(
+                    event_metric.GROUP_MEDIA,
+                    "Render & Submit Version",
+                    properties=timings,
+                    bundle=self.__app,
+                )
         except Exception:
             # ingore any errors. ex: metrics logging not supported
             pass
 
-        return version
+
+def _get_link(entity):
+    """
+    Strip an entity dictionary down to the keys needed to link it.
+
+    :param dict entity:     The entity dictionary. Can be None.
+
+    :returns:               The entity type, id and name, None if no entity was given.
+    :rtype:                 dict
+    """
+    if not entity:
+        return None
+    return dict((key, entity[key]) for key in ("type", "id", "name") if key in entity)
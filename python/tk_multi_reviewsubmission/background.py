@@ -0,0 +1,90 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import os
+import threading
+
+import sgtk
+
+from .locking import OutputLock
+from .profiling import execute_hook_method, profile_submission
+from .tracing import attach_span, get_current_span, trace_span
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class BackgroundSubmission(threading.Thread):
+    """
+    Worker thread encoding captured frames into a movie and submitting it, so the
+    artist doesn't have to wait for the encoding and the upload to complete.
+    """
+
+    def __init__(self, app, encode_args, submit_args, frames_path=None):
+        """
+        :param app:                 The app instance.
+        :param dict encode_args:    Arguments of the ``encode`` render media hook method.
+        :param dict submit_args:    Arguments of the ``submit_version`` submitter hook method.
+                                    ``path_to_movie`` is set to the encoded movie.
+        :param str frames_path:     Path to the captured frames allocated in the scratch
+                                    space, released once the movie is encoded. Can be None.
+        """
+        super().__init__(name="ReviewSubmissionBackgroundSubmission")
+        self._app = app
+        self._encode_args = encode_args
+        self._submit_args = submit_args
+        self._frames_path = frames_path
+
+        # Traced as a child of the submission which started it.
+        self._trace_parent = get_current_span()
+
+    def run(self):
+        """
+        Encode the movie and submit it. A movie encoded to its final location rather
+        than to the scratch space stays locked until it is submitted.
+        """
+        output_path = self._encode_args.get("output_path")
+        try:
+            with attach_span(self._trace_parent), trace_span(
+                "background_submission"
+            ), profile_submission(
+                self._app, "background_submission"
+            ), contextlib.ExitStack() as output_locks:
+                if output_path and not self._app.scratch_space.contains(output_path):
+                    output_locks.enter_context(
+                        OutputLock(
+                            output_path,
+                            timeout=self._app.get_setting("output_lock_timeout"),
+                        )
+                    )
+                self._encode_and_submit()
+        except Exception:
+            logger.exception("Background submission failed.")
+
+    def _encode_and_submit(self):
+        """
+        Encode the movie and submit it, see :meth:`run`.
+        """
+        try:
+            output_path = execute_hook_method(
+                self._app, "render_media_hook", "encode", **self._encode_args
+            )
+        finally:
+            if self._frames_path:
+                self._app.scratch_space.release(self._frames_path)
+
+        submit_args = dict(self._submit_args, path_to_movie=output_path)
+        version = execute_hook_method(
+            self._app, "submitter_hook", "submit_version", **submit_args
+        )
+        logger.info(
+            "Background submission of %s completed: %s"
+            % (os.path.basename(output_path), version)
+        )
@@ -0,0 +1,434 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import csv
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+
+import sgtk
+
+from .daemon import WorkerProcess
+from .tracing import trace_span
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Columns of the CSV manifests holding JSON values.
+JSON_COLUMNS = ("fields", "sg_publishes", "sg_task")
+
+# Number of rows between two throughput reports.
+REPORT_INTERVAL = 50
+
+
+def read_manifest(path):
+    """
+    Read the rows of a manifest.
+
+    A manifest is either a JSON file holding a list of rows, or a CSV file with a header
+    line. Each row has the name of the ``template`` of the frames and its ``fields``,
+    the ``first_frame`` and ``last_frame``, and optionally the ``sg_publishes``,
+    ``sg_task``, ``comment``, ``thumbnail_path`` and ``color_space`` of the Version. The
+    publishes and the task can be given as entity dictionaries or as ids. In CSV files,
+    the ``fields``, ``sg_publishes`` and ``sg_task`` columns hold JSON values.
+
+    :param str path:        Path of the manifest.
+
+    :returns:               The rows of the manifest.
+    :rtype:                 list(dict)
+    :raises ValueError:     If a row is invalid.
+    """
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = []
+            for row in csv.DictReader(f):
+                row = dict((key, value) for key, value in row.items() if value != "")
+                for column in JSON_COLUMNS:
+                    if column in row:
+                        row[column] = json.loads(row[column])
+                rows.append(row)
+    else:
+        with open(path, encoding="utf-8") as f:
+            rows = json.load(f)
+
+    for index, row in enumerate(rows):
+        missing = [key for key in ("template", "fields") if key not in row]
+        if missing:
+            raise ValueError(
+                "Row %d of %s misses %s." % (index + 1, path, ", ".join(missing))
+            )
+        for key in ("first_frame", "last_frame"):
+            if row.get(key) is not None:
+                row[key] = int(row[key])
+
+    return rows
+
+
+def get_row_key(row):
+    """
+    Identify a row by its content, so the rows already submitted are recognized when
+    resuming, even if the manifest was reordered.
+
+    :param dict row:        The row.
+
+    :returns:               Key of the row.
+    :rtype:                 str
+    """
+    return hashlib.sha1(json.dumps(row, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class BulkSubmission(object):
+    """
+    Renders and submits the rows of a manifest in worker processes, see the ``worker``
+    module of the daemon.
+
+    The renders and the submissions run in separate pools of worker processes, so the
+    number of CPU bound renders and the number of network bound uploads running at
+    once can be tuned separately. A rendered row goes to the submission pool while the
+    render pool moves on to the next row.
+
+    The media of each row are rendered to a folder of the scratch space allocated by
+    the run, so they outlive the render worker process until the row is submitted.
+
+    The outcome of each row is appended to a results file as soon as it is known. When
+    the same manifest is run again, the rows completed according to the results file
+    are skipped, so an interrupted run can be resumed safely.
+    """
+
+    def __init__(
+        self, app, manifest_path, render_workers=1, upload_workers=1, results_path=None
+    ):
+        """
+        :param app:                 The app instance.
+        :param str manifest_path:   Path of the manifest, see :func:`read_manifest`.
+        :param int render_workers:  Number of renders running at once.
+        :param int upload_workers:  Number of submissions running at once.
+        :param str results_path:    Path of the results file, one JSON document per line.
+                                    Defaults to the manifest path with a ``.results.jsonl``
+                                    extension.
+        """
+        self._app = app
+        self._manifest_path = manifest_path
+        self._render_workers = max(render_workers, 1)
+        self._upload_workers = max(upload_workers, 1)
+        self._results_path = results_path or (
+            os.path.splitext(manifest_path)[0] + ".results.jsonl"
+        )
+
+        self._lock = threading.Lock()
+        self._counts = {"completed": 0, "failed": 0}
+        self._start_time = None
+        self._traceparent = None
+
+    @property
+    def results_path(self):
+        """
+        Path of the results file.
+        """
+        return self._results_path
+
+    def run(self):
+        """
+        Render and submit the rows of the manifest which aren't completed yet.
+
+        :returns:               Summary of the run, with the number of rows ``completed``,
+                                ``failed`` and ``skipped``, the ``elapsed`` time in seconds
+                                and the ``throughput`` in rows per hour.
+        :rtype:                 dict
+        """
+        # The jobs of the worker processes are traced as children of the run.
+        with trace_span("bulk_submission", manifest=self._manifest_path) as span:
+            self._traceparent = span.traceparent if span else None
+            return self._run()
+
+    def _run(self):
+        """
+        Implementation of :meth:`run`.
+        """
+        rows = read_manifest(self._manifest_path)
+        completed_keys = self._read_completed_keys()
+
+        render_queue = queue.Queue()
+        skipped = 0
+        for index, row in enumerate(rows):
+            key = get_row_key(row)
+            if key in completed_keys:
+                skipped += 1
+            else:
+                render_queue.put((index, key, row))
+
+        logger.info(
+            "Submitting %d rows of %s, skipping %d rows already completed."
+            % (render_queue.qsize(), self._manifest_path, skipped)
+        )
+
+        # Renders wait for the submissions to catch up, so the rendered media don't pile
+        # up in the scratch space.
+        upload_queue = queue.Queue(self._upload_workers * 2)
+        self._start_time = time.time()
+
+        render_slots = self._start_slots(
+            "Render",
+            self._render_workers,
+            self._run_render_slot,
+            render_queue,
+            upload_queue,
+        )
+        upload_slots = self._start_slots(
+            "Upload", self._upload_workers, self._run_upload_slot, upload_queue
+        )
+
+        for slot in render_slots:
+            slot.join()
+        for _ in upload_slots:
+            upload_queue.put(None)
+        for slot in upload_slots:
+            slot.join()
+
+        summary = dict(self._counts, skipped=skipped, **self._get_throughput())
+        logger.info(
+            "Completed %(completed)d rows, %(failed)d failed and %(skipped)d skipped in "
+            "%(elapsed).0f seconds (%(throughput).1f rows per hour)." % summary
+        )
+        return summary
+
+    def _start_slots(self, name, count, target, *args):
+        """
+        Start the threads driving the worker processes of a pool.
+
+        :param str name:        Name of the pool.
+        :param int count:       Number of worker processes of the pool.
+        :param target:          Callable driving a worker process.
+
+        :returns:               The started threads.
+        :rtype:                 list(threading.Thread)
+        """
+        slots = []
+        for index in range(count):
+            slot = threading.Thread(
+                target=target,
+                args=args,
+                name="ReviewSubmissionBulk%s%d" % (name, index),
+            )
+            slot.daemon = True
+            slot.start()
+            slots.append(slot)
+        return slots
+
+    def _run_render_slot(self, render_queue, upload_queue):
+        """
+        Render the queued rows in a worker process and queue them for submission.
+        """
+        worker = None
+        try:
+            while True:
+                try:
+                    index, key, row = render_queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    job = self._get_job(row, "render")
+                except Exception as e:
+                    self._record(index, key, error="Render failed: %s" % e)
+                    continue
+
+                scratch_folder = self._app.scratch_space.allocate_folder()
+                job.update(
+                    template=row["template"],
+                    fields=row["fields"],
+                    first_frame=row.get("first_frame"),
+                    last_frame=row.get("last_frame"),
+                    color_space=row.get("color_space"),
+                    scratch_folder=scratch_folder,
+                )
+
+                worker = worker or WorkerProcess()
+                try:
+                    outcome = worker.run(job)
+                except RuntimeError as e:
+                    worker = None
+                    outcome = {"error": str(e)}
+
+                if "error" in outcome:
+                    self._app.scratch_space.release_folder(scratch_folder)
+                    self._record(
+                        index, key, error="Render failed: %s" % outcome["error"]
+                    )
+                else:
+                    upload_queue.put((index, key, row, job, outcome["result"]))
+        finally:
+            if worker:
+                worker.close()
+
+    def _run_upload_slot(self, upload_queue):
+        """
+        Submit the rendered rows in a worker process until the queue is closed.
+        """
+        worker = None
+        try:
+            while True:
+                item = upload_queue.get()
+                if item is None:
+                    return
+                index, key, row, job, rendered = item
+
+                try:
+                    job = dict(
+                        job,
+                        action="submit",
+                        rendered=rendered,
+                        sg_publishes=self._get_publishes(row.get("sg_publishes")),
+                        sg_task=_get_entity("Task", row.get("sg_task")),
+                        comment=row.get("comment"),
+                        thumbnail_path=row.get("thumbnail_path"),
+                    )
+                except Exception as e:
+                    outcome = {"error": str(e)}
+                else:
+                    worker = worker or WorkerProcess()
+                    try:
+                        outcome = worker.run(job)
+                    except RuntimeError as e:
+                        worker = None
+                        outcome = {"error": str(e)}
+                finally:
+                    self._app.scratch_space.release_folder(job["scratch_folder"])
+
+                if "error" in outcome:
+                    self._record(
+                        index, key, error="Submission failed: %s" % outcome["error"]
+                    )
+                else:
+                    self._record(index, key, version=outcome["result"]["version"])
+        finally:
+            if worker:
+                worker.close()
+
+    def _get_job(self, row, action):
+        """
+        Build the job of a worker process for a row, in the context of its frames.
+
+        :param dict row:        The row.
+        :param str action:      Action of the job.
+
+        :returns:               The job.
+        :rtype:                 dict
+        """
+        tk = self._app.sgtk
+        path = tk.templates[row["template"]].apply_fields(row["fields"])
+
+        return {
+            "action": action,
+            "pipeline_configuration": tk.pipeline_configuration.get_path(),
+            "context": tk.context_from_path(path).serialize(),
+            "app_instance": self._app.instance_name,
+            "traceparent": self._traceparent,
+        }
+
+    def _get_publishes(self, sg_publishes):
+        """
+        Convert the publishes of a row to entity dictionaries.
+
+        :param list sg_publishes:   Publishes as entity dictionaries or ids.
+
+        :returns:               The publishes entity dictionaries.
+        :rtype:                 list(dict)
+        """
+        if not sg_publishes:
+            return []
+
+        entity_type = sgtk.util.get_published_file_entity_type(self._app.sgtk)
+        if not isinstance(sg_publishes, list):
+            sg_publishes = [sg_publishes]
+        return [_get_entity(entity_type, sg_publish) for sg_publish in sg_publishes]
+
+    def _read_completed_keys(self):
+        """
+        :returns:               Keys of the rows completed according to the results file.
+        :rtype:                 set(str)
+        """
+        keys = set()
+        if not os.path.exists(self._results_path):
+            return keys
+
+        with open(self._results_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    # Line left incomplete by an interrupted run.
+                    continue
+                if result.get("state") == "completed":
+                    keys.add(result["key"])
+        return keys
+
+    def _record(self, index, key, version=None, error=None):
+        """
+        Append the outcome of a row to the results file and report the throughput.
+        """
+        state = "failed" if error else "completed"
+        result = {
+            "row": index + 1,
+            "key": key,
+            "state": state,
+            "version": version,
+            "error": error,
+            "time": time.time(),
+        }
+
+        with self._lock:
+            with open(self._results_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(result) + "\n")
+
+            self._counts[state] += 1
+            done = self._counts["completed"] + self._counts["failed"]
+            throughput = self._get_throughput()
+
+        if error:
+            logger.error("Row %d: %s" % (index + 1, error))
+        else:
+            logger.info("Row %d: submitted %s." % (index + 1, version))
+
+        if done % REPORT_INTERVAL == 0:
+            logger.info(
+                "%d rows done in %.0f seconds (%.1f rows per hour)."
+                % (done, throughput["elapsed"], throughput["throughput"])
+            )
+
+    def _get_throughput(self):
+        """
+        :returns:               The ``elapsed`` time in seconds and the ``throughput`` in
+                                rows per hour.
+        :rtype:                 dict
+        """
+        elapsed = time.time() - self._start_time
+        done = self._counts["completed"] + self._counts["failed"]
+        return {
+            "elapsed": elapsed,
+            "throughput": done * 3600.0 / elapsed if elapsed else 0.0,
+        }
+
+
+def _get_entity(entity_type, entity):
+    """
+    Convert an entity given as an id to an entity dictionary.
+
+    :param str entity_type: Type of the entity when given as an id.
+    :param entity:          The entity, as an entity dictionary or an id. Can be None.
+
+    :returns:               The entity dictionary, None if no entity was given.
+    :rtype:                 dict
+    """
+    if entity is None or isinstance(entity, dict):
+        return entity
+    return {"type": entity_type, "id": int(entity)}
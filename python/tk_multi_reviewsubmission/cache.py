@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import threading
+import time
+
+
+class SessionCache(object):
+    """
+    Caches the values looked up on the site for the duration of a session, like the
+    current user or the schema of the Version entity, so each submission doesn't have
+    to look them up again.
+
+    The values expire after a while, so changes made on the site are eventually picked
+    up, and the whole cache is cleared when the context changes.
+    """
+
+    def __init__(self, ttl=300, clock=time.monotonic):
+        """
+        :param float ttl:       Number of seconds the values are kept, 0 to disable the cache.
+        :param clock:           Callable returning the current time in seconds.
+        """
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def get(self, key, factory):
+        """
+        Get a value, looking it up when it isn't cached or expired.
+
+        The lookup runs outside of the lock of the cache, so concurrent submissions
+        might look the same value up at the same time, the last one winning.
+
+        :param str key:         Key of the value.
+        :param factory:         Callable looking the value up.
+
+        :returns:               The value.
+        """
+        now = self._clock()
+        with self._lock:
+            if key in self._values:
+                value, expiry = self._values[key]
+                if now < expiry:
+                    return value
+
+        value = factory()
+
+        if self._ttl:
+            with self._lock:
+                self._values[key] = (value, now + self._ttl)
+
+        return value
+
+    def invalidate(self, key=None):
+        """
+        Forget a value, or all of them.
+
+        :param str key:         Key of the value to forget, all the values when None.
+        """
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+
+class ContextCache(object):
+    """
+    Caches the values derived from the context and the settings of the app, like the
+    slate and burn-in texts or the resolved additional outputs, so the submissions made in the
+    same context don't derive them again.
+
+    The values are built on first use and kept until the context changes, the settings
+    changing along with the environment of the context.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def get(self, key, factory):
+        """
+        Get a value, building it when it isn't cached.
+
+        The value is built outside of the lock of the cache, so concurrent submissions
+        might build the same value at the same time, the first one winning.
+
+        :param str key:         Key of the value.
+        :param factory:         Callable building the value from the current context.
+
+        :returns:               The value.
+        """
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+
+        value = factory()
+
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def invalidate(self):
+        """
+        Forget all the values, e.g. when the context changes.
+        """
+        with self._lock:
+            self._values.clear()
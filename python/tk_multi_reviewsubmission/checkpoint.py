@@ -0,0 +1,231 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Number of seconds the checkpoints of the renders which were never resumed are kept.
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+_MANIFEST_NAME = "manifest.json"
+
+
+class RenderCheckpoint(object):
+    """
+    Checkpoints of a long render, split into segments of a fixed number of frames.
+
+    Each output of the render is written segment by segment to the checkpoint folder
+    and the completed segments are recorded in a manifest. When the render is
+    interrupted, running it again with the same key only renders the missing
+    segments. The segments of each movie are then joined with ffmpeg, without encoding
+    them again.
+
+    The checkpoints are keyed by the fingerprint of the input frames and of the render
+    settings, see :func:`get_frames_fingerprint`, so a change of either starts over.
+    """
+
+    def __init__(self, root, key, first_frame, last_frame, segment_size):
+        """
+        :param str root:        Folder holding the checkpoints of all the renders.
+        :param str key:         Fingerprint of the render.
+        :param int first_frame: First frame of the render, the slate frame included.
+        :param int last_frame:  Last frame of the render.
+        :param int segment_size: Number of frames of the segments.
+        """
+        self._folder = os.path.join(root, key)
+        self._manifest = {
+            "key": key,
+            "first_frame": first_frame,
+            "last_frame": last_frame,
+            "segment_size": segment_size,
+            "completed": [],
+        }
+
+        manifest_path = os.path.join(self._folder, _MANIFEST_NAME)
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+
+        if manifest and all(
+            manifest.get(name) == self._manifest[name]
+            for name in ("key", "first_frame", "last_frame", "segment_size")
+        ):
+            self._manifest["completed"] = manifest["completed"]
+            logger.info(
+                "Resuming the render from its checkpoint, %d segments out of %d were "
+                "already rendered." % (len(self.completed), len(self.segments))
+            )
+        else:
+            shutil.rmtree(self._folder, ignore_errors=True)
+
+        os.makedirs(self._folder, exist_ok=True)
+
+    @property
+    def segments(self):
+        """
+        Frame range of each segment, as a list of ``(first_frame, last_frame)``.
+        """
+        first_frame = self._manifest["first_frame"]
+        last_frame = self._manifest["last_frame"]
+        segment_size = self._manifest["segment_size"]
+        return [
+            (start, min(start + segment_size - 1, last_frame))
+            for start in range(first_frame, last_frame + 1, segment_size)
+        ]
+
+    @property
+    def completed(self):
+        """
+        Indices of the segments already rendered.
+        """
+        return list(self._manifest["completed"])
+
+    def get_pending_segments(self):
+        """
+        :returns:               Index and frame range of each segment left to render, as a
+                                list of ``(index, first_frame, last_frame)``.
+        :rtype:                 list(tuple)
+        """
+        completed = set(self._manifest["completed"])
+        return [
+            (index, first_frame, last_frame)
+            for index, (first_frame, last_frame) in enumerate(self.segments)
+            if index not in completed
+        ]
+
+    def get_segment_path(self, output_name, index, extension):
+        """
+        :param str output_name: Name of the output.
+        :param int index:       Index of the segment.
+        :param str extension:   Extension of the output.
+
+        :returns:               Path to write a segment of an output to.
+        :rtype:                 str
+        """
+        return os.path.join(self._folder, "%s.%04d%s" % (output_name, index, extension))
+
+    def get_still_path(self, output_name, extension):
+        """
+        :param str output_name: Name of the output.
+        :param str extension:   Extension of the output.
+
+        :returns:               Path to write an output made of a single image to.
+        :rtype:                 str
+        """
+        return os.path.join(self._folder, "%s%s" % (output_name, extension))
+
+    def complete_segment(self, index):
+        """
+        Record a segment as rendered.
+
+        :param int index:       Index of the segment.
+        """
+        if index in self._manifest["completed"]:
+            return
+        self._manifest["completed"].append(index)
+
+        # Replace the manifest atomically, an interruption keeps the previous one.
+        fd, temp_path = tempfile.mkstemp(suffix=".json", dir=self._folder)
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._manifest, f)
+        os.replace(temp_path, os.path.join(self._folder, _MANIFEST_NAME))
+
+    def join(self, output_name, extension, output_path, ffmpeg_path="ffmpeg"):
+        """
+        Join the segments of a movie without encoding them again.
+
+        :param str output_name: Name of the output.
+        :param str extension:   Extension of the output.
+        :param str output_path: Path to write the movie to.
+        :param str ffmpeg_path: Path to the ffmpeg executable, or its name if it is in the
+                                PATH.
+        :raises RuntimeError:   If segments are missing or if ffmpeg fails.
+        """
+        pending = self.get_pending_segments()
+        if pending:
+            raise RuntimeError(
+                "Unable to join %s, %d segments are missing."
+                % (output_name, len(pending))
+            )
+
+        list_path = os.path.join(self._folder, "%s.txt" % output_name)
+        with open(list_path, "w", encoding="utf-8") as f:
+            for index in range(len(self.segments)):
+                segment_path = self.get_segment_path(output_name, index, extension)
+                f.write("file '%s'\n" % segment_path.replace("'", "'\\''"))
+
+        command = [
+            ffmpeg_path,
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            list_path,
+            "-c",
+            "copy",
+            output_path,
+        ]
+        logger.debug("Running %s" % subprocess.list2cmdline(command))
+
+        process = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        if process.returncode != 0:
+            raise RuntimeError(
+                "ffmpeg failed to join the segments of %s with exit code %d: %s"
+                % (
+                    output_name,
+                    process.returncode,
+                    process.stderr.decode("utf-8", "replace").strip(),
+                )
+            )
+
+    def discard(self):
+        """
+        Remove the checkpoint, once its outputs were joined.
+        """
+        shutil.rmtree(self._folder, ignore_errors=True)
+
+    @staticmethod
+    def cleanup(root, max_age=DEFAULT_MAX_AGE):
+        """
+        Remove the checkpoints of the renders which were not resumed for a while.
+
+        :param str root:        Folder holding the checkpoints of all the renders.
+        :param float max_age:   Number of seconds the checkpoints are kept.
+        """
+        try:
+            names = os.listdir(root)
+        except OSError:
+            return
+
+        deadline = time.time() - max_age
+        for name in names:
+            folder = os.path.join(root, name)
+            try:
+                if os.path.getmtime(folder) < deadline:
+                    shutil.rmtree(folder, ignore_errors=True)
+            except OSError:
+                pass
@@ -0,0 +1,131 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+import tempfile
+
+import sgtk
+
+try:
+    import PyOpenColorIO as OCIO
+except ImportError:
+    OCIO = None
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class ColorLutCache(object):
+    """
+    Bakes the transforms from the colour spaces of the input frames to the review
+    display into 3D LUTs, using the OpenColorIO config of the environment.
+
+    Each LUT is baked once per config, colour space and display, and stored in a folder
+    shared by the sessions of the machine. The LUTs are ``.cube`` files, applied by the
+    ``lut3d`` filter of ffmpeg with a single lookup per pixel instead of evaluating the
+    whole transform.
+    """
+
+    def __init__(self, folder, cube_size=33):
+        """
+        :param str folder:      Folder storing the LUTs, created if needed.
+        :param int cube_size:   Number of samples of each axis of the LUTs.
+        """
+        self._folder = folder
+        self._cube_size = cube_size
+
+    @classmethod
+    def is_supported(cls):
+        """
+        :returns:               Whether OpenColorIO can be imported.
+        :rtype:                 bool
+        """
+        return OCIO is not None
+
+    def get_lut(self, color_space, display=None, view=None):
+        """
+        Get the LUT transforming a colour space to a display, baking it if needed.
+
+        :param str color_space: Colour space of the input frames.
+        :param str display:     Display of the review media, the default display of the
+                                config when None.
+        :param str view:        View of the display, its default view when None.
+
+        :returns:               Path to the LUT.
+        :rtype:                 str
+        :raises RuntimeError:   If OpenColorIO can't be imported or if the transform can't
+                                be baked.
+        """
+        if OCIO is None:
+            raise RuntimeError("PyOpenColorIO can't be imported.")
+
+        try:
+            config = OCIO.GetCurrentConfig()
+            display = display or config.getDefaultDisplay()
+            view = view or config.getDefaultView(display)
+
+            key = hashlib.sha256(
+                "\0".join(
+                    [
+                        config.getCacheID(),
+                        color_space,
+                        display,
+                        view,
+                        str(self._cube_size),
+                    ]
+                ).encode("utf-8")
+            ).hexdigest()
+            lut_path = os.path.join(self._folder, "%s.cube" % key)
+            if os.path.isfile(lut_path):
+                return lut_path
+
+            logger.debug(
+                "Baking the %s to %s/%s LUT to %s"
+                % (color_space, display, view, lut_path)
+            )
+            lut = self._bake(config, color_space, display, view)
+        except Exception as e:
+            raise RuntimeError(
+                "Unable to bake the transform from %s to the review display: %s"
+                % (color_space, e)
+            )
+
+        # Publish the LUT atomically, the sessions baking it concurrently write the same data.
+        os.makedirs(self._folder, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".cube", dir=self._folder)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(lut)
+            os.replace(temp_path, lut_path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+        return lut_path
+
+    def _bake(self, config, color_space, display, view):
+        """
+        Bake a transform, with the OpenColorIO 1 or 2 API.
+
+        :returns:               The content of the ``.cube`` file.
+        :rtype:                 str
+        """
+        baker = OCIO.Baker()
+        baker.setConfig(config)
+        baker.setFormat("resolve_cube")
+        baker.setInputSpace(color_space)
+        baker.setCubeSize(self._cube_size)
+
+        if hasattr(baker, "setDisplayView"):
+            baker.setDisplayView(display, view)
+        else:
+            baker.setTargetSpace(config.getDisplayColorSpaceName(display, view))
+
+        return baker.bake()
@@ -0,0 +1,170 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+
+# Printf style frame number token of the frames paths, e.g. %04d.
+FRAME_TOKEN_RE = re.compile(r"%0?\d*d")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    fingerprint TEXT NOT NULL,
+    version_id INTEGER NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (fingerprint, version_id)
+);
+"""
+
+
+def get_frames_fingerprint(input_path, first_frame, last_frame, settings=None):
+    """
+    Fingerprint a sequence of frames along with the settings used to render it.
+
+    The frames are identified by their path, size and modification time, so they don't
+    have to be read. No fingerprint is computed when some of the frames can't be found,
+    like for the media rendered from a DCC scene, as the input path doesn't identify
+    the content of the media then.
+
+    :param str input_path:      Path to the frames, with the frame number as a printf
+                                style token, e.g. ``shot.%04d.exr``.
+    :param int first_frame:     The first frame of the sequence of frames.
+    :param int last_frame:      The last frame of the sequence of frames.
+    :param dict settings:       The render settings, serializable to JSON.
+
+    :returns:               The fingerprint, None if the frames can't all be found.
+    :rtype:                 str
+    """
+    if not input_path or first_frame is None or last_frame is None:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(settings or {}, sort_keys=True, default=str).encode("utf-8")
+    )
+
+    for frame in range(first_frame, last_frame + 1):
+        frame_path = FRAME_TOKEN_RE.sub(
+            lambda match: match.group(0) % frame, input_path
+        )
+        try:
+            stat = os.stat(frame_path)
+        except OSError:
+            return None
+        digest.update(
+            ("%s\0%d\0%d\n" % (frame_path, stat.st_size, stat.st_mtime_ns)).encode(
+                "utf-8"
+            )
+        )
+
+    return digest.hexdigest()
+
+
+def get_submission_fingerprint(fingerprint, submission):
+    """
+    Fingerprint the submission of a content, so the same frames submitted against
+    another Task or with another description aren't taken for a duplicate.
+
+    :param str fingerprint:     Fingerprint of the content, see :func:`get_frames_fingerprint`.
+    :param dict submission:     The fields of the submission, serializable to JSON.
+
+    :returns:               The fingerprint, None if the content has no fingerprint.
+    :rtype:                 str
+    """
+    if not fingerprint:
+        return None
+
+    digest = hashlib.sha256(fingerprint.encode("utf-8"))
+    digest.update(json.dumps(submission, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ContentIndex(object):
+    """
+    Local index of the Versions submitted, keyed by the fingerprint of their content,
+    see :func:`get_frames_fingerprint`.
+
+    The index is stored in a SQLite database shared by the processes of the machine,
+    each operation using its own short lived connection.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        """
+        :param str path:        Path of the database file, created if needed.
+        :param float timeout:   Number of seconds to wait for another process to release
+                                the database.
+        """
+        self._path = path
+        self._timeout = timeout
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    def find(self, fingerprint):
+        """
+        :param str fingerprint: Fingerprint of the content.
+
+        :returns:               The Versions indexed for the content, newest first.
+        :rtype:                 list(dict)
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT version_id FROM versions WHERE fingerprint = ? "
+                "ORDER BY created DESC",
+                (fingerprint,),
+            ).fetchall()
+        return [{"type": "Version", "id": row[0]} for row in rows]
+
+    def add(self, fingerprint, version):
+        """
+        Index a Version.
+
+        :param str fingerprint: Fingerprint of the content of the Version.
+        :param dict version:    The Version entity dictionary.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO versions (fingerprint, version_id, created) "
+                "VALUES (?, ?, ?)",
+                (fingerprint, version["id"], time.time()),
+            )
+
+    def discard(self, fingerprint, version_ids):
+        """
+        Remove Versions from the index, e.g. when they were deleted from the site.
+
+        :param str fingerprint: Fingerprint of the content of the Versions.
+        :param list(int) version_ids: Ids of the Versions to remove.
+        """
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM versions WHERE fingerprint = ? AND version_id = ?",
+                [(fingerprint, version_id) for version_id in version_ids],
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """
+        Open a connection, committing its changes and closing it on exit.
+
+        :returns:               Context manager giving the connection.
+        """
+        connection = sqlite3.connect(self._path, timeout=self._timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
@@ -0,0 +1,219 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import socket
+import stat
+import sys
+
+import sgtk
+
+
+class DaemonClient(object):
+    """
+    Client of the :class:`SubmissionDaemon` running on the local machine.
+
+    The daemon and its clients share a token, written by the daemon to a file only its
+    user can read, see :func:`get_token_path`. Each connection first checks the process
+    listening on the port knows the token, so the jobs and the credentials they carry
+    are never sent to the process of another user, then sends the token along with the
+    request.
+
+    Each request opens its own connection, so a client can be used from any thread.
+    Connection failures raise ``OSError`` and the requests rejected by the daemon raise
+    ``RuntimeError``.
+    """
+
+    def __init__(self, port, host="127.0.0.1", timeout=10.0, token_path=None):
+        """
+        :param int port:        Port the daemon listens on.
+        :param str host:        Address the daemon listens on.
+        :param float timeout:   Number of seconds to wait for the daemon to answer.
+        :param str token_path:  Path of the token file of the daemon, see
+                                :func:`get_token_path` when None.
+        """
+        self._address = (host, port)
+        self._timeout = timeout
+        self._token_path = token_path or get_token_path(port)
+
+    def ping(self):
+        """
+        Check the daemon is running.
+
+        :returns:               Identifier of the process of the daemon.
+        :rtype:                 int
+        """
+        return self._request("ping")["pid"]
+
+    def submit(self, job, priority=0):
+        """
+        Queue a job, see :meth:`SubmissionDaemon.submit`.
+
+        :param dict job:        The job.
+        :param int priority:    Priority of the job, higher priorities are run first.
+
+        :returns:               Identifier of the job.
+        :rtype:                 int
+        """
+        return self._request("submit", job=job, priority=priority)["id"]
+
+    def get_status(self, job_id):
+        """
+        :param int job_id:      Identifier of the job.
+
+        :returns:               Status of the job, with its ``state``, its ``result`` once
+                                completed or its ``error`` if it failed. None if there is no
+                                such job.
+        :rtype:                 dict
+        """
+        return self._request("status", id=job_id)["job"]
+
+    def list_jobs(self, state=None):
+        """
+        :param str state:       State of the jobs to list, all the jobs when None.
+
+        :returns:               Status of the jobs.
+        :rtype:                 list(dict)
+        """
+        return self._request("list", state=state)["jobs"]
+
+    def _request(self, command, **kwargs):
+        """
+        Send a request to the daemon.
+
+        :param str command:     Name of the command to run.
+
+        :returns:               The response of the daemon.
+        :rtype:                 dict
+        :raises RuntimeError:   If the daemon rejected the request or the process
+                                listening on the port isn't the daemon of this user.
+        """
+        token = read_token(self._token_path)
+        challenge = secrets.token_hex(16)
+
+        with socket.create_connection(self._address, self._timeout) as connection:
+            with connection.makefile("rwb") as stream:
+                proof = _send(stream, "authenticate", challenge=challenge)["proof"]
+                if not hmac.compare_digest(proof, sign(token, challenge)):
+                    raise RuntimeError(
+                        "The process listening on port %d isn't the submission daemon "
+                        "of this user." % self._address[1]
+                    )
+                return _send(stream, command, token=token, **kwargs)
+
+
+def get_token_path(port):
+    """
+    Get the path of the token file of the daemon listening on a port, in the Toolkit
+    cache folder of the user.
+
+    :param int port:        Port the daemon listens on.
+
+    :returns:               Path of the token file.
+    :rtype:                 str
+    """
+    return os.path.join(
+        sgtk.util.LocalFileStorageManager.get_global_root(
+            sgtk.util.LocalFileStorageManager.CACHE
+        ),
+        "tk-multi-reviewsubmission",
+        "submission_daemon_%d.token" % port,
+    )
+
+
+def write_token(path):
+    """
+    Write a new token to a file only the current user can read.
+
+    On Windows, the file relies on the permissions of the user profile holding it.
+
+    :param str path:        Path of the token file.
+
+    :returns:               The token.
+    :rtype:                 str
+    """
+    folder = os.path.dirname(path)
+    os.makedirs(folder, mode=0o700, exist_ok=True)
+
+    token = secrets.token_hex(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        if sys.platform != "win32":
+            os.fchmod(f.fileno(), 0o600)
+        f.write(token)
+    return token
+
+
+def read_token(path):
+    """
+    Read a token written by :func:`write_token`.
+
+    :param str path:        Path of the token file.
+
+    :returns:               The token.
+    :rtype:                 str
+    :raises RuntimeError:   If the file can be read or written by other users.
+    """
+    with open(path) as f:
+        if sys.platform != "win32":
+            info = os.fstat(f.fileno())
+            if info.st_uid != os.getuid() or info.st_mode & (
+                stat.S_IRWXG | stat.S_IRWXO
+            ):
+                raise RuntimeError(
+                    "The token file %s of the submission daemon must only be readable "
+                    "by its owner." % path
+                )
+        return f.read().strip()
+
+
+def sign(token, challenge):
+    """
+    :param str token:       The token of the daemon.
+    :param str challenge:   A random challenge.
+
+    :returns:               The proof the token is known, for the challenge.
+    :rtype:                 str
+    """
+    return hmac.new(
+        token.encode("utf-8"), challenge.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def _send(stream, command, **kwargs):
+    """
+    Send a request to the daemon on a connection and read its response.
+
+    :param stream:          File object of the connection.
+    :param str command:     Name of the command to run.
+
+    :returns:               The response of the daemon.
+    :rtype:                 dict
+    :raises RuntimeError:   If the daemon rejected the request.
+    """
+    request = dict(kwargs, command=command)
+    stream.write(json.dumps(request).encode("utf-8") + b"\n")
+    stream.flush()
+    line = stream.readline()
+
+    if not line:
+        raise RuntimeError("The submission daemon closed the connection.")
+
+    response = json.loads(line)
+    if not response.pop("ok"):
+        raise RuntimeError(
+            "The submission daemon rejected the %s request: %s"
+            % (command, response["error"])
+        )
+    return response
@@ -0,0 +1,206 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# States of the jobs.
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, priority, id);
+"""
+
+# Columns returned by the status queries. The payload holds the user credentials
+# and is never returned.
+_STATUS_COLUMNS = (
+    "id",
+    "priority",
+    "state",
+    "result",
+    "error",
+    "created",
+    "started",
+    "finished",
+)
+
+
+class JobQueue(object):
+    """
+    Persistent queue of submission jobs, stored in a SQLite database so the queued
+    jobs survive a restart of the daemon.
+
+    The jobs are taken by decreasing priority, then in the order they were queued.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path:        Path of the database file, created if needed.
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(_SCHEMA)
+
+        # The payloads hold the serialized user credentials.
+        os.chmod(path, 0o600)
+
+    def put(self, payload, priority=0):
+        """
+        Queue a job.
+
+        :param dict payload:    Description of the job, serializable to JSON.
+        :param int priority:    Priority of the job, higher priorities are taken first.
+
+        :returns:               Identifier of the job.
+        :rtype:                 int
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO jobs (priority, state, payload, created) VALUES (?, ?, ?, ?)",
+                (int(priority), QUEUED, json.dumps(payload), time.time()),
+            )
+            return cursor.lastrowid
+
+    def take(self):
+        """
+        Take the next queued job and mark it as running.
+
+        :returns:               Identifier and payload of the job, None if no job is queued.
+        :rtype:                 tuple(int, dict)
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, payload FROM jobs WHERE state = ? "
+                "ORDER BY priority DESC, id LIMIT 1",
+                (QUEUED,),
+            ).fetchone()
+            if not row:
+                return None
+
+            self._connection.execute(
+                "UPDATE jobs SET state = ?, started = ? WHERE id = ?",
+                (RUNNING, time.time(), row[0]),
+            )
+            return row[0], json.loads(row[1])
+
+    def complete(self, job_id, result):
+        """
+        Mark a job as completed.
+
+        :param int job_id:      Identifier of the job.
+        :param dict result:     Result of the job, serializable to JSON.
+        """
+        self._finish(job_id, COMPLETED, json.dumps(result), None)
+
+    def fail(self, job_id, error):
+        """
+        Mark a job as failed.
+
+        :param int job_id:      Identifier of the job.
+        :param str error:       Description of the failure.
+        """
+        self._finish(job_id, FAILED, None, error)
+
+    def requeue_running(self):
+        """
+        Queue again the jobs left running by a previous run of the daemon.
+
+        :returns:               Number of jobs queued again.
+        :rtype:                 int
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET state = ?, started = NULL WHERE state = ?",
+                (QUEUED, RUNNING),
+            )
+            return cursor.rowcount
+
+    def get(self, job_id):
+        """
+        :param int job_id:      Identifier of the job.
+
+        :returns:               Status of the job, None if there is no such job.
+        :rtype:                 dict
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT %s FROM jobs WHERE id = ?" % ", ".join(_STATUS_COLUMNS),
+                (job_id,),
+            ).fetchone()
+        return _to_status(row) if row else None
+
+    def list(self, state=None):
+        """
+        :param str state:       State of the jobs to list, all the jobs when None.
+
+        :returns:               Status of the jobs, in the order they were queued.
+        :rtype:                 list(dict)
+        """
+        query = "SELECT %s FROM jobs" % ", ".join(_STATUS_COLUMNS)
+        params = ()
+        if state:
+            query += " WHERE state = ?"
+            params = (state,)
+
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY id", params).fetchall()
+        return [_to_status(row) for row in rows]
+
+    def close(self):
+        """
+        Close the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _finish(self, job_id, state, result, error):
+        """
+        Record the outcome of a job.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET state = ?, result = ?, error = ?, finished = ? "
+                "WHERE id = ?",
+                (state, result, error, time.time(), job_id),
+            )
+
+
+def _to_status(row):
+    """
+    Convert a status query row to a dictionary.
+
+    :param tuple row:       Row with the values of the status columns.
+
+    :returns:               Status of the job.
+    :rtype:                 dict
+    """
+    status = dict(zip(_STATUS_COLUMNS, row))
+    if status["result"] is not None:
+        status["result"] = json.loads(status["result"])
+    return status
@@ -0,0 +1,466 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hmac
+import json
+import os
+import shutil
+import socketserver
+import subprocess
+import sys
+import threading
+import uuid
+
+import sgtk
+
+from .client import get_token_path, sign, write_token
+from .jobs import JobQueue
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Script run by the worker processes.
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+
+
+class SubmissionDaemon(object):
+    """
+    Local daemon encoding and submitting the review media captured in the DCCs, so
+    the submissions carry on when the DCC is closed or crashes.
+
+    The jobs are received on a local socket, see :class:`DaemonClient`, and stored in a
+    persistent :class:`JobQueue`. Each worker slot of the daemon owns a worker process
+    which runs one job at a time, so several submissions run in parallel on the cores
+    of the machine. The captured frames of a job are copied to the spool folder of the
+    daemon when the job is received, out of reach of the scratch space cleanup of the
+    DCC session which captured them.
+
+    The workers run the hooks of the configuration of each job with the credentials of
+    the user of the daemon, so the daemon only serves the clients knowing its token,
+    written to a file only its user can read, and only accepts the jobs of the given
+    configurations.
+    """
+
+    def __init__(
+        self,
+        home,
+        port,
+        worker_count=0,
+        host="127.0.0.1",
+        configurations=None,
+        scratch_root=None,
+        token_path=None,
+    ):
+        """
+        :param str home:            Folder holding the job queue and the spool folder.
+        :param int port:            Port to listen on.
+        :param int worker_count:    Number of worker processes, the number of cores when 0.
+        :param str host:            Address to listen on. Jobs carry user credentials, keep
+                                    it local.
+        :param list(str) configurations: Paths of the pipeline configurations the jobs
+                                    can run in.
+        :param str scratch_root:    Root of the scratch space the captured frames of the
+                                    jobs are allocated in. Jobs with captured frames are
+                                    rejected when None.
+        :param str token_path:      Path of the token file, see :func:`get_token_path`
+                                    when None.
+        """
+        self._spool_folder = os.path.join(home, "spool")
+        os.makedirs(self._spool_folder, exist_ok=True)
+
+        self._configurations = set(
+            _normalize_path(path) for path in configurations or [] if path
+        )
+        self._scratch_root = _normalize_path(scratch_root) if scratch_root else None
+
+        self._queue = JobQueue(os.path.join(home, "jobs.db"))
+        self._worker_count = worker_count or os.cpu_count() or 1
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._workers = []
+
+        self._server = _Server((host, port), _RequestHandler)
+        self._server.submission_daemon = self
+        # Written once listening, the port being taken by another process otherwise.
+        self._token = write_token(token_path or get_token_path(port))
+
+    @property
+    def token(self):
+        """
+        Token the clients send along with their requests.
+        """
+        return self._token
+
+    @property
+    def address(self):
+        """
+        Address and port the daemon listens on.
+        """
+        return self._server.server_address
+
+    def serve_forever(self):
+        """
+        Run the worker slots and serve the requests until :meth:`shutdown` is called.
+        """
+        requeued = self._queue.requeue_running()
+        if requeued:
+            logger.info("Queued %d interrupted jobs again." % requeued)
+
+        slots = [
+            threading.Thread(
+                target=self._run_slot, name="ReviewSubmissionWorkerSlot%d" % index
+            )
+            for index in range(self._worker_count)
+        ]
+        for slot in slots:
+            slot.daemon = True
+            slot.start()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            with self._condition:
+                self._stopping = True
+                self._condition.notify_all()
+                workers = list(self._workers)
+
+            # The running jobs are queued again on the next start.
+            for worker in workers:
+                worker.terminate()
+            for slot in slots:
+                slot.join()
+
+            self._server.server_close()
+            self._queue.close()
+
+    def shutdown(self):
+        """
+        Stop serving the requests. Can be called from any thread but the one running
+        :meth:`serve_forever`.
+        """
+        self._server.shutdown()
+
+    def submit(self, job, priority=0):
+        """
+        Queue a job.
+
+        :param dict job:        The job, with the ``pipeline_configuration`` path and the
+                                serialized ``context`` to start the engine with, the
+                                ``app_instance`` name, the ``encode_args`` and the
+                                ``submit_args`` of the hooks. ``frames_path`` is the path of
+                                temporary frames to move to the spool folder, and
+                                ``output_name`` the name of the movie to encode to the
+                                scratch space of the worker when it has no ``output_path``.
+                                The additional outputs without a ``path`` are encoded to
+                                the scratch space of the worker as well, as ``file_name``.
+        :param int priority:    Priority of the job, higher priorities are run first.
+
+        :returns:               Identifier of the job.
+        :rtype:                 int
+        :raises RuntimeError:   If the configuration of the job isn't served by the daemon.
+        """
+        if _normalize_path(job["pipeline_configuration"]) not in self._configurations:
+            raise RuntimeError(
+                "The submission daemon doesn't run the jobs of the pipeline "
+                "configuration %s." % job["pipeline_configuration"]
+            )
+
+        job = self._stage(job)
+        try:
+            job_id = self._queue.put(job, priority)
+        except Exception:
+            self._release(job)
+            raise
+
+        logger.info("Queued job %d with priority %d." % (job_id, priority))
+
+        with self._condition:
+            self._condition.notify()
+
+        return job_id
+
+    def get_status(self, job_id):
+        """
+        :param int job_id:      Identifier of the job.
+
+        :returns:               Status of the job, None if there is no such job.
+        :rtype:                 dict
+        """
+        return self._queue.get(job_id)
+
+    def list_jobs(self, state=None):
+        """
+        :param str state:       State of the jobs to list, all the jobs when None.
+
+        :returns:               Status of the jobs.
+        :rtype:                 list(dict)
+        """
+        return self._queue.list(state)
+
+    def _stage(self, job):
+        """
+        Copy the temporary frames and the thumbnail of a job to a staging folder of the
+        spool folder.
+
+        :param dict job:        The job.
+
+        :returns:               The job, updated with the staged paths.
+        :rtype:                 dict
+        """
+        staging_folder = os.path.join(self._spool_folder, uuid.uuid4().hex)
+        os.makedirs(staging_folder)
+
+        job = dict(job, staging_folder=staging_folder)
+        job["encode_args"] = dict(job["encode_args"])
+        job["submit_args"] = dict(job["submit_args"])
+
+        try:
+            frames_path = job.pop("frames_path", None)
+            if frames_path:
+                frames_folder = self._get_frames_folder(frames_path)
+                input_path = _normalize_path(job["encode_args"]["input_path"])
+                if not input_path.startswith(frames_folder + os.sep):
+                    raise RuntimeError(
+                        "The input path %s isn't one of the captured frames."
+                        % job["encode_args"]["input_path"]
+                    )
+
+                staged_frames_folder = os.path.join(staging_folder, "frames")
+                shutil.copytree(frames_folder, staged_frames_folder, symlinks=True)
+                job["encode_args"]["input_path"] = os.path.join(
+                    staged_frames_folder, os.path.relpath(input_path, frames_folder)
+                )
+
+            thumbnail_path = job["submit_args"].get("thumbnail_path")
+            if thumbnail_path and os.path.isfile(thumbnail_path):
+                staged_thumbnail_path = os.path.join(
+                    staging_folder, os.path.basename(thumbnail_path)
+                )
+                shutil.copyfile(thumbnail_path, staged_thumbnail_path)
+                job["submit_args"]["thumbnail_path"] = staged_thumbnail_path
+        except Exception:
+            self._release(job)
+            raise
+
+        return job
+
+    def _get_frames_folder(self, frames_path):
+        """
+        Get the allocation folder of captured frames in the scratch space.
+
+        :param str frames_path: Path of the captured frames.
+
+        :returns:               The resolved allocation folder.
+        :rtype:                 str
+        :raises RuntimeError:   If the frames aren't in an allocation of the scratch space
+                                owned by the user of the daemon.
+        """
+        frames_folder = os.path.dirname(_normalize_path(frames_path))
+        if self._scratch_root:
+            parts = os.path.relpath(frames_folder, self._scratch_root).split(os.sep)
+            # The allocation folders are in the session folders of the scratch space.
+            if len(parts) == 2 and ".." not in parts and os.path.isdir(frames_folder):
+                if sys.platform == "win32" or os.stat(frames_folder).st_uid == (
+                    os.getuid()
+                ):
+                    return frames_folder
+
+        raise RuntimeError(
+            "The captured frames %s aren't in the scratch space of the submission daemon."
+            % frames_path
+        )
+
+    def _release(self, job):
+        """
+        Remove the staging folder of a job.
+
+        :param dict job:        The job.
+        """
+        shutil.rmtree(job["staging_folder"], ignore_errors=True)
+
+    def _run_slot(self):
+        """
+        Run the queued jobs one at a time in a worker process until the daemon stops.
+        """
+        worker = None
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    taken = self._queue.take()
+                    if taken:
+                        break
+                    self._condition.wait()
+                else:
+                    return
+
+                if worker is None:
+                    worker = WorkerProcess()
+                    self._workers.append(worker)
+
+            job_id, job = taken
+            logger.info("Running job %d in worker %d." % (job_id, worker.pid))
+
+            try:
+                result = worker.run(job)
+            except Exception as e:
+                with self._condition:
+                    self._workers.remove(worker)
+                    if self._stopping:
+                        # Interrupted, the job is queued again on the next start.
+                        return
+                worker = None
+                logger.error("Job %d failed: %s" % (job_id, e))
+                self._queue.fail(job_id, str(e))
+            else:
+                if "error" in result:
+                    logger.error("Job %d failed: %s" % (job_id, result["error"]))
+                    self._queue.fail(job_id, result["error"])
+                else:
+                    logger.info("Job %d completed: %s" % (job_id, result["result"]))
+                    self._queue.complete(job_id, result["result"])
+
+            self._release(job)
+
+
+class WorkerProcess(object):
+    """
+    Worker process running the jobs of the daemon, see the ``worker`` module.
+    """
+
+    def __init__(self):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+
+        self._process = subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+        )
+
+    @property
+    def pid(self):
+        """
+        Identifier of the process.
+        """
+        return self._process.pid
+
+    def run(self, job):
+        """
+        Run a job in the process.
+
+        :param dict job:        The job.
+
+        :returns:               The outcome of the job, with its ``result`` or its ``error``.
+        :rtype:                 dict
+        :raises RuntimeError:   If the process exited.
+        """
+        try:
+            self._process.stdin.write(json.dumps(job) + "\n")
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except (OSError, ValueError):
+            line = ""
+
+        if not line:
+            raise RuntimeError(
+                "The worker process exited with code %s." % self._process.wait()
+            )
+        return json.loads(line)
+
+    def close(self, timeout=60):
+        """
+        Let the process exit once its current job is done.
+
+        :param float timeout:   Number of seconds to wait for the process to exit before
+                                terminating it.
+        """
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.terminate()
+
+    def terminate(self):
+        """
+        Stop the process.
+        """
+        self._process.terminate()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Server handling each connection in its own thread.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle the requests of a connection, one JSON document per line, and answer each
+    of them with a JSON document on a line.
+
+    Each request but ``authenticate`` must carry the token of the daemon.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                response = dict(self._handle_request(json.loads(line)), ok=True)
+            except Exception as e:
+                logger.exception("Unable to handle the request.")
+                response = {"ok": False, "error": str(e) or e.__class__.__name__}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    def _handle_request(self, request):
+        """
+        Run a request on the daemon.
+
+        :param dict request:    The request, with its ``command`` and arguments.
+
+        :returns:               The response to the request.
+        :rtype:                 dict
+        """
+        daemon = self.server.submission_daemon
+        command = request.get("command")
+
+        # Proves the daemon knows the token, without revealing it.
+        if command == "authenticate":
+            return {"proof": sign(daemon.token, str(request["challenge"]))}
+
+        if not hmac.compare_digest(str(request.get("token", "")), daemon.token):
+            raise PermissionError("Invalid token.")
+
+        if command == "ping":
+            return {"pid": os.getpid()}
+        if command == "submit":
+            return {"id": daemon.submit(request["job"], request.get("priority", 0))}
+        if command == "status":
+            return {"job": daemon.get_status(request["id"])}
+        if command == "list":
+            return {"jobs": daemon.list_jobs(request.get("state"))}
+
+        raise ValueError("Unknown command %s." % command)
+
+
+def _normalize_path(path):
+    """
+    :param str path:        A path.
+
+    :returns:               The path resolved, without symbolic links, for comparison.
+    :rtype:                 str
+    """
+    return os.path.normcase(os.path.realpath(path))
@@ -0,0 +1,247 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Worker process of the submission daemon.
+
+This script is executed by the daemon in its own Python interpreter, with the Toolkit
+core in its path. It reads the jobs from its standard input, one JSON document per
+line, and writes their outcome to its standard output the same way. Everything else
+printed by the process goes to its standard error.
+
+Each job runs one of the actions below through the app, in a tk-shell engine started
+for the context of the job. The engine is kept running for the following jobs of the
+same configuration, switching to their context:
+
+- ``encode_and_submit``, the default, encodes captured frames and submits the movie.
+- ``render`` renders the media of a Version, see :meth:`Actions.render_version`.
+- ``submit`` submits rendered media, see :meth:`Actions.submit_rendered_version`.
+"""
+
+import json
+import os
+import sys
+import traceback
+
+import sgtk
+
+APP_NAME = "tk-multi-reviewsubmission"
+
+# Configuration the current engine was started for.
+_engine_configuration = None
+
+
+def run_job(job):
+    """
+    Run the action of a job.
+
+    :param dict job:        The job, see :meth:`SubmissionDaemon.submit`.
+
+    :returns:               The result of the action.
+    :rtype:                 dict
+    """
+    app = _get_app(job)
+
+    action = job.get("action", "encode_and_submit")
+    if action not in _ACTIONS:
+        raise ValueError("Unknown action %s." % action)
+
+    # Traced as a child of the submission which queued the job.
+    app_module = app.import_module("tk_multi_reviewsubmission")
+    with app_module.trace_span(
+        "daemon_%s" % action, traceparent=job.get("traceparent")
+    ), app_module.profile_submission(app, "daemon_%s" % action):
+        return _ACTIONS[action](app, job)
+
+
+def _encode_and_submit(app, job):
+    """
+    Encode the captured frames of a job and submit the movie.
+
+    :param app:             The app instance.
+    :param dict job:        The job.
+
+    :returns:               The Version created.
+    :rtype:                 dict
+    """
+    encode_args = dict(job["encode_args"])
+    if not encode_args.get("output_path") and job.get("output_name"):
+        encode_args["output_path"] = app.scratch_space.allocate(job["output_name"])
+
+    submit_args = dict(job["submit_args"])
+    if encode_args.get("additional_outputs"):
+        additional_outputs = []
+        for output in encode_args["additional_outputs"]:
+            output = dict(output)
+            file_name = output.pop("file_name", None)
+            if not output.get("path"):
+                output["path"] = app.scratch_space.allocate(file_name)
+            additional_outputs.append(output)
+        encode_args["additional_outputs"] = additional_outputs
+        submit_args["additional_outputs"] = additional_outputs
+
+    app_module = app.import_module("tk_multi_reviewsubmission")
+    output_path = app_module.execute_hook_method(
+        app, "render_media_hook", "encode", **encode_args
+    )
+
+    submit_args["path_to_movie"] = output_path
+    version = app_module.execute_hook_method(
+        app, "submitter_hook", "submit_version", **submit_args
+    )
+
+    return {"version": _get_link(version)}
+
+
+def _render(app, job):
+    """
+    Render the media of a Version.
+
+    :param app:             The app instance.
+    :param dict job:        The job, with the name of the ``template``, its ``fields``,
+                            the ``first_frame``, the ``last_frame`` and the ``color_space``.
+                            The media are rendered to the ``scratch_folder`` allocated by
+                            the process which queued the job, if given.
+
+    :returns:               The rendered media.
+    :rtype:                 dict
+    """
+    actions = app.import_module("tk_multi_reviewsubmission").Actions()
+    with app.scratch_space.allocate_in(job.get("scratch_folder")):
+        return actions.render_version(
+            app.sgtk.templates[job["template"]],
+            job["fields"],
+            job["first_frame"],
+            job["last_frame"],
+            job.get("color_space"),
+        )
+
+
+def _submit(app, job):
+    """
+    Submit rendered media.
+
+    :param app:             The app instance.
+    :param dict job:        The job, with the ``rendered`` media and the ``sg_publishes``,
+                            ``sg_task``, ``comment`` and ``thumbnail_path`` of the Version.
+
+    :returns:               The Version created.
+    :rtype:                 dict
+    """
+    actions = app.import_module("tk_multi_reviewsubmission").Actions()
+    version = actions.submit_rendered_version(
+        job["rendered"],
+        job.get("sg_publishes"),
+        job.get("sg_task"),
+        job.get("comment"),
+        job.get("thumbnail_path"),
+    )
+    return {"version": _get_link(version)}
+
+
+# Functions running the actions of the jobs, by name.
+_ACTIONS = {
+    "encode_and_submit": _encode_and_submit,
+    "render": _render,
+    "submit": _submit,
+}
+
+
+def _get_link(entity):
+    """
+    :returns:               The type and id of an entity, None if no entity was given.
+    :rtype:                 dict
+    """
+    if not entity:
+        return None
+    return {"type": entity["type"], "id": entity["id"]}
+
+
+def _get_app(job):
+    """
+    Get the app instance to run a job with, starting a tk-shell engine for the
+    configuration and the context of the job if needed.
+
+    :param dict job:        The job.
+
+    :returns:               The app instance.
+    :raises RuntimeError:   If the app isn't configured for the tk-shell engine.
+    """
+    global _engine_configuration
+
+    # Deserializing the context authenticates its user.
+    context = sgtk.Context.deserialize(job["context"])
+
+    engine = sgtk.platform.current_engine()
+    if engine and job["pipeline_configuration"] != _engine_configuration:
+        engine.destroy()
+        engine = None
+
+    if engine and engine.context != context:
+        try:
+            sgtk.platform.change_context(context)
+        except Exception as e:
+            print("Restarting the engine to change context: %s" % e, file=sys.stderr)
+            engine.destroy()
+            engine = None
+        else:
+            engine = sgtk.platform.current_engine()
+
+    if not engine:
+        tk = sgtk.sgtk_from_path(job["pipeline_configuration"])
+        engine = sgtk.platform.start_engine("tk-shell", tk, context)
+        _engine_configuration = job["pipeline_configuration"]
+
+        # The submitter waits for its upload thread with a Qt event loop.
+        from sgtk.platform.qt import QtCore
+
+        if QtCore and not QtCore.QCoreApplication.instance():
+            QtCore.QCoreApplication([])
+
+    app = engine.apps.get(job["app_instance"])
+    if app is None:
+        app = next((app for app in engine.apps.values() if app.name == APP_NAME), None)
+    if app is None:
+        raise RuntimeError(
+            "%s isn't configured for the tk-shell engine in the context %s."
+            % (APP_NAME, engine.context)
+        )
+    return app
+
+
+def main():
+    """
+    Run the jobs received on the standard input until it is closed.
+    """
+    # Keep the standard output for the outcome of the jobs.
+    results = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        try:
+            outcome = {"result": run_job(json.loads(line))}
+        except Exception as e:
+            traceback.print_exc()
+            outcome = {"error": str(e) or e.__class__.__name__}
+
+        results.write(json.dumps(outcome) + "\n")
+        results.flush()
+
+    engine = sgtk.platform.current_engine()
+    if engine:
+        engine.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+
+import sgtk
+
+from .locking import OutputLock
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Number of seconds the upload throughput samples are considered recent.
+DEFAULT_MAX_AGE = 3 * 24 * 3600
+
+# Uploads smaller than this are dominated by the latency of the requests, not by the
+# bandwidth, and aren't sampled.
+MIN_SAMPLE_SIZE = 1024 * 1024
+
+# Frame rate assumed to turn the size of a movie into a bitrate, the render stage
+# doesn't know the one of the DCC.
+DEFAULT_FRAME_RATE = 24.0
+
+
+class UploadBandwidth(object):
+    """
+    Throughput of the recent movie uploads of the host, kept in a file shared by the
+    sessions of the host, so the bandwidth of the uplink can be estimated before
+    encoding a movie.
+    """
+
+    def __init__(self, path, max_samples=20, max_age=DEFAULT_MAX_AGE):
+        """
+        :param str path:        Path of the file holding the samples.
+        :param int max_samples: Number of samples kept.
+        :param float max_age:   Number of seconds the samples are used for the estimate.
+        """
+        self._path = path
+        self._max_samples = max_samples
+        self._max_age = max_age
+
+    def record(self, size, seconds):
+        """
+        Record the throughput of an upload.
+
+        :param int size:        Number of bytes uploaded.
+        :param float seconds:   Number of seconds the upload took.
+        """
+        if size < MIN_SAMPLE_SIZE or seconds <= 0:
+            return
+
+        try:
+            with OutputLock(self._path, timeout=10):
+                samples = self._read()
+                samples.append(
+                    {"time": time.time(), "bytes_per_second": size / seconds}
+                )
+                self._write(samples[-self._max_samples :])
+        except Exception as e:
+            logger.debug("Unable to record the upload bandwidth: %s" % e)
+
+    def estimate(self):
+        """
+        :returns:               The median throughput of the recent uploads in bytes per
+                                second, None if there were none.
+        :rtype:                 float
+        """
+        deadline = time.time() - self._max_age
+        rates = [
+            sample["bytes_per_second"]
+            for sample in self._read()
+            if sample["time"] > deadline
+        ]
+        return statistics.median(rates) if rates else None
+
+    def _read(self):
+        """
+        :returns:               The recorded samples, oldest first.
+        :rtype:                 list(dict)
+        """
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _write(self, samples):
+        """
+        Replace the recorded samples atomically.
+
+        :param list(dict) samples: The samples.
+        """
+        folder = os.path.dirname(self._path)
+        os.makedirs(folder, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".json", dir=folder)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(samples, f)
+            os.replace(temp_path, self._path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+
+
+class EncodePolicy(object):
+    """
+    Picks the encode settings of a review movie so its upload fits a time budget at the
+    measured bandwidth: a bitrate spreading the bytes the budget allows over the frames,
+    and a smaller resolution when that bitrate leaves too few bits per pixel for a
+    watchable movie.
+
+    Movies which fit the budget at the maximum bitrate keep the default settings.
+    """
+
+    def __init__(
+        self,
+        upload_budget,
+        min_bitrate=1000,
+        max_bitrate=20000,
+        min_scale=0.5,
+        min_bits_per_pixel=0.05,
+        efficiency=0.8,
+    ):
+        """
+        :param float upload_budget: Number of seconds the upload of a movie should take.
+        :param int min_bitrate: Lowest bitrate picked, in kilobits per second.
+        :param int max_bitrate: Bitrate of the movies encoded with the default settings,
+                                in kilobits per second.
+        :param float min_scale: Smallest scale of the resolution of the movies.
+        :param float min_bits_per_pixel: Bits per pixel and per frame under which the
+                                resolution is lowered.
+        :param float efficiency: Fraction of the bandwidth available to the movie, the
+                                rest going to the protocol and the other outputs.
+        """
+        self._upload_budget = upload_budget
+        self._min_bitrate = min_bitrate
+        self._max_bitrate = max_bitrate
+        self._min_scale = min_scale
+        self._min_bits_per_pixel = min_bits_per_pixel
+        self._efficiency = efficiency
+
+    def choose(
+        self, width, height, frame_count, bandwidth, frame_rate=DEFAULT_FRAME_RATE
+    ):
+        """
+        Pick the encode settings of a movie.
+
+        :param int width:       Width of the movie.
+        :param int height:      Height of the movie.
+        :param int frame_count: Number of frames of the movie.
+        :param float bandwidth: Upload bandwidth in bytes per second.
+        :param float frame_rate: Frame rate of the movie.
+
+        :returns:               The ``bitrate`` in kilobits per second, the ``scale`` of the
+                                resolution, the scaled ``width`` and ``height``, the
+                                estimated ``upload_seconds`` and whether the upload is
+                                ``within_budget``. None when the default settings fit the
+                                budget.
+        :rtype:                 dict
+        """
+        if not bandwidth or not frame_count:
+            return None
+
+        duration = frame_count / frame_rate
+        budget_bits = bandwidth * 8 * self._efficiency * self._upload_budget
+        bitrate = int(budget_bits / duration / 1000)
+        if bitrate >= self._max_bitrate:
+            return None
+        bitrate = max(bitrate, self._min_bitrate)
+
+        scale = 1.0
+        bits_per_pixel = bitrate * 1000.0 / (width * height * frame_rate)
+        if bits_per_pixel < self._min_bits_per_pixel:
+            scale = max(
+                math.sqrt(bits_per_pixel / self._min_bits_per_pixel), self._min_scale
+            )
+
+        upload_seconds = bitrate * 1000 * duration / 8 / self._efficiency / bandwidth
+        return {
+            "bitrate": bitrate,
+            "scale": round(scale, 3),
+            "width": _round_even(width * scale),
+            "height": _round_even(height * scale),
+            "upload_seconds": round(upload_seconds, 1),
+            "within_budget": upload_seconds <= self._upload_budget * 1.01,
+        }
+
+
+def _round_even(size):
+    """
+    :param float size:      A width or a height.
+
+    :returns:               The nearest even size, which the video codecs require.
+    :rtype:                 int
+    """
+    return max(int(round(size / 2.0)) * 2, 2)
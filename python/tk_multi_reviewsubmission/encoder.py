@@ -0,0 +1,450 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+
+import sgtk
+
+from .locking import get_staging_path
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Default video encoding arguments, matching the quality of the Nuke review movies.
+DEFAULT_VIDEO_ARGS = [
+    "-c:v",
+    "libx264",
+    "-pix_fmt",
+    "yuv420p",
+    "-preset",
+    "medium",
+    "-crf",
+    "18",
+]
+
+# Video encoding arguments of the additional movies, smaller files streaming from the web.
+WEB_VIDEO_ARGS = [
+    "-c:v",
+    "libx264",
+    "-pix_fmt",
+    "yuv420p",
+    "-preset",
+    "medium",
+    "-crf",
+    "28",
+    "-movflags",
+    "+faststart",
+]
+
+# Maximum number of frames of a filmstrip.
+FILMSTRIP_MAX_FRAMES = 20
+
+
+class FFmpegEncoder(object):
+    """
+    Encodes a sequence of frames into a review movie with burn-ins and a slate using ffmpeg.
+    """
+
+    def __init__(self, ffmpeg_path="ffmpeg", font_path=None):
+        """
+        :param str ffmpeg_path: Path to the ffmpeg executable, or its name if it is in the PATH.
+        :param str font_path:   Path to the font file to use for the burn-ins and the slate.
+        """
+        self._ffmpeg_path = ffmpeg_path
+        self._font_path = font_path
+
+    def get_executable(self):
+        """
+        Find the ffmpeg executable.
+
+        :returns:               Path to the ffmpeg executable.
+        :rtype:                 str
+        :raises RuntimeError:   If ffmpeg can't be found.
+        """
+        executable = shutil.which(self._ffmpeg_path)
+        if not executable:
+            raise RuntimeError(
+                "Unable to find ffmpeg executable '%s'." % self._ffmpeg_path
+            )
+        return executable
+
+    def encode(
+        self,
+        input_path,
+        output_path,
+        width,
+        height,
+        first_frame,
+        frame_rate,
+        burnins=None,
+        slate=None,
+        video_args=None,
+        additional_outputs=None,
+        frame_count=None,
+        lut_path=None,
+        bitrate=None,
+    ):
+        """
+        Encode a sequence of frames into a movie.
+
+        Additional outputs are encoded by the same ffmpeg command, from a single read of
+        the frames: smaller movies from the review movie, and a thumbnail of the middle
+        frame or a filmstrip of frames spread over the sequence, without the burn-ins.
+
+        :param str input_path:      Path to the input frames, with the frame number as a
+                                    printf style token, e.g. ``shot.%04d.jpg``.
+        :param str output_path:     Path to the output movie.
+        :param int width:           Width of the output movie.
+        :param int height:          Height of the output movie.
+        :param int first_frame:     First frame number of the sequence of frames.
+        :param float frame_rate:    Frame rate of the output movie.
+        :param dict burnins:        Texts to burn in the frames, keyed by corner, out of
+                                    ``top_left``, ``top_right`` and ``bottom_left``. The frame
+                                    number is always burnt in the bottom right corner.
+        :param str slate:           Text of the slate frame prepended to the movie. No slate
+                                    is added when empty.
+        :param list video_args:     The ffmpeg video encoding arguments, defaults to H.264.
+        :param list(dict) additional_outputs: The additional outputs, with their ``kind``, out
+                                    of ``movie``, ``thumbnail`` and ``filmstrip``, their
+                                    ``path``, ``width`` and ``height``. A height of 0 keeps
+                                    the aspect ratio of the frames.
+        :param int frame_count:     Number of frames of the sequence, used to pick the frames
+                                    of the thumbnail and the filmstrip.
+        :param str lut_path:        Path to a ``.cube`` 3D LUT applied to the frames, e.g. to
+                                    transform their colour space to the review display.
+        :param int bitrate:         Bitrate of the movie in kilobits per second, replacing the
+                                    constant quality of the default video encoding arguments.
+
+        :returns:               Location of the encoded movie.
+        :rtype:                 str
+        """
+        work_folder = tempfile.mkdtemp(prefix="tk-multi-reviewsubmission-")
+        staging_path = get_staging_path(output_path)
+        try:
+            additional_outputs = additional_outputs or []
+            filter_graph = self._build_filter_graph(
+                work_folder,
+                width,
+                height,
+                first_frame,
+                frame_rate,
+                burnins,
+                slate,
+                additional_outputs,
+                frame_count or 1,
+                lut_path,
+            )
+
+            command = [
+                self.get_executable(),
+                "-y",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-framerate",
+                str(frame_rate),
+                "-start_number",
+                str(first_frame),
+                "-i",
+                input_path,
+                "-filter_complex",
+                filter_graph,
+                "-map",
+                "[out]",
+                "-r",
+                str(frame_rate),
+            ]
+            if video_args is None:
+                video_args = (
+                    DEFAULT_VIDEO_ARGS
+                    if bitrate is None
+                    else _get_bitrate_args(bitrate)
+                )
+            command.extend(video_args)
+            # Encode next to the movie, so a failed encode never leaves a partial movie.
+            command.append(staging_path)
+
+            for index, output in enumerate(additional_outputs):
+                command.extend(["-map", "[extra%d]" % index])
+                if output["kind"] == "movie":
+                    command.extend(["-r", str(frame_rate)])
+                    command.extend(WEB_VIDEO_ARGS)
+                else:
+                    command.extend(["-frames:v", "1", "-update", "1", "-q:v", "2"])
+                command.append(output["path"])
+
+            self._run(command)
+            os.replace(staging_path, output_path)
+        finally:
+            shutil.rmtree(work_folder, ignore_errors=True)
+            if os.path.exists(staging_path):
+                os.unlink(staging_path)
+
+        return output_path
+
+    def _run(self, command):
+        """
+        Run an ffmpeg command.
+
+        :param list command:    The command line to run.
+        :raises RuntimeError:   If ffmpeg fails.
+        """
+        logger.debug("Running %s" % subprocess.list2cmdline(command))
+
+        process = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        if process.returncode != 0:
+            raise RuntimeError(
+                "ffmpeg failed with exit code %d: %s"
+                % (
+                    process.returncode,
+                    process.stderr.decode("utf-8", "replace").strip(),
+                )
+            )
+
+    def _build_filter_graph(
+        self,
+        work_folder,
+        width,
+        height,
+        first_frame,
+        frame_rate,
+        burnins,
+        slate,
+        additional_outputs=(),
+        frame_count=1,
+        lut_path=None,
+    ):
+        """
+        Build the ffmpeg filter graph scaling the frames, adding the burn-ins and the slate.
+
+        The texts are written to files and loaded with the ``textfile`` option of the
+        drawtext filter, which saves us from escaping them in the filter graph.
+
+        :returns:               The filter graph, its output is labelled ``out`` and the
+                                ones of the additional outputs ``extra<index>``.
+        :rtype:                 str
+        """
+        font_size = max(height // 36, 12)
+        margin = font_size
+
+        positions = {
+            "top_left": ("%d" % margin, "%d" % margin),
+            "top_right": ("w-tw-%d" % margin, "%d" % margin),
+            "bottom_left": ("%d" % margin, "h-th-%d" % margin),
+        }
+
+        graph = []
+
+        # The stills are taken from the scaled frames, before the burn-ins.
+        stills = [
+            (index, output)
+            for index, output in enumerate(additional_outputs)
+            if output["kind"] != "movie"
+        ]
+        movies = [
+            (index, output)
+            for index, output in enumerate(additional_outputs)
+            if output["kind"] == "movie"
+        ]
+
+        scale_filters = [self._scale(width, height), "setsar=1"]
+        if lut_path:
+            scale_filters.insert(0, "lut3d=file=%s" % _escape_path(lut_path))
+        if stills:
+            graph.append(
+                "[0:v]%s,split=%d[base]%s"
+                % (
+                    ",".join(scale_filters),
+                    len(stills) + 1,
+                    "".join("[still%d]" % index for index, _ in stills),
+                )
+            )
+            body_filters = []
+            body_input = "[base]"
+        else:
+            body_filters = scale_filters
+            body_input = "[0:v]"
+
+        for corner, text in sorted((burnins or {}).items()):
+            if not text:
+                continue
+            x, y = positions[corner]
+            body_filters.append(
+                self._drawtext(work_folder, corner, text, x, y, font_size)
+            )
+
+        body_filters.append(
+            "drawtext=%sfontsize=%d:fontcolor=white:x=w-tw-%d:y=h-th-%d"
+            ":start_number=%d:text='%%{frame_num}'"
+            % (self._font_option(), font_size, margin, margin, first_frame)
+        )
+        body_filters.append("format=yuv420p")
+
+        main_label = "[main]" if movies else "[out]"
+
+        if not slate:
+            graph.append("%s%s%s" % (body_input, ",".join(body_filters), main_label))
+        else:
+            graph.append("%s%s[body]" % (body_input, ",".join(body_filters)))
+            graph.append(
+                "%s[slate];[slate][body]concat=n=2:v=1:a=0%s"
+                % (
+                    self._build_slate_filters(
+                        work_folder, width, height, frame_rate, slate, font_size
+                    ),
+                    main_label,
+                )
+            )
+
+        # The additional movies are scaled down copies of the review movie.
+        if movies:
+            graph.append(
+                "[main]split=%d[out]%s"
+                % (
+                    len(movies) + 1,
+                    "".join("[movie%d]" % index for index, _ in movies),
+                )
+            )
+            for index, output in movies:
+                graph.append(
+                    "[movie%d]%s,setsar=1[extra%d]"
+                    % (index, self._scale(output["width"], output["height"]), index)
+                )
+
+        for index, output in stills:
+            if output["kind"] == "thumbnail":
+                select = "select=eq(n\\,%d)" % (frame_count // 2)
+                tile = ""
+            else:
+                step = int(math.ceil(float(frame_count) / FILMSTRIP_MAX_FRAMES))
+                select = "select=not(mod(n\\,%d))" % step
+                tile = ",tile=%dx1" % int(math.ceil(float(frame_count) / step))
+            graph.append(
+                "[still%d]%s,%s%s[extra%d]"
+                % (
+                    index,
+                    select,
+                    self._scale(output["width"], output["height"]),
+                    tile,
+                    index,
+                )
+            )
+
+        return ";".join(graph)
+
+    def _build_slate_filters(
+        self, work_folder, width, height, frame_rate, slate, font_size
+    ):
+        """
+        Build the filters generating the slate frame.
+
+        :returns:               The slate filters.
+        :rtype:                 str
+        """
+        slate_filters = [
+            "color=c=black:s=%dx%d:r=%s" % (width, height, frame_rate),
+            "trim=end_frame=1",
+            "setsar=1",
+            self._drawtext(
+                work_folder, "slate", slate, "w/8", "(h-th)/2", font_size * 2
+            ),
+            "format=yuv420p",
+        ]
+        return ",".join(slate_filters)
+
+    def _scale(self, width, height):
+        """
+        Build the filters scaling the frames to fit a size, padding them with black.
+
+        :param int width:       Width of the scaled frames.
+        :param int height:      Height of the scaled frames, 0 to keep the aspect ratio.
+
+        :returns:               The scale filters.
+        :rtype:                 str
+        """
+        if not height:
+            return "scale=%d:-2" % width
+        return (
+            "scale=%d:%d:force_original_aspect_ratio=decrease,"
+            "pad=%d:%d:(ow-iw)/2:(oh-ih)/2:color=black" % (width, height, width, height)
+        )
+
+    def _drawtext(self, work_folder, label, text, x, y, font_size):
+        """
+        Build a drawtext filter rendering a static text.
+
+        :returns:               The drawtext filter.
+        :rtype:                 str
+        """
+        text_file = os.path.join(work_folder, "%s.txt" % label)
+        with open(text_file, "w", encoding="utf-8") as f:
+            f.write(text)
+
+        return (
+            "drawtext=%stextfile=%s:expansion=none:fontsize=%d:fontcolor=white"
+            ":line_spacing=%d:x=%s:y=%s"
+            % (
+                self._font_option(),
+                _escape_path(text_file),
+                font_size,
+                font_size // 2,
+                x,
+                y,
+            )
+        )
+
+    def _font_option(self):
+        """
+        :returns:               The drawtext font option, empty if no font was provided.
+        :rtype:                 str
+        """
+        if not self._font_path:
+            return ""
+        return "fontfile=%s:" % _escape_path(self._font_path)
+
+
+def _escape_path(path):
+    """
+    Escape a path to be used as a filter option value.
+
+    :param str path:        The path to escape.
+
+    :returns:               The escaped path.
+    :rtype:                 str
+    """
+    return "'%s'" % path.replace(os.sep, "/").replace(":", "\\:")
+
+
+def _get_bitrate_args(bitrate):
+    """
+    :param int bitrate:     Bitrate of the movie in kilobits per second.
+
+    :returns:               The default video encoding arguments, targeting the bitrate
+                            instead of a constant quality.
+    :rtype:                 list(str)
+    """
+    index = DEFAULT_VIDEO_ARGS.index("-crf")
+    return (
+        DEFAULT_VIDEO_ARGS[:index]
+        + DEFAULT_VIDEO_ARGS[index + 2 :]
+        + [
+            "-b:v",
+            "%dk" % bitrate,
+            "-maxrate",
+            "%dk" % bitrate,
+            "-bufsize",
+            "%dk" % (bitrate * 2),
+        ]
+    )
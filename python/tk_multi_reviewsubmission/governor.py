@@ -0,0 +1,147 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import collections
+import os
+import shutil
+import subprocess
+import sys
+
+import sgtk
+
+from .tracing import TRACEPARENT_ENV_VAR, get_traceparent
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Number of lines of output kept to report the failures of the process.
+OUTPUT_TAIL_SIZE = 20
+
+
+class GovernedProcess(object):
+    """
+    Runs a render process at a lower CPU and I/O priority than the session which
+    started it, so a review render doesn't starve the user interface of a shared
+    workstation, and measures its peak memory.
+    """
+
+    def __init__(self, command, priority=0, env=None):
+        """
+        :param list command:    The command line to run.
+        :param int priority:    Niceness added to the process, from 0 to 19. On Linux, the
+                                process also gets a matching best effort I/O priority when
+                                ionice is available. On Windows, it runs with the below
+                                normal or, from 10 on, the idle priority class.
+        :param dict env:        Environment of the process, the one of the session when None.
+        """
+        self._command = list(command)
+        self._priority = max(0, min(int(priority or 0), 19))
+        self._env = env
+        self._peak_memory = None
+        self._output = collections.deque(maxlen=OUTPUT_TAIL_SIZE)
+
+    @property
+    def peak_memory(self):
+        """
+        Peak resident memory of the process in bytes, None if it couldn't be measured.
+        """
+        return self._peak_memory
+
+    @property
+    def output(self):
+        """
+        Last lines printed by the process.
+        """
+        return "\n".join(self._output)
+
+    def run(self, line_callback=None):
+        """
+        Run the process until it exits.
+
+        :param line_callback:   Callable receiving each line printed by the process.
+
+        :returns:               The exit code of the process.
+        :rtype:                 int
+        """
+        command = self._command
+        popen_kwargs = {}
+
+        # The process continues the trace of the span which started it.
+        env = self._env
+        traceparent = get_traceparent()
+        if traceparent:
+            env = dict(os.environ if env is None else env)
+            env[TRACEPARENT_ENV_VAR] = traceparent
+
+        if self._priority:
+            if sys.platform == "win32":
+                popen_kwargs["creationflags"] = (
+                    subprocess.IDLE_PRIORITY_CLASS
+                    if self._priority >= 10
+                    else subprocess.BELOW_NORMAL_PRIORITY_CLASS
+                )
+            else:
+                priority = self._priority
+                popen_kwargs["preexec_fn"] = lambda: os.nice(priority)
+                if sys.platform.startswith("linux") and shutil.which("ionice"):
+                    # Map the niceness to the levels of the best effort class, 0 to 7.
+                    command = [
+                        "ionice",
+                        "-c",
+                        "2",
+                        "-n",
+                        str(self._priority * 8 // 20),
+                    ] + command
+
+        logger.debug("Running %s" % subprocess.list2cmdline(command))
+
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=env,
+            universal_newlines=True,
+            **popen_kwargs
+        )
+
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            self._output.append(line)
+            if line_callback:
+                line_callback(line)
+        process.stdout.close()
+
+        return self._wait(process)
+
+    def _wait(self, process):
+        """
+        Wait for the process to exit, measuring its peak memory where the platform
+        reports the resource usage of a single child process.
+
+        :param process:         The ``subprocess.Popen`` instance.
+
+        :returns:               The exit code of the process.
+        :rtype:                 int
+        """
+        if not hasattr(os, "wait4"):
+            return process.wait()
+
+        _, status, usage = os.wait4(process.pid, 0)
+        if os.WIFSIGNALED(status):
+            process.returncode = -os.WTERMSIG(status)
+        else:
+            process.returncode = os.WEXITSTATUS(status)
+
+        # Kilobytes on Linux, bytes on macOS.
+        if sys.platform == "darwin":
+            self._peak_memory = usage.ru_maxrss
+        else:
+            self._peak_memory = usage.ru_maxrss * 1024
+
+        return process.returncode
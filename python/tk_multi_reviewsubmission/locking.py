@@ -0,0 +1,221 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+import tempfile
+import time
+import uuid
+
+import sgtk
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Number of seconds between two attempts to acquire a lock held by another submission.
+POLL_INTERVAL = 0.2
+
+
+class OutputLock(object):
+    """
+    Advisory lock of an output path, held by a submission while it writes the file, so
+    the submissions of the host resolving the same path, from other threads or other
+    sessions, wait for each other instead of racing on the file.
+
+    The lock files live in the temporary folder of the host, keyed by the output path,
+    so no lock file is left next to the outputs. The lock is released by the system if
+    the process holding it dies.
+    """
+
+    FOLDER_NAME = "tk-multi-reviewsubmission-locks"
+
+    def __init__(self, path, timeout=None):
+        """
+        :param str path:        The output path to lock.
+        :param float timeout:   Number of seconds to wait for the lock, forever when None.
+        """
+        self._path = path
+        self._timeout = timeout
+        self._file = None
+
+        key = hashlib.sha1(
+            os.path.normcase(os.path.abspath(path)).encode("utf-8")
+        ).hexdigest()
+        self._lock_path = os.path.join(
+            tempfile.gettempdir(), self.FOLDER_NAME, "%s.lock" % key
+        )
+
+    @property
+    def path(self):
+        """
+        The locked output path.
+        """
+        return self._path
+
+    def acquire(self):
+        """
+        Acquire the lock, waiting for the other submissions holding it.
+
+        :raises RuntimeError:   If the lock can't be acquired within the timeout.
+        """
+        os.makedirs(os.path.dirname(self._lock_path), exist_ok=True)
+        lock_file = open(self._lock_path, "a+")
+
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        waiting = False
+        try:
+            while not _try_lock(lock_file):
+                if not waiting:
+                    logger.info(
+                        "Waiting for another submission writing %s." % self._path
+                    )
+                    waiting = True
+                if deadline is not None and time.monotonic() > deadline:
+                    raise RuntimeError(
+                        "Timed out waiting for another submission writing %s."
+                        % self._path
+                    )
+                time.sleep(POLL_INTERVAL)
+        except Exception:
+            lock_file.close()
+            raise
+
+        self._file = lock_file
+
+    def release(self):
+        """
+        Release the lock, if held.
+        """
+        if self._file is None:
+            return
+        try:
+            _unlock(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def get_staging_path(path):
+    """
+    Get a unique path to write a file to before moving it to its final location with
+    :func:`os.replace`, so the final file is never seen partially written, and a failed
+    write doesn't clobber the file already there.
+
+    The staging file lives in the folder of the final file, so it can be renamed
+    atomically, and keeps its extension, which renderers use to pick the file format.
+
+    :param str path:        The final path of the file.
+
+    :returns:               The staging path.
+    :rtype:                 str
+    """
+    folder, file_name = os.path.split(path)
+    stem, extension = os.path.splitext(file_name)
+    return os.path.join(
+        folder, ".%s.%s.partial%s" % (stem, uuid.uuid4().hex[:12], extension)
+    )
+
+
+def hold_lock_file(path):
+    """
+    Lock a file without blocking and keep it locked until it is closed, e.g. to mark a
+    resource as in use for the lifetime of the process. The system releases the lock if
+    the process dies.
+
+    :param str path:        Path of the lock file, created if missing.
+
+    :returns:               The opened and locked file, None if another process or
+                            another file object already holds the lock.
+    """
+    lock_file = open(path, "a+")
+    if not _try_lock(lock_file):
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def release_lock_file(lock_file):
+    """
+    Unlock and close a file returned by :func:`hold_lock_file`.
+
+    :param lock_file:       The opened and locked file.
+    """
+    try:
+        _unlock(lock_file)
+    finally:
+        lock_file.close()
+
+
+def is_lock_file_held(path):
+    """
+    Check if a lock file is held, by this process or another one.
+
+    :param str path:        Path of the lock file.
+
+    :returns:               True if the lock file is held.
+    :rtype:                 bool
+    """
+    try:
+        lock_file = open(path, "r+")
+    except OSError:
+        return False
+
+    try:
+        if not _try_lock(lock_file):
+            return True
+        _unlock(lock_file)
+        return False
+    finally:
+        lock_file.close()
+
+
+def _try_lock(lock_file):
+    """
+    Try to lock a file without blocking.
+
+    :param lock_file:       The opened lock file.
+
+    :returns:               True if the file was locked.
+    :rtype:                 bool
+    """
+    try:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(lock_file):
+    """
+    Unlock a file locked by :func:`_try_lock`.
+
+    :param lock_file:       The opened lock file.
+    """
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
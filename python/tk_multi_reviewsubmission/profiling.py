@@ -0,0 +1,189 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import contextvars
+import cProfile
+import os
+import re
+import time
+import uuid
+
+import sgtk
+
+from .tracing import trace_span
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Environment variable holding the folder to write the profiles to, taking precedence
+# over the profile_folder setting.
+PROFILE_FOLDER_ENV_VAR = "TK_MULTI_REVIEWSUBMISSION_PROFILE_FOLDER"
+
+# Profiler of the submission running in the current context.
+_current_profiler = contextvars.ContextVar(
+    "tk_multi_reviewsubmission_profiler", default=None
+)
+
+
+class SubmissionProfiler(object):
+    """
+    Profiles the stages of a submission with cProfile, writing one profile per stage
+    to a folder of its own, e.g. ``2026-10-19/143512-render_and_submit_version-1234-9f2c1a``.
+
+    The stages nest, e.g. the hook methods executed by the submission. Each profile only
+    holds the time spent in its own stage, the enclosing stage being paused while a
+    nested one runs. The profiles are numbered in the order the stages end and can be
+    read with :mod:`pstats` or tools like snakeviz.
+
+    Only the thread running the submission is profiled, not the threads it starts,
+    like the upload threads.
+    """
+
+    def __init__(self, root, name):
+        """
+        :param str root:        Folder holding the profiles of all the submissions.
+        :param str name:        Name of the submission.
+        """
+        self._folder = os.path.join(
+            root,
+            time.strftime("%Y-%m-%d"),
+            "%s-%s-%d-%s"
+            % (time.strftime("%H%M%S"), name, os.getpid(), uuid.uuid4().hex[:6]),
+        )
+        self._profiles = []
+        self._count = 0
+
+    @property
+    def folder(self):
+        """
+        Folder the profiles of the submission are written to.
+        """
+        return self._folder
+
+    @contextlib.contextmanager
+    def activate(self, name):
+        """
+        Context manager making this profiler the one profiling the stages of the
+        submission running in the current context, the whole context being profiled
+        as a stage of the given name.
+
+        :param str name:        Name of the stage.
+        """
+        token = _current_profiler.set(self)
+        try:
+            with self.stage(name):
+                yield self
+        finally:
+            _current_profiler.reset(token)
+            logger.info("Profiles of the submission written to %s" % self._folder)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Context manager profiling a stage of the submission.
+
+        :param str name:        Name of the stage.
+        """
+        profile = cProfile.Profile()
+        if self._profiles:
+            self._profiles[-1].disable()
+        self._profiles.append(profile)
+        _enable(profile)
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._profiles.pop()
+            self._dump(profile, name)
+            if self._profiles:
+                _enable(self._profiles[-1])
+
+    def _dump(self, profile, name):
+        """
+        Write the profile of a stage.
+
+        :param profile:         The ``cProfile.Profile`` of the stage.
+        :param str name:        Name of the stage.
+        """
+        self._count += 1
+        path = os.path.join(
+            self._folder,
+            "%02d-%s.prof" % (self._count, re.sub(r"[^\w.-]", "_", name)),
+        )
+        try:
+            os.makedirs(self._folder, exist_ok=True)
+            profile.dump_stats(path)
+        except Exception as e:
+            logger.warning("Unable to write the profile %s: %s" % (path, e))
+
+
+@contextlib.contextmanager
+def profile_submission(app, name):
+    """
+    Context manager profiling a submission when profiling is enabled, by the
+    ``profile_folder`` setting or the ``TK_MULTI_REVIEWSUBMISSION_PROFILE_FOLDER``
+    environment variable. A submission started by another one is profiled as one of
+    its stages. Does nothing otherwise.
+
+    :param app:             The app instance.
+    :param str name:        Name of the submission.
+    """
+    profiler = _current_profiler.get()
+    if profiler:
+        with profiler.stage(name):
+            yield
+        return
+
+    root = os.environ.get(PROFILE_FOLDER_ENV_VAR) or app.get_setting("profile_folder")
+    if not root:
+        yield
+        return
+
+    with SubmissionProfiler(os.path.expanduser(root), name).activate(name):
+        yield
+
+
+def execute_hook_method(app, key, method_name, **kwargs):
+    """
+    Execute a hook method of the app, traced as a span and profiled as a stage of the
+    submission running in the current context, if enabled.
+
+    :param app:             The app instance.
+    :param str key:         Name of the hook setting.
+    :param str method_name: Name of the hook method.
+
+    :returns:               The result of the hook method.
+    """
+    name = "%s.%s" % (key, method_name)
+    profiler = _current_profiler.get()
+    with trace_span(name):
+        if profiler is None:
+            return app.execute_hook_method(
+                key=key, method_name=method_name, base_class=None, **kwargs
+            )
+
+        with profiler.stage(name):
+            return app.execute_hook_method(
+                key=key, method_name=method_name, base_class=None, **kwargs
+            )
+
+
+def _enable(profile):
+    """
+    Enable a profile, unless another profiler is already running in this process,
+    which Python 3.12 and later don't allow, e.g. a submission profiled in another
+    thread.
+
+    :param profile:         The ``cProfile.Profile`` to enable.
+    """
+    try:
+        profile.enable()
+    except ValueError as e:
+        logger.debug("Unable to profile the stage: %s" % e)
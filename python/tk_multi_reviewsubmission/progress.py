@@ -0,0 +1,167 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import contextvars
+import threading
+import time
+
+# Reporter of the submission running in the current context.
+_current_reporter = contextvars.ContextVar(
+    "tk_multi_reviewsubmission_progress_reporter", default=None
+)
+
+# Maximum number of times per second the progress callback is called.
+DEFAULT_MAX_UPDATES_PER_SECOND = 10.0
+
+
+class ProgressReporter(object):
+    """
+    Merges the progress of the submission stages into a single stream of monotonic
+    percentages, throttled before reaching the progress callback so the render and
+    upload loops can report as often as they like.
+
+    A submission is made of stages, each of them covering a range of the overall
+    percentage. The code running a stage reports its progress as a fraction of the
+    stage, see :meth:`update` and :func:`report_progress`.
+    """
+
+    def __init__(
+        self,
+        progress_cb,
+        max_updates_per_second=DEFAULT_MAX_UPDATES_PER_SECOND,
+        clock=time.monotonic,
+    ):
+        """
+        :param progress_cb:                 Callable receiving the percentage and a message.
+                                            Can be None.
+        :param float max_updates_per_second: Maximum rate at which progress_cb is called.
+        :param clock:                       Callable returning the current time in seconds.
+        """
+        self._progress_cb = progress_cb
+        self._min_interval = 1.0 / max_updates_per_second
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._stage_start = 0.0
+        self._stage_end = 100.0
+        self._stage_message = None
+        self._percent = 0.0
+        self._message = None
+        self._last_dispatch = None
+
+    @property
+    def percent(self):
+        """
+        Overall percentage of the submission reached so far.
+        """
+        return self._percent
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Context manager making this reporter the one :func:`report_progress` reports to.
+        """
+        token = _current_reporter.set(self)
+        try:
+            yield self
+        finally:
+            _current_reporter.reset(token)
+
+    def begin_stage(self, start, end, message):
+        """
+        Start a new stage. Its beginning is always dispatched.
+
+        :param float start:     Overall percentage at the beginning of the stage.
+        :param float end:       Overall percentage at the end of the stage.
+        :param str message:     Description of the stage.
+        """
+        with self._lock:
+            self._stage_start = max(start, self._percent)
+            self._stage_end = max(end, self._stage_start)
+            self._stage_message = message
+            self._set(self._stage_start, message)
+        self._dispatch(force=True)
+
+    def update(self, fraction, message=None):
+        """
+        Report the progress of the current stage.
+
+        :param float fraction:  Fraction of the stage done, between 0 and 1.
+        :param str message:     Description of the step, the stage one when None.
+        """
+        fraction = min(max(fraction, 0.0), 1.0)
+        with self._lock:
+            self._set(
+                self._stage_start + (self._stage_end - self._stage_start) * fraction,
+                message or self._stage_message,
+            )
+        self._dispatch()
+
+    def finish(self, message):
+        """
+        Report the end of the submission.
+
+        :param str message:     Final message.
+        """
+        with self._lock:
+            self._set(100.0, message)
+        self._dispatch(force=True)
+
+    def _set(self, percent, message):
+        """
+        Record a new progress, the percentage never going backwards.
+        """
+        self._percent = max(self._percent, percent)
+        self._message = message
+
+    def _dispatch(self, force=False):
+        """
+        Call the progress callback if the last call is old enough.
+
+        :param bool force:      Call the progress callback regardless of the last call.
+        """
+        if not self._progress_cb:
+            return
+
+        with self._lock:
+            now = self._clock()
+            if (
+                not force
+                and self._last_dispatch is not None
+                and now - self._last_dispatch < self._min_interval
+            ):
+                return
+            self._last_dispatch = now
+            percent, message = self._percent, self._message
+
+        self._progress_cb(int(percent), message)
+
+
+def get_current_reporter():
+    """
+    :returns:               The reporter of the submission running in the current
+                            context, None if there is none.
+    :rtype:                 :class:`ProgressReporter`
+    """
+    return _current_reporter.get()
+
+
+def report_progress(fraction, message=None):
+    """
+    Report the progress of the current stage of the submission running in the current
+    context. Does nothing outside of a submission, e.g. in a background thread.
+
+    :param float fraction:  Fraction of the stage done, between 0 and 1.
+    :param str message:     Description of the step.
+    """
+    reporter = _current_reporter.get()
+    if reporter:
+        reporter.update(fraction, message)
@@ -0,0 +1,466 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import contextvars
+import errno
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import uuid
+
+import sgtk
+
+from .locking import hold_lock_file, is_lock_file_held, release_lock_file
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Allocation folder the allocations of the current context are made in, see
+# :meth:`ScratchSpace.allocate_in`.
+_target_folder = contextvars.ContextVar(
+    "tk_multi_reviewsubmission_scratch_folder", default=None
+)
+
+
+class ScratchSpace(object):
+    """
+    Hands out local paths to render review media to, before they get uploaded or
+    copied to their final location.
+
+    Each session renders into its own folder on the first usable scratch location.
+    The total size of the scratch space is kept under a quota by evicting the least
+    recently written media first, and the folders left behind by crashed sessions are
+    removed when the session starts using the scratch space.
+
+    Each allocation holds a lock file next to its folder until it is released, so the
+    allocations still in use by any running session are never evicted.
+    """
+
+    FOLDER_NAME = "tk-multi-reviewsubmission"
+
+    # Number of seconds the usage of the scratch space is estimated from the last scan
+    # and the size hints of the allocations, before the scratch space is scanned again.
+    RESCAN_INTERVAL = 60
+
+    def __init__(self, locations=None, quota=0, grace_period=600):
+        """
+        :param list(str) locations: Candidate scratch locations, fastest first. The system
+                                    temporary folder is used when none of them is usable.
+        :param int quota:           Maximum size of the scratch space in bytes, 0 to disable.
+        :param int grace_period:    Number of seconds during which media written by other
+                                    running sessions, and not allocated anymore, are
+                                    protected from eviction.
+        """
+        self._root = os.path.join(self._get_location(locations or []), self.FOLDER_NAME)
+        self._hostname = socket.gethostname()
+        self._session_folder = os.path.join(
+            self._root, "%s-%d" % (self._hostname, os.getpid())
+        )
+        self._quota = quota
+        self._grace_period = grace_period
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+        # Lock files held by the allocations of this session, by allocation folder.
+        self._allocations = {}
+        self._initialized = False
+        # Estimated number of bytes used, None until the scratch space is scanned.
+        self._usage = None
+        self._scanned_at = 0
+
+    @property
+    def root(self):
+        """
+        Folder holding the scratch space of all the sessions.
+        """
+        return self._root
+
+    @property
+    def session_folder(self):
+        """
+        Folder holding the scratch space of the current session.
+        """
+        return self._session_folder
+
+    def allocate(self, file_name, size_hint=0):
+        """
+        Get a path to write a file to. Each path lives in its own folder, so the file can
+        keep its name, and stays protected from eviction until it is released.
+
+        :param str file_name:   Name of the file to write.
+        :param int size_hint:   Expected size of the file in bytes, used to make room for it.
+
+        :returns:               Path to write the file to.
+        :rtype:                 str
+        """
+        target_folder = _target_folder.get()
+        if target_folder:
+            # Protected by the lock of the allocation folder holding it.
+            allocation_folder = os.path.join(target_folder, uuid.uuid4().hex[:12])
+            os.makedirs(allocation_folder)
+        else:
+            allocation_folder = self.allocate_folder(size_hint)
+
+        return os.path.join(allocation_folder, file_name)
+
+    def allocate_folder(self, size_hint=0):
+        """
+        Get a folder to write files to, protected from eviction until it is released.
+
+        :param int size_hint:   Expected size of the files in bytes, used to make room
+                                for them.
+
+        :returns:               Path of the folder.
+        :rtype:                 str
+        """
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self.cleanup_orphans()
+
+            allocation_folder = os.path.join(
+                self._session_folder, uuid.uuid4().hex[:12]
+            )
+            # Locked before the folder exists, so other sessions never see it unlocked.
+            os.makedirs(self._session_folder, exist_ok=True)
+            lock_file = hold_lock_file(_get_lock_path(allocation_folder))
+            os.makedirs(allocation_folder)
+            self._allocations[allocation_folder] = lock_file
+
+        if self._quota:
+            self._reserve(size_hint)
+
+        return allocation_folder
+
+    @contextlib.contextmanager
+    def allocate_in(self, folder):
+        """
+        Context manager making the allocations of the current context in a folder
+        allocated by another process, e.g. so the media rendered by a worker process
+        stay protected by the process which queued them until it releases the folder.
+
+        :param str folder:      Folder returned by :meth:`allocate_folder`. The
+                                allocations are made as usual when None.
+        :raises RuntimeError:   If the folder isn't in the scratch space.
+        """
+        if folder and not self.contains(folder):
+            raise RuntimeError("%s isn't a folder of the scratch space." % folder)
+
+        token = _target_folder.set(folder)
+        try:
+            yield
+        finally:
+            _target_folder.reset(token)
+
+    def release(self, path):
+        """
+        Remove a file and its allocation folder from the scratch space. Files which
+        were not allocated by this session are simply removed, along with their
+        allocation folder once it is empty.
+
+        :param str path:        Path previously returned by :meth:`allocate`.
+        """
+        allocation_folder = os.path.dirname(path)
+
+        with self._lock:
+            if allocation_folder not in self._allocations:
+                if os.path.isfile(path):
+                    os.unlink(path)
+                # Allocation folders of other sessions go away with their last file.
+                if self.contains(allocation_folder):
+                    try:
+                        os.rmdir(allocation_folder)
+                    except OSError:
+                        pass
+                return
+
+        self.release_folder(allocation_folder)
+
+    def release_folder(self, folder):
+        """
+        Remove a folder allocated by this session and the files it holds.
+
+        :param str folder:      Path previously returned by :meth:`allocate_folder`.
+        """
+        with self._lock:
+            lock_file = self._allocations.pop(folder, None)
+            if lock_file is None:
+                return
+
+            if self._usage is not None:
+                self._usage = max(self._usage - _get_size(folder), 0)
+
+        shutil.rmtree(folder, ignore_errors=True)
+        release_lock_file(lock_file)
+        _unlink(_get_lock_path(folder))
+
+    def contains(self, path):
+        """
+        :param str path:        Path to check.
+
+        :returns:               True if the path is located in the scratch space.
+        :rtype:                 bool
+        """
+        return os.path.abspath(path).startswith(self._root + os.sep)
+
+    def cleanup_orphans(self):
+        """
+        Remove the session folders of this host whose process is not running anymore,
+        keeping the allocations another process still holds, e.g. media handed over to
+        it for upload.
+        """
+        for folder_name in _listdir(self._root):
+            hostname, _, pid = folder_name.rpartition("-")
+            if hostname != self._hostname or not pid.isdigit():
+                continue
+
+            if int(pid) == os.getpid() or _is_process_running(int(pid)):
+                continue
+
+            folder = os.path.join(self._root, folder_name)
+            held = [
+                name
+                for name in _listdir(folder)
+                if name.endswith(".lock")
+                and is_lock_file_held(os.path.join(folder, name))
+            ]
+            if held:
+                logger.debug(
+                    "Keeping the orphan scratch folder %s, %d allocations are still "
+                    "in use." % (folder_name, len(held))
+                )
+                continue
+
+            logger.debug("Removing orphan scratch folder %s" % folder_name)
+            shutil.rmtree(folder, ignore_errors=True)
+
+    def evict(self, required_size=0):
+        """
+        Remove the least recently written media until the scratch space has room for
+        ``required_size`` bytes within its quota. Media allocated and not yet released
+        by any running session are never evicted, neither are the media recently written
+        by another session.
+
+        The scratch space is scanned by one thread at a time, the other threads keeping
+        the estimated usage.
+
+        :param int required_size:   Number of bytes to make room for.
+        """
+        if not self._evict_lock.acquire(blocking=False):
+            return
+
+        try:
+            usage = self._evict(required_size)
+        finally:
+            self._evict_lock.release()
+
+        with self._lock:
+            self._usage = usage + required_size
+            self._scanned_at = time.monotonic()
+
+        if usage + required_size > self._quota:
+            logger.warning(
+                "The scratch space quota of %d bytes is exceeded (%d bytes used)."
+                % (self._quota, usage + required_size)
+            )
+
+    def _reserve(self, size):
+        """
+        Account for a new allocation, making room for it when the estimated usage of the
+        scratch space exceeds the quota or the estimate is out of date.
+
+        :param int size:        Expected size of the allocation in bytes.
+        """
+        with self._lock:
+            if (
+                self._usage is not None
+                and time.monotonic() - self._scanned_at < self.RESCAN_INTERVAL
+                and self._usage + size <= self._quota
+            ):
+                self._usage += size
+                return
+
+        self.evict(size)
+
+    def _evict(self, required_size):
+        """
+        Scan the scratch space and evict the least recently written media, see
+        :meth:`evict`.
+
+        :param int required_size:   Number of bytes to make room for.
+
+        :returns:               Number of bytes used once the media are evicted.
+        :rtype:                 int
+        """
+        with self._lock:
+            allocations = set(self._allocations)
+
+        now = time.time()
+        usage = 0
+        candidates = []
+        for folder, files in self._walk():
+            size = 0
+            last_write = 0
+            for file_path in files:
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                size += stat.st_size
+                last_write = max(last_write, stat.st_mtime)
+
+            usage += size
+
+            if folder in allocations:
+                continue
+            if (
+                not folder.startswith(self._session_folder + os.sep)
+                and now - last_write < self._grace_period
+            ):
+                continue
+            candidates.append((last_write, size, folder))
+
+        candidates.sort()
+        for last_write, size, folder in candidates:
+            if usage + required_size <= self._quota:
+                break
+            # Checked last, the allocations of other sessions being locked by them.
+            if is_lock_file_held(_get_lock_path(folder)):
+                continue
+            logger.debug(
+                "Evicting %s from the scratch space (%d bytes)" % (folder, size)
+            )
+            shutil.rmtree(folder, ignore_errors=True)
+            _unlink(_get_lock_path(folder))
+            usage -= size
+
+        return usage
+
+    def _walk(self):
+        """
+        Iterate over the allocation folders of all the sessions.
+
+        :returns:               Generator of the allocation folders along with the paths
+                                of the files they hold.
+        """
+        for session_name in _listdir(self._root):
+            session_folder = os.path.join(self._root, session_name)
+            for allocation_name in _listdir(session_folder):
+                allocation_folder = os.path.join(session_folder, allocation_name)
+                if not os.path.isdir(allocation_folder):
+                    continue
+                files = []
+                for dir_path, _, file_names in os.walk(allocation_folder):
+                    files.extend(os.path.join(dir_path, f) for f in file_names)
+                yield allocation_folder, files
+
+    def _get_location(self, locations):
+        """
+        Pick the first usable scratch location.
+
+        :param list(str) locations: Candidate scratch locations, fastest first.
+
+        :returns:               The scratch location.
+        :rtype:                 str
+        """
+        for location in locations:
+            location = os.path.expanduser(os.path.expandvars(location))
+            if os.path.isdir(location) and os.access(location, os.W_OK | os.X_OK):
+                return location
+            logger.debug("Skipping unusable scratch location %s" % location)
+
+        return tempfile.gettempdir()
+
+
+def _get_lock_path(allocation_folder):
+    """
+    :param str allocation_folder: An allocation folder.
+
+    :returns:               Path of the lock file held while the allocation is in use.
+    :rtype:                 str
+    """
+    return allocation_folder + ".lock"
+
+
+def _get_size(folder):
+    """
+    :param str folder:      A folder.
+
+    :returns:               Number of bytes of the files of the folder.
+    :rtype:                 int
+    """
+    size = 0
+    for dir_path, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            try:
+                size += os.path.getsize(os.path.join(dir_path, file_name))
+            except OSError:
+                pass
+    return size
+
+
+def _unlink(path):
+    """
+    Remove a file, ignoring a missing file.
+
+    :param str path:        Path of the file.
+    """
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _listdir(path):
+    """
+    List a folder, treating a missing folder as an empty one.
+
+    :param str path:        Folder to list.
+
+    :returns:               Sorted names of the folder entries.
+    :rtype:                 list(str)
+    """
+    try:
+        return sorted(os.listdir(path))
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            return []
+        raise
+
+
+def _is_process_running(pid):
+    """
+    Check if a process is running on this host.
+
+    :param int pid:         Identifier of the process.
+
+    :returns:               True if the process is running.
+    :rtype:                 bool
+    """
+    if sgtk.util.is_windows():
+        import ctypes
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        handle = ctypes.windll.kernel32.OpenProcess(
+            PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+        )
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        # EPERM means the process exists but belongs to another user.
+        return e.errno == errno.EPERM
+    return True
@@ -0,0 +1,430 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import concurrent.futures
+import mimetypes
+import os
+import threading
+import urllib.parse
+
+import sgtk
+
+from .locking import OutputLock, get_staging_path
+
+try:
+    import boto3
+except ImportError:
+    boto3 = None
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Size of the parts of the multipart uploads to object storages, and the minimum size
+# the S3 API accepts for all the parts but the last one.
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Number of parts uploaded at once.
+DEFAULT_CONCURRENCY = 8
+
+
+def get_storage(
+    url=None,
+    root=None,
+    endpoint_url=None,
+    part_size=DEFAULT_PART_SIZE,
+    concurrency=DEFAULT_CONCURRENCY,
+    ensure_folder_exists=None,
+):
+    """
+    Get the storage backend the movies are stored to.
+
+    :param str url:         Location of the storage: empty for the file system, or
+                            ``s3://bucket/prefix`` for an S3 compatible object storage.
+    :param str root:        Root folder of the movie paths, the paths being stored in the
+                            object storage relative to it.
+    :param str endpoint_url: URL of the S3 compatible object storage, the AWS one when
+                            None, e.g. a local object storage to test against.
+    :param int part_size:   Size of the parts of the multipart uploads.
+    :param int concurrency: Number of parts uploaded at once.
+    :param ensure_folder_exists: Callable creating the folders of the movies stored on the
+                            file system.
+
+    :returns:               The storage backend.
+    :raises RuntimeError:   If the storage isn't supported.
+    """
+    if not url or url.startswith("file://"):
+        return PosixStorage(ensure_folder_exists)
+
+    parsed_url = urllib.parse.urlparse(url)
+    if parsed_url.scheme == "s3":
+        return S3Storage(
+            parsed_url.netloc,
+            parsed_url.path.strip("/"),
+            root,
+            endpoint_url,
+            part_size,
+            concurrency,
+        )
+
+    raise RuntimeError(
+        "Unsupported movie storage %s, expected a s3:// URL or an empty one for the "
+        "file system." % url
+    )
+
+
+class PosixStorage(object):
+    """
+    Stores the movies on the file system, at the paths of the movie path template.
+    """
+
+    def __init__(self, ensure_folder_exists=None):
+        """
+        :param ensure_folder_exists: Callable creating the folder of a movie.
+        """
+        self._ensure_folder_exists = ensure_folder_exists or (
+            lambda folder: os.makedirs(folder, exist_ok=True)
+        )
+
+    @property
+    def is_local(self):
+        """
+        Whether the stored movies can be read as files.
+        """
+        return True
+
+    def get_location(self, path):
+        """
+        :param str path:        Path of the movie, resolved from the movie path template.
+
+        :returns:               Location of the stored movie.
+        :rtype:                 str
+        """
+        return path
+
+    def open(self, path):
+        """
+        Open a movie for writing.
+
+        :param str path:        Path of the movie, resolved from the movie path template.
+
+        :returns:               A sink to write the movie to, see :class:`PosixStorageSink`.
+        """
+        return PosixStorageSink(path, self._ensure_folder_exists)
+
+
+class PosixStorageSink(object):
+    """
+    Sink writing a movie to the file system.
+
+    The path of the movie is locked while the movie is written to a staging file next
+    to it, which replaces the movie atomically once closed.
+    """
+
+    def __init__(self, path, ensure_folder_exists):
+        """
+        :param str path:        Path of the movie.
+        :param ensure_folder_exists: Callable creating the folder of the movie.
+        """
+        self._path = path
+        self._lock = OutputLock(path)
+        self._lock.acquire()
+        try:
+            ensure_folder_exists(os.path.dirname(path))
+            self._staging_path = get_staging_path(path)
+            self._file = open(self._staging_path, "wb")
+        except Exception:
+            self._lock.release()
+            raise
+
+    def write(self, data):
+        """
+        Write data to the movie.
+
+        :param data:            Bytes-like object to write.
+        """
+        self._file.write(data)
+
+    def close(self):
+        """
+        Replace the movie with the data written.
+        """
+        try:
+            self._file.close()
+            os.replace(self._staging_path, self._path)
+        except Exception:
+            self.abort()
+            raise
+        self._lock.release()
+
+    def abort(self):
+        """
+        Discard the data written, leaving the movie untouched.
+        """
+        try:
+            self._file.close()
+            if os.path.exists(self._staging_path):
+                os.unlink(self._staging_path)
+        finally:
+            self._lock.release()
+
+
+class S3Storage(object):
+    """
+    Stores the movies in an S3 compatible object storage, under a prefix of a bucket.
+
+    The movies are uploaded in parts, several of them at once, while they are being
+    read for their upload to Shotgun. The credentials are looked up by boto3 as usual,
+    e.g. from the environment or the AWS configuration files.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        prefix="",
+        root=None,
+        endpoint_url=None,
+        part_size=DEFAULT_PART_SIZE,
+        concurrency=DEFAULT_CONCURRENCY,
+        client=None,
+    ):
+        """
+        :param str bucket:      Name of the bucket.
+        :param str prefix:      Prefix of the keys of the movies.
+        :param str root:        Root folder of the movie paths, the keys of the movies being
+                                their path relative to it. The whole path is used when None.
+        :param str endpoint_url: URL of the object storage, the AWS one when None.
+        :param int part_size:   Size of the parts of the multipart uploads.
+        :param int concurrency: Number of parts uploaded at once.
+        :param client:          The boto3 S3 client, created when None.
+        :raises RuntimeError:   If boto3 can't be imported.
+        """
+        if client is None:
+            if not self.is_supported():
+                raise RuntimeError(
+                    "boto3 can't be imported, unable to store the movies to s3://%s."
+                    % bucket
+                )
+            client = boto3.client("s3", endpoint_url=endpoint_url or None)
+
+        self._client = client
+        self._bucket = bucket
+        self._prefix = prefix
+        self._root = root
+        self._part_size = max(part_size, MIN_PART_SIZE)
+        self._concurrency = max(concurrency, 1)
+
+    @classmethod
+    def is_supported(cls):
+        """
+        :returns:               Whether boto3 can be imported.
+        :rtype:                 bool
+        """
+        return boto3 is not None
+
+    @property
+    def is_local(self):
+        """
+        Whether the stored movies can be read as files.
+        """
+        return False
+
+    def get_location(self, path):
+        """
+        :param str path:        Path of the movie, resolved from the movie path template.
+
+        :returns:               URL of the stored movie.
+        :rtype:                 str
+        """
+        return "s3://%s/%s" % (self._bucket, self.get_key(path))
+
+    def get_key(self, path):
+        """
+        :param str path:        Path of the movie, resolved from the movie path template.
+
+        :returns:               Key of the movie in the bucket.
+        :rtype:                 str
+        """
+        if self._root:
+            path = os.path.relpath(path, self._root)
+        path = os.path.splitdrive(path)[1].replace(os.sep, "/").lstrip("/")
+        return "/".join(part for part in (self._prefix, path) if part)
+
+    def open(self, path):
+        """
+        Open a movie for writing.
+
+        :param str path:        Path of the movie, resolved from the movie path template.
+
+        :returns:               A sink to write the movie to, see :class:`S3UploadSink`.
+        """
+        return S3UploadSink(
+            self._client,
+            self._bucket,
+            self.get_key(path),
+            self._part_size,
+            self._concurrency,
+        )
+
+
+class S3UploadSink(object):
+    """
+    Sink uploading the data written to it to an S3 compatible object storage.
+
+    The data is buffered into parts, which are uploaded by a pool of threads while the
+    following parts are being written. The number of parts in memory is bounded by the
+    concurrency, the writes waiting for a part to be uploaded when it is reached. The
+    files smaller than a part are uploaded with a single request.
+    """
+
+    def __init__(self, client, bucket, key, part_size, concurrency):
+        """
+        :param client:          The boto3 S3 client.
+        :param str bucket:      Name of the bucket.
+        :param str key:         Key of the uploaded file.
+        :param int part_size:   Size of the parts.
+        :param int concurrency: Number of parts uploaded at once.
+        """
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+        self._part_size = part_size
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            concurrency, thread_name_prefix="ReviewSubmissionS3Upload"
+        )
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._futures = []
+        self._upload_id = None
+
+        self._part = bytearray(part_size)
+        self._part_length = 0
+
+    def write(self, data):
+        """
+        Buffer data and upload the parts as they fill up.
+
+        :param data:            Bytes-like object to upload.
+        """
+        data = memoryview(data)
+        while data:
+            length = min(len(data), self._part_size - self._part_length)
+            self._part[self._part_length : self._part_length + length] = data[:length]
+            self._part_length += length
+            data = data[length:]
+
+            if self._part_length == self._part_size:
+                self._send_part()
+
+    def close(self):
+        """
+        Upload the last part and complete the upload.
+        """
+        try:
+            if self._upload_id is None:
+                self._client.put_object(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    Body=self._part[: self._part_length],
+                    ContentType=self._content_type,
+                )
+            else:
+                if self._part_length:
+                    self._send_part()
+                parts = [future.result() for future in self._futures]
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            self.abort()
+            raise
+
+        self._executor.shutdown()
+        logger.debug(
+            "Uploaded s3://%s/%s in %d parts"
+            % (self._bucket, self._key, len(self._futures) or 1)
+        )
+
+    def abort(self):
+        """
+        Cancel the upload, removing the parts already uploaded.
+        """
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown()
+
+        if self._upload_id is not None:
+            try:
+                self._client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+            except Exception as e:
+                logger.warning(
+                    "Unable to abort the upload of s3://%s/%s: %s"
+                    % (self._bucket, self._key, e)
+                )
+            self._upload_id = None
+
+    def _send_part(self):
+        """
+        Queue the upload of the buffered part, waiting for a slot when all of them are
+        taken.
+        """
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key, ContentType=self._content_type
+            )["UploadId"]
+
+        # Report the failures of the previous parts without waiting for the last one.
+        for future in self._futures:
+            if future.done() and future.exception():
+                raise future.exception()
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                self._upload_part,
+                len(self._futures) + 1,
+                self._part[: self._part_length],
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+        # The queued part keeps its own copy of the data.
+        self._part_length = 0
+
+    def _upload_part(self, part_number, data):
+        """
+        Upload a part.
+
+        :param int part_number: Number of the part, starting at 1.
+        :param bytearray data:  Data of the part.
+
+        :returns:               The number and the ETag of the uploaded part.
+        :rtype:                 dict
+        """
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        logger.debug(
+            "Uploaded part %d of s3://%s/%s (%d bytes)"
+            % (part_number, self._bucket, self._key, len(data))
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
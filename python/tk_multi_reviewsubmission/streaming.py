@@ -0,0 +1,147 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import hashlib
+import os
+
+from .locking import get_staging_path
+
+# Size of the chunks read from the media, large enough to keep network storages busy.
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+class ChecksumSink(object):
+    """
+    Sink computing the checksum of the data written to it.
+    """
+
+    def __init__(self, algorithm="sha256"):
+        """
+        :param str algorithm:   Name of the hashlib algorithm to use.
+        """
+        self._algorithm = algorithm
+        self._hash = hashlib.new(algorithm)
+
+    @property
+    def algorithm(self):
+        """
+        Name of the hashlib algorithm used.
+        """
+        return self._algorithm
+
+    def write(self, data):
+        """
+        Add data to the checksum.
+
+        :param bytes data:      Data to add.
+        """
+        self._hash.update(data)
+
+    def hexdigest(self):
+        """
+        :returns:               The checksum of the data written so far.
+        :rtype:                 str
+        """
+        return self._hash.hexdigest()
+
+
+class ByteCounterSink(object):
+    """
+    Sink counting the bytes written to it, to follow the progress of a transfer from
+    another thread.
+    """
+
+    def __init__(self):
+        self._bytes_written = 0
+
+    @property
+    def bytes_written(self):
+        """
+        Number of bytes written so far.
+        """
+        return self._bytes_written
+
+    def write(self, data):
+        """
+        Count the written data.
+
+        :param bytes data:      Data written.
+        """
+        self._bytes_written += len(data)
+
+
+def fan_out(source_path, sinks, buffer_size=DEFAULT_BUFFER_SIZE, on_error=None):
+    """
+    Read a file once and feed each of its chunks to all the sinks.
+
+    The file is read into a single reused buffer, so the memory used stays the same
+    whatever the size of the file. The sinks are given a view on that buffer and must
+    be done with the data when their ``write`` method returns.
+
+    :param str source_path:     Path of the file to read.
+    :param list sinks:          Objects with a ``write`` method, like opened files or
+                                :class:`ChecksumSink` instances.
+    :param int buffer_size:     Size of the chunks read from the file.
+    :param on_error:            Callable receiving a sink and the exception it raised. The
+                                failing sink isn't fed anymore while the others carry on.
+                                When None, the exception is raised.
+
+    :returns:                   Number of bytes read.
+    :rtype:                     int
+    """
+    sinks = list(sinks)
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+
+    size = 0
+    with open(source_path, "rb", buffering=0) as source:
+        while True:
+            read = source.readinto(buffer)
+            if not read:
+                break
+            size += read
+            chunk = view[:read]
+            for sink in list(sinks):
+                try:
+                    sink.write(chunk)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    sinks.remove(sink)
+                    on_error(sink, e)
+
+    return size
+
+
+def copy_file(source_path, destination_path, sinks=(), buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Copy a file, feeding the sinks from the same pass over the source file.
+
+    The copy is written to a staging file next to the destination, which then
+    replaces the destination atomically.
+
+    :param str source_path:         Path of the file to copy.
+    :param str destination_path:    Path of the copy.
+    :param list sinks:              Additional sinks to feed, see :func:`fan_out`.
+    :param int buffer_size:         Size of the chunks read from the file.
+
+    :returns:                       Number of bytes copied.
+    :rtype:                         int
+    """
+    staging_path = get_staging_path(destination_path)
+    try:
+        with open(staging_path, "wb") as destination:
+            size = fan_out(source_path, [destination] + list(sinks), buffer_size)
+        os.replace(staging_path, destination_path)
+    finally:
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
+
+    return size
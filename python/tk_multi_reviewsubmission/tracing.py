@@ -0,0 +1,280 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import contextlib
+import contextvars
+import getpass
+import json
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Environment variable holding the file to export the spans to, taking precedence over
+# the trace_file setting.
+TRACE_FILE_ENV_VAR = "TK_MULTI_REVIEWSUBMISSION_TRACE_FILE"
+
+# Environment variable carrying the trace context to the child processes, in the W3C
+# Trace Context format.
+TRACEPARENT_ENV_VAR = "TRACEPARENT"
+
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# Span running in the current context.
+_current_span = contextvars.ContextVar("tk_multi_reviewsubmission_span", default=None)
+
+# Exporter of the spans of the process, None when tracing is disabled.
+_exporter = None
+
+
+class Span(object):
+    """
+    A timed operation of a submission, child of the span which was current when it
+    started. The spans of a submission share its trace id, across threads and
+    processes.
+    """
+
+    def __init__(self, name, trace_id, parent_id=None, attributes=None):
+        """
+        :param str name:        Name of the operation.
+        :param str trace_id:    Id of the trace, 32 hexadecimal digits.
+        :param str parent_id:   Id of the parent span, 16 hexadecimal digits. Can be None.
+        :param dict attributes: Attributes of the operation.
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.error = None
+        self.start_time = time.time_ns()
+        self.end_time = None
+
+    @property
+    def traceparent(self):
+        """
+        The trace context of the span, in the W3C Trace Context format.
+        """
+        return "00-%s-%s-01" % (self.trace_id, self.span_id)
+
+    def set_attribute(self, name, value):
+        """
+        Set an attribute of the operation, e.g. an id known once it completed.
+
+        :param str name:        Name of the attribute.
+        :param value:           Value of the attribute, serializable to JSON.
+        """
+        self.attributes[name] = value
+
+    def to_dict(self):
+        """
+        :returns:               The span in the JSON encoding of the OpenTelemetry span
+                                data model.
+        :rtype:                 dict
+        """
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_time,
+            "endTimeUnixNano": self.end_time,
+            "attributes": self.attributes,
+            "status": {"code": "STATUS_CODE_OK"},
+        }
+        if self.error is not None:
+            span["status"] = {"code": "STATUS_CODE_ERROR", "message": self.error}
+        return span
+
+
+class FileSpanExporter(object):
+    """
+    Appends the ended spans to a file, one JSON document per line, along with the
+    resource which produced them: the host, the process and the user. The processes of
+    the host can share the file, each span being written with a single append.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path:        Path of the file.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._resource = {
+            "service.name": "tk-multi-reviewsubmission",
+            "host.name": socket.gethostname(),
+            "process.pid": os.getpid(),
+            "user.name": _get_user_name(),
+        }
+
+    @property
+    def path(self):
+        """
+        Path of the file the spans are exported to.
+        """
+        return self._path
+
+    def export(self, span):
+        """
+        Append a span to the file.
+
+        :param span:            The ended :class:`Span`.
+        """
+        record = span.to_dict()
+        record["resource"] = self._resource
+        record["thread"] = threading.current_thread().name
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+        try:
+            with self._lock:
+                fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+        except OSError as e:
+            logger.debug("Unable to export the span %s: %s" % (span.name, e))
+
+
+def configure_tracing(path):
+    """
+    Enable or disable the export of the spans of the process.
+
+    :param str path:        File to export the spans to, see :class:`FileSpanExporter`.
+                            Tracing is disabled when empty.
+    """
+    global _exporter
+
+    if not path:
+        _exporter = None
+        return
+
+    path = os.path.expanduser(os.path.expandvars(path))
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    _exporter = FileSpanExporter(path)
+
+
+def is_tracing_enabled():
+    """
+    :returns:               Whether the spans of the process are exported.
+    :rtype:                 bool
+    """
+    return _exporter is not None
+
+
+@contextlib.contextmanager
+def trace_span(name, traceparent=None, **attributes):
+    """
+    Context manager tracing an operation as a child of the span running in the current
+    context. The root spans of a process continue the trace of the ``TRACEPARENT``
+    environment variable, if set. Does nothing when tracing is disabled.
+
+    :param str name:        Name of the operation.
+    :param str traceparent: Trace context of the parent span in the W3C Trace Context
+                            format, e.g. received from another process. Takes precedence
+                            over the span running in the current context.
+    :param attributes:      Attributes of the operation.
+
+    :returns:               The :class:`Span`, None when tracing is disabled.
+    """
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+
+    trace_id, parent_id = _get_parent(traceparent)
+    span = Span(name, trace_id, parent_id, attributes)
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = "%s: %s" % (type(e).__name__, e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end_time = time.time_ns()
+        exporter.export(span)
+
+
+def get_current_span():
+    """
+    :returns:               The span running in the current context, None if there is
+                            none.
+    :rtype:                 :class:`Span`
+    """
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def attach_span(span):
+    """
+    Context manager making a span the one running in the current context, e.g. to trace
+    the work of a thread as a child of the span which started it.
+
+    :param span:            The :class:`Span`. Can be None.
+    """
+    token = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(token)
+
+
+def get_traceparent():
+    """
+    :returns:               The trace context of the span running in the current
+                            context in the W3C Trace Context format, to pass it to
+                            another process. None if there is none.
+    :rtype:                 str
+    """
+    span = _current_span.get()
+    return span.traceparent if span else None
+
+
+def _get_parent(traceparent=None):
+    """
+    Get the trace and the parent of a new span.
+
+    :param str traceparent: Trace context of the parent span. Can be None.
+
+    :returns:               The trace id and the parent span id, None for a root span.
+    :rtype:                 tuple(str, str)
+    """
+    if not traceparent:
+        span = _current_span.get()
+        if span:
+            return span.trace_id, span.span_id
+        traceparent = os.environ.get(TRACEPARENT_ENV_VAR)
+
+    match = _TRACEPARENT_PATTERN.match(traceparent or "")
+    if match:
+        return match.group(1), match.group(2)
+
+    return uuid.uuid4().hex, None
+
+
+def _get_user_name():
+    """
+    :returns:               Name of the user running the process, None if unknown.
+    :rtype:                 str
+    """
+    try:
+        return getpass.getuser()
+    except Exception:
+        return None
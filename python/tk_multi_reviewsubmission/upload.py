@@ -0,0 +1,192 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import mimetypes
+import os
+import urllib.parse
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+# Size of the parts uploaded to the storage, matching the Shotgun API.
+DEFAULT_PART_SIZE = 20000000
+
+# Storage upload helpers of the Shotgun API this module builds upon.
+_REQUIRED_API_METHODS = (
+    "_requires_direct_s3_upload",
+    "_get_attachment_upload_info",
+    "_get_upload_part_link",
+    "_upload_data_to_storage",
+    "_complete_multipart_upload",
+    "_auth_params",
+    "_send_form",
+)
+
+
+class ShotgunUploadSink(object):
+    """
+    Sink uploading the data written to it to a file field of a Shotgun entity.
+
+    ``Shotgun.upload`` reads the files by itself, and entirely in memory for the
+    smaller ones. This sink instead receives the file from :func:`fan_out`, buffers
+    a single part at a time and sends it to the storage of the site, so the memory
+    used doesn't depend on the size of the file and the file can be copied and
+    hashed from the same read. It requires the site to upload its files directly to
+    its cloud storage, see :meth:`is_supported`.
+    """
+
+    def __init__(
+        self,
+        sg,
+        entity_type,
+        entity_id,
+        path,
+        field_name,
+        file_size=None,
+        part_size=None,
+    ):
+        """
+        :param sg:                  Shotgun API connection.
+        :param str entity_type:     Type of the entity to upload the file to.
+        :param int entity_id:       Id of the entity to upload the file to.
+        :param str path:            Path of the file being uploaded.
+        :param str field_name:      Name of the file field to upload the file to.
+        :param int file_size:       Size of the file, read from the file when None.
+        :param int part_size:       Size of the parts uploaded to the storage.
+        """
+        self._sg = sg
+        self._entity_type = entity_type
+        self._entity_id = entity_id
+        self._field_name = field_name
+        self._file_name = os.path.basename(path)
+        self._content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self._file_size = os.path.getsize(path) if file_size is None else file_size
+        self._part_size = part_size or getattr(
+            sg, "_MULTIPART_UPLOAD_CHUNK_SIZE", DEFAULT_PART_SIZE
+        )
+
+        self._multipart = self._file_size > self._part_size
+        self._upload_info = sg._get_attachment_upload_info(
+            False, self._file_name, self._multipart
+        )
+
+        self._part = bytearray(min(self._part_size, max(self._file_size, 1)))
+        self._part_length = 0
+        self._part_number = 1
+        self._etags = []
+        self._bytes_sent = 0
+
+    @classmethod
+    def is_supported(cls, sg, entity_type, field_name):
+        """
+        Check if files can be streamed to the given field.
+
+        :param sg:                  Shotgun API connection.
+        :param str entity_type:     Type of the entity to upload the file to.
+        :param str field_name:      Name of the file field to upload the file to.
+
+        :returns:               True if the site uploads the field directly to its storage.
+        :rtype:                 bool
+        """
+        if not all(hasattr(sg, method) for method in _REQUIRED_API_METHODS):
+            return False
+        return bool(sg._requires_direct_s3_upload(entity_type, field_name))
+
+    @property
+    def bytes_sent(self):
+        """
+        Number of bytes sent to the storage so far.
+        """
+        return self._bytes_sent
+
+    def write(self, data):
+        """
+        Buffer data and upload the parts as they fill up.
+
+        :param data:            Bytes-like object to upload.
+        """
+        data = memoryview(data)
+        while data:
+            length = min(len(data), len(self._part) - self._part_length)
+            self._part[self._part_length : self._part_length + length] = data[:length]
+            self._part_length += length
+            data = data[length:]
+
+            if self._part_length == len(self._part):
+                self._send_part()
+
+    def close(self):
+        """
+        Upload the last part and attach the uploaded file to the entity.
+
+        :returns:               The result of the attachment request.
+        """
+        if self._part_length or not self._bytes_sent:
+            self._send_part()
+
+        if self._multipart:
+            self._sg._complete_multipart_upload(
+                self._upload_info, self._file_name, self._etags
+            )
+
+        url = urllib.parse.urlunparse(
+            (
+                self._sg.config.scheme,
+                self._sg.config.server,
+                "/upload/api_link_file",
+                None,
+                None,
+                None,
+            )
+        )
+        params = {
+            "entity_type": self._entity_type,
+            "entity_id": self._entity_id,
+            "upload_link_info": self._upload_info["upload_info"],
+            "field_name": self._field_name,
+            "display_name": self._file_name,
+        }
+        params.update(self._sg._auth_params())
+
+        result = self._sg._send_form(url, params)
+        if not str(result).startswith("1"):
+            raise RuntimeError(
+                "Unable to attach %s to %s %s: %s"
+                % (self._file_name, self._entity_type, self._entity_id, result)
+            )
+
+        return result
+
+    def _send_part(self):
+        """
+        Upload the buffered part to the storage.
+        """
+        data = memoryview(self._part)[: self._part_length]
+
+        if self._multipart:
+            url = self._sg._get_upload_part_link(
+                self._upload_info, self._file_name, self._part_number
+            )
+        else:
+            url = self._upload_info["upload_url"]
+
+        etag = self._sg._upload_data_to_storage(
+            data, self._content_type, self._part_length, url
+        )
+        logger.debug(
+            "Uploaded part %d of %s (%d bytes)"
+            % (self._part_number, self._file_name, self._part_length)
+        )
+
+        self._etags.append(etag)
+        self._bytes_sent += self._part_length
+        self._part_number += 1
+        self._part_length = 0
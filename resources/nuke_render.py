@@ -0,0 +1,70 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Render the review media of the tk-nuke render media hook in a Nuke process of its own,
+started with ``nuke -t nuke_render.py <job>``, so the thread count, the cache memory
+and the priority of the render can be controlled.
+
+The job is a JSON file holding the knobs of the root node of the script, the path of
+the copied render groups and the executions to run, each with its frame range, its
+Write nodes and the paths to write them to. The process prints a line for each frame
+rendered by a Write node and for each execution done.
+"""
+
+import json
+import sys
+
+import nuke
+
+# Prefix of the lines reporting a rendered frame, followed by the node and the frame.
+FRAME_PREFIX = "tk-multi-reviewsubmission-frame"
+
+# Prefix of the lines reporting an execution done, followed by its index.
+EXECUTION_PREFIX = "tk-multi-reviewsubmission-execution"
+
+
+def main(job_path):
+    """
+    Run a render job.
+
+    :param str job_path:    Path of the job file.
+    """
+    with open(job_path) as f:
+        job = json.load(f)
+
+    # The colour management and the views of the session script.
+    nuke.root().readKnobs(job["root_knobs"])
+    nuke.nodePaste(job["nodes_path"])
+
+    def report_frame():
+        print("%s %s %d" % (FRAME_PREFIX, nuke.thisNode().fullName(), nuke.frame()))
+        sys.stdout.flush()
+
+    nuke.addAfterFrameRender(report_frame, nodeClass="Write")
+
+    for index, (first_frame, last_frame, node_names, files) in enumerate(
+        job["executions"]
+    ):
+        for node_name, (knob_name, path) in files.items():
+            nuke.toNode(node_name)[knob_name].setValue(path)
+
+        nuke.executeMultiple(
+            [nuke.toNode(node_name) for node_name in node_names],
+            ([first_frame, last_frame, 1],),
+            [job["view"]],
+        )
+
+        print("%s %d" % (EXECUTION_PREFIX, index))
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])